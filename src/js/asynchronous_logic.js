@@ -486,6 +486,12 @@
                 getOutputAccuracy: () => CalcConfig.outputAccuracy,
                 setPrintMode: mode => CalcConfig.globalPrintMode = mode,
                 getPrintMode: () => CalcConfig.globalPrintMode,
+                warmUp: () => {
+                    // 覆盖解析、RPN 求值以及三角、对数、开方、复数幂等常用内核，并触发高精度常数的首次解析
+                    MathPlus.calc('sin(1)+ln(2)+sqrt(3)+2^(0.5[i])');
+                    // 四次函数分析串联了求导、三次与四次求根、霍纳求值和判别式链，是最重的一条纯运算路径，一并预热
+                    PowerFunctionTools.powerFunctionAnalysis(['1', '-2', '-3', '4', '1']);
+                },
                 initEnv: ({calcAcc, outputAcc, printMode}) => {
                     CalcConfig.globalCalcAccuracy = calcAcc;
                     CalcConfig.outputAccuracy = outputAcc;
@@ -642,6 +648,19 @@
             }
         }
 
+        /**
+         * @static
+         * @async
+         * @method warmUp
+         * @description 在页面空闲时让 Worker 预先执行一次小型计算。
+         * Worker 中的高精度常数是按需解析的，BigInt 运算路径也要运行过才会被引擎优化，
+         * 预热后用户的第一次计算不必再承担这部分冷启动开销。
+         * @returns {Promise<void>} 预热完成后解析。
+         */
+        static async warmUp() {
+            await this._dispatch('warmUp');
+        }
+
         /**
          * @static
          * @method cancelWorker
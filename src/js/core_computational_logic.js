@@ -25,11 +25,13 @@
          * @throws {Error} 如果科学记数法中的指数过大。
          */
         constructor(x, {acc, pow = 0} = {}) {
-            const type = Public.typeOf(x);
+            // 最常见的输入（实例与内部数组）先用 instanceof / Array.isArray 识别，
+            // 其余类型再交给 Public.typeOf，避免每次构造都生成并处理类型字符串。
+            const type = x instanceof BigNumber ? 'bignumber' : Array.isArray(x) ? 'array' : Public.typeOf(x);
             switch (type) {
                 case 'array': { // 用于序列化/反序列化的内部表示 `[power, mantissa]` 或 `[power, mantissa, acc]`
                     const len = x.length;
-                    if (![2, 3].includes(len)) {
+                    if (len !== 2 && len !== 3) {
                         throw new Error('[BigNumber] Input error: Array length must be 2 or 3.');
                     }
 
@@ -560,12 +562,16 @@
          * @throws {Error} 如果输入类型或格式不受支持。
          */
         constructor(x, {acc, pow = 0} = {}) {
-            switch (Public.typeOf(x)) {
+            // 与 BigNumber 相同，先识别最常见的实例与数组输入，其余类型再交给 Public.typeOf。
+            const type = x instanceof ComplexNumber ? 'complexnumber' :
+                         x instanceof BigNumber ? 'bignumber' :
+                         Array.isArray(x) ? 'array' : Public.typeOf(x);
+            switch (type) {
                 case 'array': {
                     const len = x.length;
                     // 长度为 2: [real, imag]
                     // 长度为 3: [power, mantissa, acc] (一个 BigNumber 序列化数组。若 acc 小于等于0，则按照默认精度构造)
-                    if (![2, 3].includes(len)) {
+                    if (len !== 2 && len !== 3) {
                         throw new Error('[ComplexNumber] Input error: Array length must be 2 or 3.');
                     }
                     if (len === 2) {
@@ -827,6 +833,60 @@
             throw new Error('[MathPlus] MathPlus is a static class and should not be instantiated.');
         }
 
+        /**
+         * @private
+         * @static
+         * @type {Map<bigint, bigint>}
+         * @description 整数阶乘的 LRU 缓存，键为非负整数 n，值为 n!。
+         * Map 保持插入顺序：命中时重新插入以刷新位置，超出 `CalcConfig.FACTORIAL_CACHE_SIZE` 时淘汰最早的条目。
+         */
+        static _factorialCache = new Map();
+
+        /**
+         * @private
+         * @static
+         * @type {Map<string, [Array<object>, string]>}
+         * @description 表达式编译结果的 LRU 缓存，键为表达式字符串，值为 `[RPN 程序, 格式化后的表达式]`。
+         * 编译结果与 x、精度和自定义函数无关，超出 `CalcConfig.EXPRESSION_CACHE_SIZE` 时淘汰最早的条目。
+         */
+        static _expressionCache = new Map();
+
+        /**
+         * @private
+         * @static
+         * @type {Map<string, ComplexNumber>}
+         * @description `log` 中正整数底数 ln 值的 LRU 缓存，键为 `底数:精度`，值为 ln(底数)。
+         * 以固定小整数为底的对数（如 log(2, x)）常被反复调用，缓存后每次只需计算一次 ln(x)；
+         * 超出 `CalcConfig.LOG_BASE_CACHE_SIZE` 时淘汰最早的条目。
+         */
+        static _logBaseCache = new Map();
+
+        /**
+         * @private
+         * @static
+         * @type {Map<string, string>}
+         * @description 运算符与内部 token 到 MathPlus 方法名的映射表，供 `_compileTokens` 生成 RPN 程序时直接查表。
+         * 表中没有的 token（如 "sin"、"[gamma]"）去掉中括号后即为方法名。
+         */
+        static _symbolMethodNames = new Map([
+            // 二元运算符；显式的 '*' 与隐式的 '&' 都是乘法，'E' 代表科学记数法（例如 3E6）
+            ['+', 'plus'],
+            ['-', 'minus'],
+            ['*', 'times'],
+            ['&', 'times'],
+            ['/', 'divide'],
+            ['^', 'pow'],
+            ['E', 'exponential'],
+            // 一元运算符；'N' 是内部使用的一元负号，'A' 是内部使用的绝对值
+            ['!', 'fact'],
+            ['|', 'abs'],
+            ['N', '_oppositeNumber'],
+            ['A', 'abs'],
+            // 自定义函数
+            ['f', '_customFunc'],
+            ['g', '_customFunc']
+        ]);
+
         /**
          * @private
          * @static
@@ -887,18 +947,65 @@
             })[0];
         }
 
+        /**
+         * @private
+         * @static
+         * @method _compare (内部辅助方法)
+         * @description 比较两个实数的大小，结果与 `MathPlus.minus(a, b).re` 的符号一致。
+         * 先比较符号，再比较数量级，只有数量级相同时才对齐尾数，不构造任何中间的 ComplexNumber 实例。
+         * @param {BigNumber|Array} a - 第一个实数，BigNumber 实例或 `[power, mantissa, acc]` 数组。
+         * @param {BigNumber|Array} b - 第二个实数，BigNumber 实例或 `[power, mantissa, acc]` 数组。
+         * @returns {number} a > b 返回 1，a < b 返回 -1，相等返回 0。
+         */
+        static _compare(a, b) {
+            const powerA = a instanceof BigNumber ? a.power : a[0];
+            const powerB = b instanceof BigNumber ? b.power : b[0];
+            let mantissaA = a instanceof BigNumber ? a.mantissa : a[1];
+            let mantissaB = b instanceof BigNumber ? b.mantissa : b[1];
+
+            // 符号不同（或其中一个为 0）时无需比较数值。
+            const signA = mantissaA > 0n ? 1 : mantissaA < 0n ? -1 : 0;
+            const signB = mantissaB > 0n ? 1 : mantissaB < 0n ? -1 : 0;
+            if (signA !== signB) {
+                return signA > signB ? 1 : -1;
+            }
+            if (signA === 0) {
+                return 0;
+            }
+
+            // 同号时比较绝对值：数量级 = 指数 + 尾数位数。
+            if (signA < 0) {
+                mantissaA = -mantissaA;
+                mantissaB = -mantissaB;
+            }
+            const magnitudeA = powerA + mantissaA.toString().length;
+            const magnitudeB = powerB + mantissaB.toString().length;
+            if (magnitudeA !== magnitudeB) {
+                return magnitudeA > magnitudeB ? signA : -signA;
+            }
+            if (powerA > powerB) {
+                mantissaA *= 10n ** BigInt(powerA - powerB);
+            } else if (powerB > powerA) {
+                mantissaB *= 10n ** BigInt(powerB - powerA);
+            }
+            return mantissaA === mantissaB ? 0 : mantissaA > mantissaB ? signA : -signA;
+        }
+
         /**
          * @private
          * @static
          * @method _toLessThanHalfPi (内部辅助方法)
          * @description 在 `MathPlus` 三角函数底层实现中，负责执行“角度归约” (Range Reduction) 关键步骤。
          * 为了确保泰勒级数展开的高效收敛和数值精度，此方法将任意范围的输入角度（包括负数和大角度）映射到最优计算区间 [0, pi/2] 内。
-         * 它利用三角函数的周期性和对称性诱导公式，在高精度模式下完成映射，并根据函数类型（sin 或 cos）精确追踪并计算归约过程产生的符号变化。
+         * 它利用三角函数的周期性和对称性诱导公式，在高精度模式下完成映射，并根据函数类型（sin、cos 或 tan）精确追踪并计算归约过程产生的符号变化。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} angle - 需要进行归约的原始角度值（将被转换为实部处理）。
-         * @param {'sin'|'cos'} name - 当前计算的三角函数名称。此参数决定了象限映射时的符号变换逻辑（例如 `sin(-x)` 需变号，而 `cos(-x)` 不变）。
-         * @returns {[BigNumber, bigint]} 返回一个包含两个元素的数组：
+         * @param {'sin'|'cos'|'tan'|'sincos'} name - 当前计算的三角函数名称。此参数决定了象限映射时的符号变换逻辑（例如 `sin(-x)` 需变号，而 `cos(-x)` 不变）。
+         * 映射只改变 sin、cos 的符号而不改变其绝对值，因此 tan 的符号修正因子即为两者之积；
+         * 'sincos' 供同时需要 sin 与 cos 的调用方使用，分别返回两者的符号修正因子。
+         * @returns {[BigNumber, bigint]|[BigNumber, bigint, bigint]} 返回一个数组：
          * 1. 归约到 [0, pi/2] 区间后的高精度角度值（内部数据结构）。
          * 2. 符号修正因子 (`1n` 或 `-1n`)，用于在最终计算结果上叠加正确的正负号。
+         * 3. 仅当 name 为 'sincos' 时存在：此时第 2 项为 sin 的符号修正因子，第 3 项为 cos 的符号修正因子。
          * @throws {Error} 如果输入角度的绝对值过大（如超过 440 弧度），导致现有精度下无法保证取模结果的准确性时，抛出异常（或打印警告）。
          */
         static _toLessThanHalfPi(angle, name) {
@@ -906,22 +1013,31 @@
             angle = new ComplexNumber(angle).re;
             const acc = angle.acc;
 
-            const typeFactor = name === 'sin' ? 1n : -1n;
-            let changeSign = 1n; // -1 为变号，1 为不变号
+            // 分别追踪 sin 与 cos 的符号，-1 为变号，1 为不变号
+            let sinSign = 1n;
+            let cosSign = 1n;
+            const getResult = () => name === 'sincos'
+                ? [angle, sinSign, cosSign]
+                : [angle, name === 'sin' ? sinSign : name === 'cos' ? cosSign : sinSign * cosSign];
 
             // 将 re 映射到 [0, 2π) 区间，并记录符号
             if (angle.isNegative()) {
                 angle = MathPlus._oppositeNumber(angle);
 
-                // sin(-x) = -sin(x) -> 变号 (1 * -1)
-                // cos(-x) =  cos(x) -> 不变 (-1 * -1 = 1)
-                changeSign = -typeFactor;
+                // sin(-x) = -sin(x) -> 变号
+                // cos(-x) =  cos(x) -> 不变
+                sinSign = -1n;
+            }
+
+            // 快速路径：角度已位于 [0, 1.5) ⊂ [0, π/2) 内时无需任何映射，跳过下方的高精度取模。
+            if (MathPlus._compare(angle, [-1, 15n, acc]) < 0) {
+                return getResult();
             }
 
             // 利用周期性，将 re 映射到 [0, 2π) 区间，并使用高精度防止精度损失。
             const highPrecisionAcc = -CalcConfig.constants.invTwoPi[0];
-            if (!MathPlus.minus(angle, [highPrecisionAcc >> 1, 1n, acc]).re.isNegative()) {
-                if (!MathPlus.minus(angle, [highPrecisionAcc, 1n, acc]).re.isNegative()) {
+            if (MathPlus._compare(angle, [highPrecisionAcc >> 1, 1n, acc]) >= 0) {
+                if (MathPlus._compare(angle, [highPrecisionAcc, 1n, acc]) >= 0) {
                     throw new Error(`[MathPlus] Input value (${angle.toString()}) is too large.`);
                 }
                 console.warn('[MathPlus] Unexpected loss of precision occurred in trigonometric calculations.');
@@ -931,33 +1047,182 @@
             angle = MathPlus.minus(highPrecisionRe, MathPlus.divide(n, CalcConfig.constants.invTwoPi)).re;
 
             // 利用 cos(x) = cos(2π - x)，将 re 从 (π, 2π) 映射到 (0, π)
-            if (MathPlus.minus(angle, CalcConfig.constants.pi).re.isPositive()) {
-                angle = MathPlus.minus(
-                    MathPlus.times([0, 2n, acc], CalcConfig.constants.pi),
-                    angle
-                ).re;
+            if (MathPlus._compare(angle, CalcConfig.constants.pi) > 0) {
+                angle = MathPlus.minus(CalcConfig.constants.twoPi, angle).re;
 
                 // sin(2π - x) = -sin(x) -> 变号
                 // cos(2π - x) =  cos(x) -> 不变
-                // 逻辑推导：
-                // if sin (1):  -1 * 1 * current = -current (变)
-                // if cos (-1): -1 * -1 * current = current (不变)
-                changeSign = -typeFactor * changeSign;
+                sinSign = -sinSign;
             }
 
             // 利用 cos(x) = -cos(π - x)，将 re 从 [π/2, π] 映射到 [0, π/2]
-            if (!MathPlus.minus(MathPlus.times(angle, [0, 2n, acc]), CalcConfig.constants.pi).re.isNegative()) {
+            if (MathPlus._compare(angle, CalcConfig.constants.halfPi) >= 0) {
                 angle = MathPlus.minus(CalcConfig.constants.pi, angle).re;
 
                 // sin(π - x) = sin(x)  -> 不变
                 // cos(π - x) = -cos(x) -> 变号
-                // 逻辑推导：
-                // if sin (1):  1 * current = current (不变)
-                // if cos (-1): -1 * current = -current (变)
-                changeSign = typeFactor * changeSign;
+                cosSign = -cosSign;
             }
 
-            return [angle, changeSign];
+            return getResult();
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _toFixedPoint
+         * @description 将 mantissa * 10^power 转换为放大 10^scale 倍的 BigInt 定点数，低于最小单位的部分直接截断。
+         * 供各初等函数的级数内核在纯 BigInt 上完成迭代，避免每一项都构造中间的 ComplexNumber 实例。
+         * @param {bigint} mantissa - 尾数。
+         * @param {number} power - 10 的指数。
+         * @param {number} scale - 定点数的小数位数。
+         * @returns {bigint} 定点表示 trunc(mantissa * 10^(power + scale))。
+         */
+        static _toFixedPoint(mantissa, power, scale) {
+            const exponent = power + scale;
+            if (exponent >= 0) {
+                return mantissa * 10n ** BigInt(exponent);
+            }
+            // 数量级低于最小单位时直接返回 0，避免构造巨大的除数。
+            if (-exponent > (mantissa < 0n ? -mantissa : mantissa).toString().length) {
+                return 0n;
+            }
+            return mantissa / 10n ** BigInt(-exponent);
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _trigSeriesHorner
+         * @description 以 Horner 形式计算 sin/cos 泰勒级数中关于 x² 的多项式部分。
+         * - sin(x) = x * (1 - x²/(2*3) * (1 - x²/(4*5) * (1 - ...)))，对应 offset = 1。
+         * - cos(x) = 1 - x²/(1*2) * (1 - x²/(3*4) * (1 - ...))，对应 offset = 0。
+         * - 嵌套求值在放大 10^(acc+10) 倍的 BigInt 定点数上完成，每一项不再构造中间的 ComplexNumber 实例；
+         *   符号由嵌套结构自然产生，无需交替加减。
+         * @param {BigNumber} x - 已完成范围缩减的自变量（|x| < 0.1）。
+         * @param {0|1} offset - 级数类型：0 表示 cos，1 表示 sin。
+         * @param {number} max - 允许的最大项数。
+         * @returns {ComplexNumber|null} 多项式部分的值（cos 即为结果，sin 还需乘以 x）；若 max 项内未收敛则返回 null。
+         */
+        static _trigSeriesHorner(x, offset, max) {
+            const acc = x.acc;
+            const scale = acc + 10; // 额外的保护位，吸收定点截断误差
+            const unit = 10n ** BigInt(scale);
+
+            // 将 x² 转换为定点数 x² * 10^scale，低于最小单位的部分直接截断。
+            const square = MathPlus._toFixedPoint(x.mantissa * x.mantissa, 2 * x.power, scale);
+
+            // 确定所需项数：当某一项在定点表示下截断为 0 时停止。
+            const denominators = [];
+            let term = unit;
+            for (let i = 1; ; i++) {
+                if (i > max) {
+                    return null;
+                }
+                const denominator = BigInt((2 * i - 1 + offset) * (2 * i + offset));
+                term = term * square / (unit * denominator);
+                if (term === 0n) {
+                    break;
+                }
+                denominators.push(denominator);
+            }
+
+            // 由内向外嵌套求值: s = 1 - s * x² / ((2i-1+offset)(2i+offset))
+            let result = unit;
+            for (let i = denominators.length - 1; i >= 0; i--) {
+                result = unit - result * square / (unit * denominators[i]);
+            }
+            return new ComplexNumber(result, {pow: -scale, acc: acc});
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _expSeriesHorner
+         * @description 以 Horner 形式计算 e^x 的泰勒级数 e^x = 1 + x * (1 + x/2 * (1 + x/3 * (1 + ...)))。
+         * - 嵌套求值在放大 10^(acc+10) 倍的 BigInt 定点数上完成，适用于已完成范围缩减的小量 x。
+         * @param {BigNumber} x - 已完成范围缩减的自变量（|x| < 0.1）。
+         * @param {number} max - 允许的最大项数。
+         * @returns {ComplexNumber|null} e^x 的值；若 max 项内未收敛则返回 null。
+         */
+        static _expSeriesHorner(x, max) {
+            const acc = x.acc;
+            const scale = acc + 10; // 额外的保护位，吸收定点截断误差
+            const unit = 10n ** BigInt(scale);
+            const value = MathPlus._toFixedPoint(x.mantissa, x.power, scale);
+
+            // 确定所需项数：当某一项在定点表示下截断为 0 时停止。
+            let n = 0;
+            for (let term = value; term !== 0n; term = term * value / (unit * BigInt(n + 1))) {
+                if (++n > max) {
+                    return null;
+                }
+            }
+
+            // 由内向外嵌套求值: s = 1 + s * x / i
+            let result = unit;
+            for (let i = n; i > 0; i--) {
+                result = unit + result * value / (unit * BigInt(i));
+            }
+            return new ComplexNumber(result, {pow: -scale, acc: acc});
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _artanhSeriesHorner
+         * @description 以 Horner 形式计算 artanh(x) = x * (1 + x²/3 + x⁴/5 + ...) 的泰勒级数。
+         * - 嵌套求值在放大 10^(acc+10) 倍的 BigInt 定点数上完成，系数 1/(2i+1) 直接以定点整数表示。
+         * @param {BigNumber} x - 已完成范围缩减的自变量（|x| < 0.1）。
+         * @param {number} max - 允许的最大项数。
+         * @returns {ComplexNumber|null} artanh(x) 的值；若 max 项内未收敛则返回 null。
+         */
+        static _artanhSeriesHorner(x, max) {
+            const acc = x.acc;
+            const scale = acc + 10; // 额外的保护位，吸收定点截断误差
+            const unit = 10n ** BigInt(scale);
+            const value = MathPlus._toFixedPoint(x.mantissa, x.power, scale);
+            const square = value * value / unit;
+
+            // 确定所需项数：当 x^(2n+1) 在定点表示下截断为 0 时停止。
+            let n = 0;
+            for (let term = value * square / unit; term !== 0n; term = term * square / unit) {
+                if (++n > max) {
+                    return null;
+                }
+            }
+
+            // 由内向外嵌套求值: s = 1/(2i+1) + s * x²
+            let result = unit / BigInt(2 * n + 1);
+            for (let i = n - 1; i >= 0; i--) {
+                result = unit / BigInt(2 * i + 1) + result * square / unit;
+            }
+            return new ComplexNumber(result * value, {pow: -2 * scale, acc: acc});
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _lanczosSeriesFixed
+         * @description 计算兰佐斯近似中的级数部分 A(z) = p₀ + p₁/(z+1) + p₂/(z+2) + ...（z 为非负实数）。
+         * - 系数 pᵢ 正负交替，求和在放大 10^(acc+10) 倍的 BigInt 定点数上完成，分母 z+i 由递推逐项加一得到，
+         *   避免每一项都构造整数 i 并执行一次高精度加法与除法。
+         * @param {BigNumber} z - 非负实数自变量。
+         * @param {Array} p - 兰佐斯系数 [power, mantissa, acc] 元组数组。
+         * @returns {ComplexNumber} A(z) 的值。
+         */
+        static _lanczosSeriesFixed(z, p) {
+            const acc = z.acc;
+            const scale = acc + 10; // 额外的保护位，吸收定点截断误差
+            const unit = 10n ** BigInt(scale);
+
+            let denominator = MathPlus._toFixedPoint(z.mantissa, z.power, scale);
+            let result = MathPlus._toFixedPoint(p[0][1], p[0][0], scale);
+            for (let i = 1; i < p.length; i++) {
+                denominator += unit;
+                result += MathPlus._toFixedPoint(p[i][1], p[i][0], 2 * scale) / denominator;
+            }
+            return new ComplexNumber(result, {pow: -scale, acc: acc});
         }
 
         /**
@@ -1046,10 +1311,8 @@
                 // 如果是纯虚数:
                 // - 虚部为正 (例如, 2i), 辐角为 π/2。
                 // - 虚部为负 (例如, -2i), 辐角为 -π/2。
-                return MathPlus.divide(
-                    CalcConfig.constants.pi,
-                    [0, input.im.isNegative() ? -2n : 2n, acc]
-                );
+                const halfPi = new ComplexNumber(CalcConfig.constants.halfPi, {acc: acc});
+                return input.im.isNegative() ? MathPlus._oppositeNumber(halfPi) : halfPi;
             }
             // --- 情况 2: 输入为纯实数 (且实部不为 0) ---
             if (input.onlyReal) {
@@ -1058,6 +1321,18 @@
                 return input.re.isPositive() ? zero : new ComplexNumber(CalcConfig.constants.pi, {acc: acc});
             }
             // --- 情况 3: 一般复数 (实部和虚部均不为 0) ---
+            // 与 atan2 相同的做法：总是用较小的分量除以较大的分量，使 arctan 的参数落在 [-1, 1] 内，
+            // 这样 arctan 内部不必再做一次 1/x 的范围缩减。
+            const absRe = input.re.isNegative() ? MathPlus._oppositeNumber(input.re) : input.re;
+            const absIm = input.im.isNegative() ? MathPlus._oppositeNumber(input.im) : input.im;
+            if (MathPlus._compare(absIm, absRe) > 0) {
+                // |虚部| > |实部|: 辐角 = ±π/2 - arctan(实部/虚部)，正负号与虚部相同。
+                const halfPi = new ComplexNumber(CalcConfig.constants.halfPi, {acc: acc});
+                return MathPlus.minus(
+                    input.im.isNegative() ? MathPlus._oppositeNumber(halfPi) : halfPi,
+                    MathPlus.arctan(MathPlus.divide(input.re, input.im))
+                );
+            }
             // 核心思想是使用 arctan(虚部/实部) 来计算，但需要根据象限进行调整。
             const result = MathPlus.arctan(MathPlus.divide(input.im, input.re));
 
@@ -1114,6 +1389,33 @@
             const inputA = new ComplexNumber(a);
             const inputB = new ComplexNumber(b);
             const acc = Math.min(inputA.acc, inputB.acc);
+
+            // 实数辐角：sin 与 cos 共用一次范围缩减，直接得到 r*cos(θ) 与 r*sin(θ)，
+            // 不再分别归约两次，也不再经由复数加法与乘法组装 cos(θ) + i*sin(θ)。
+            if (inputB.onlyReal) {
+                let [re, sinSign, cosSign] = MathPlus._toLessThanHalfPi(inputB.re, 'sincos');
+                // 大角度取模在更高精度下完成，归约后回到输入精度，避免 sin、cos 按取模精度计算。
+                re = new BigNumber(re, {acc: inputB.acc});
+
+                // 与 tan 相同，r 接近 π/2 时改用余角，使 sin、cos 的自变量都落在免于再次范围缩减的快速路径内。
+                const complement = MathPlus._compare(re, [-2, 78n, inputB.acc]) >= 0;
+                if (complement) {
+                    re = MathPlus.minus(CalcConfig.constants.halfPi, re).re;
+                }
+                const sinRe = MathPlus.sin(re);
+                const cosRe = MathPlus.cos(re);
+                const cosTheta = complement ? sinRe : cosRe;
+                const sinTheta = complement ? cosRe : sinRe;
+                const x = MathPlus.times(inputA, cosSign === 1n ? cosTheta : MathPlus._oppositeNumber(cosTheta));
+                const y = MathPlus.times(inputA, sinSign === 1n ? sinTheta : MathPlus._oppositeNumber(sinTheta));
+
+                // r * (cos(θ) + i*sin(θ)) = (x.re - y.im) + (x.im + y.re)i，模长为实数时 x.im 与 y.im 均为 0。
+                if (inputA.onlyReal) {
+                    return new ComplexNumber([x.re, y.re], {acc: acc});
+                }
+                return new ComplexNumber(MathPlus.plus(x, [MathPlus._oppositeNumber(y.im), y.re]), {acc: acc});
+            }
+
             const cosTheta = MathPlus.cos(inputB);
             const sinTheta = MathPlus.sin(inputB);
             // 构造复数 (cos(θ) + i*sin(θ))
@@ -1353,16 +1655,24 @@
 
             // 2. 计算分母：inputB * conj(inputB) = |inputB|^2
             // 结果是一个纯实数 (虚部为零)。
-            const denominator = MathPlus.times(inputB, conjB);
+            const denominator = MathPlus.times(inputB, conjB).re;
 
             // 3. 将分子的实部和虚部分别除以分母（一个实数）。
-            // 这里的递归调用将进入上面的纯实数除法优化路径。
-            const resultRe = MathPlus.divide(numerator.re, denominator.re);
-            const resultIm = MathPlus.divide(numerator.im, denominator.re);
+            // 两者的除数相同，因此只做一次 BigInt 除法求出定点倒数 10^scale / |b|^2，再分别与分子的实部、虚部相乘。
+            // 倒数比结果多保留 10 位保护位，舍入到目标精度后与直接相除的结果一致。
+            if (denominator.isZero()) {
+                throw new Error('[MathPlus] mathematical error: Division by zero.');
+            }
+            const resultAcc = Math.min(Math.max(numerator.re.acc, numerator.im.acc), denominator.acc);
+            const scale = resultAcc + denominator.mantissa.toString().length + 10;
+            const inverse = (10n ** BigInt(scale)) / denominator.mantissa;
+            const quotient = (part) => new ComplexNumber(part.mantissa * inverse, {
+                pow: part.power - denominator.power - scale,
+                acc: Math.min(part.acc, denominator.acc)
+            }).re;
 
-            // 4. 组合结果。resultRe 和 resultIm 是纯实数的 ComplexNumber，
-            // 因此我们需要提取它们的实部 (.re) 来构造最终的复数。
-            return new ComplexNumber([resultRe.re, resultIm.re]);
+            // 4. 组合结果。
+            return new ComplexNumber([quotient(numerator.re), quotient(numerator.im)]);
         }
 
         /**
@@ -1725,19 +2035,13 @@
                     const mid = Public.integerCorrect(
                         MathPlus.divide([0, 1n, resultAcc], absB)
                     ).re;
-                    if (mid.power === 0 && mid.mantissa % 2n !== 0n) {
+                    // 先比较指数再取尾数的最低位，奇偶判断不需要 BigInt 取模
+                    if (mid.power === 0 && (mid.mantissa & 1n) === 1n) {
                         // 有实数解
                         result = MathPlus._oppositeNumber(result);
                     } else {
-                        // 无实数解，返回辐角为 0 的结果
-                        const angle = MathPlus.times(absB, CalcConfig.constants.pi);
-                        const cosAngle = MathPlus.cos(angle);
-                        const sinAngle = MathPlus.sin(angle);
-
-                        result = new ComplexNumber([
-                            MathPlus.times(result, cosAngle).re,
-                            MathPlus.times(result, sinAngle).re
-                        ]);
+                        // 无实数解，返回模为 |a|^b、辐角为 bπ 的结果
+                        result = MathPlus.toPolar(result, MathPlus.times(absB, CalcConfig.constants.pi));
                     }
                 }
 
@@ -1751,15 +2055,64 @@
             // --- 分支 2: 底数是复数, 指数是纯实数 ---
             // z^b = |z|^b * (cos(b*arg(z)) + i*sin(b*arg(z)))
             if (inputB.onlyReal) {
-                const module = MathPlus.pow(MathPlus.abs(inputA), inputB);
-                const angle = MathPlus.times(inputB, MathPlus.arg(inputA));
-                const cosAngle = MathPlus.cos(angle);
-                const sinAngle = MathPlus.sin(angle);
+                // --- 路径 2.1: 指数 b 是非零整数 ---
+                // 将 z 对齐到公共指数 z = (x + yi) * 10^p，在高斯整数上做快速幂，
+                // 结果精确且不需要计算 abs、arg 与三角函数。
+                const reB = inputB.re;
+                if (reB.power >= 0 && reB.mantissa !== 0n) {
+                    const exponent = (reB.isNegative() ? -reB.mantissa : reB.mantissa) * (10n ** BigInt(reB.power));
+                    const {re, im} = inputA;
+                    const commonPower = Math.min(re.power, im.power);
+                    let x = re.mantissa * (10n ** BigInt(re.power - commonPower));
+                    let y = im.mantissa * (10n ** BigInt(im.power - commonPower));
+
+                    // 溢出检查：|x + yi| <= |x| + |y|，位数过多时退回到棣莫弗公式。
+                    const bound = (x < 0n ? -x : x) + (y < 0n ? -y : y);
+                    const orderOfMagnitude = estimateDigitCount(bound, exponent);
+                    if (orderOfMagnitude < Number.MAX_SAFE_INTEGER) {
+                        const resultPower = commonPower * Number(exponent);
+                        let result;
+                        if (orderOfMagnitude < CalcConfig.CRITICAL_MAGNITUDE_FAST_EXP) {
+                            let resultRe = 1n;
+                            let resultIm = 0n;
+                            for (let e = exponent; e > 0n; e >>= 1n) {
+                                if ((e & 1n) === 1n) {
+                                    [resultRe, resultIm] = [resultRe * x - resultIm * y, resultRe * y + resultIm * x];
+                                }
+                                if (e > 1n) {
+                                    [x, y] = [x * x - y * y, 2n * x * y];
+                                }
+                            }
+                            result = new ComplexNumber([
+                                new ComplexNumber(resultRe, {pow: resultPower, acc: resultAcc}).re,
+                                new ComplexNumber(resultIm, {pow: resultPower, acc: resultAcc}).re
+                            ]);
+                        } else {
+                            // 精确结果位数过多时与实数路径相同，改用按精度舍入的快速幂，
+                            // 仍然只需 O(log b) 次复数乘法，而棣莫弗公式需要 abs、arg 与三角函数。
+                            const {re: mantissaRe, im: mantissaIm} = fastPow(new ComplexNumber([x, y], {acc: CalcConfig.globalCalcAccuracy + 10}), exponent);
+                            result = new ComplexNumber([
+                                new ComplexNumber(mantissaRe.mantissa, {pow: mantissaRe.power + resultPower, acc: resultAcc}).re,
+                                new ComplexNumber(mantissaIm.mantissa, {pow: mantissaIm.power + resultPower, acc: resultAcc}).re
+                            ]);
+                        }
 
-                return new ComplexNumber([
-                    MathPlus.times(module, cosAngle).re,
-                    MathPlus.times(module, sinAngle).re
-                ]);
+                        // 如果指数是负数，最终结果是 1 / result
+                        if (reB.isNegative()) {
+                            result = MathPlus.divide([0, 1n, resultAcc], result);
+                        }
+                        return result;
+                    }
+                }
+
+                // |z|^b = (x² + y²)^(b/2)：直接对模的平方求幂，省去 abs 中的一次开方。
+                const {re, im} = inputA;
+                const module = MathPlus.pow(
+                    MathPlus.plus(MathPlus.times(re, re), MathPlus.times(im, im)),
+                    MathPlus.times(inputB, [-1, 5n, inputB.re.acc])
+                );
+                const angle = MathPlus.times(inputB, MathPlus.arg(inputA));
+                return MathPlus.toPolar(module, angle);
             }
 
             // --- 分支 3: 通用情况 (通常是复数指数) ---
@@ -1768,27 +2121,8 @@
             // ln(a) = ln(r) + iθ
             // b*ln(a) = (c+di)(ln(r)+iθ) = (c*ln(r) - dθ) + i(d*ln(r) + cθ)
             // a^b = exp(c*ln(r) - dθ) * exp(i(d*ln(r) + cθ))
-            const c = inputB.re;
-            const d = inputB.im;
-            const r = MathPlus.abs(inputA);
-            const angle = MathPlus.arg(inputA);
-            const resultAngle = MathPlus.plus(
-                MathPlus.times(d, MathPlus.ln(r)),
-                MathPlus.times(c, angle)
-            );
-            const module = MathPlus.times(
-                MathPlus.pow(r, c),
-                MathPlus.exp(
-                    MathPlus._oppositeNumber(MathPlus.times(d, angle))
-                )
-            );
-            const cosAngle = MathPlus.cos(resultAngle);
-            const sinAngle = MathPlus.sin(resultAngle);
-
-            return new ComplexNumber([
-                MathPlus.times(module, cosAngle).re,
-                MathPlus.times(module, sinAngle).re
-            ]);
+            // 复数 ln(a) 一次给出 ln(r) 与 θ，复数 exp 由一次实数 exp 与 toPolar 完成。
+            return MathPlus.exp(MathPlus.times(inputB, MathPlus.ln(inputA)));
         }
 
         /**
@@ -1850,41 +2184,35 @@
                 const lowAccuracyRe = new BigNumber(absInput, {acc: 15});
                 const numberRe = Number(lowAccuracyRe.mantissa) * (10 ** lowAccuracyRe.power);
 
-                // 防止出现无限值导致出错
-                if (!Number.isFinite(numberRe)) {
+                // 防止出现无限值（或下溢为 0）导致出错
+                if (!Number.isFinite(numberRe) || numberRe === 0) {
                     useAlternative = true;
                 }
 
                 if (!useAlternative) {
-                    result = new ComplexNumber(Math.sqrt(numberRe), {acc: acc});
+                    // 以双精度 Math.sqrt 的结果作为初值（约 15 位有效数字）。
+                    result = new ComplexNumber(Math.sqrt(numberRe), {acc: 15});
 
                     // 步骤 2: 进行迭代
-                    let i = 0;
-                    const max = CalcConfig.globalCalcAccuracy + 5; // 设置最大迭代次数
-                    const minPower = -2 * acc - 1; // 收敛阈值
-                    const const_2 = new ComplexNumber([0, 2n, acc]);
-                    let difference, mid;
-
-                    do {
-                        // 执行一次牛顿法迭代
-                        mid = result;
+                    // 牛顿迭代二次收敛，每轮有效位数翻倍，因此计算精度也逐轮加倍，
+                    // 只有最后一轮以目标精度（另加 5 位保护位）计算。
+                    const finalAcc = acc + 5;
+                    const const_2 = new ComplexNumber([0, 2n, finalAcc]);
+                    for (let stepAcc = 30; ; stepAcc *= 2) {
+                        const currentAcc = Math.min(stepAcc, finalAcc);
+                        const mid = new ComplexNumber(result, {acc: currentAcc});
                         result = MathPlus.divide(
-                            MathPlus.plus(mid, MathPlus.divide(absInput, mid)),
+                            MathPlus.plus(mid, MathPlus.divide(new ComplexNumber(absInput, {acc: currentAcc}), mid)),
                             const_2
                         );
-
-                        // 计算新旧结果之差的绝对值，用于判断是否收敛
-                        difference = MathPlus.minus(mid, result).re;
-                        i++;
-                    } while (difference.power > minPower && !difference.isZero() && i < max);
-
-                    if (i === max) {
-                        console.warn(`[MathPlus] Square root (${x.toString()}) calculation takes too long.`);
-                        useAlternative = true;
+                        if (currentAcc === finalAcc) {
+                            break;
+                        }
                     }
+                    result = new ComplexNumber(result, {acc: acc});
                 }
 
-                // 步骤 3: 如果牛顿法收敛过慢，则使用 ln/exp 方法作为备用。
+                // 步骤 3: 如果无法以双精度生成初值（超出 Number 范围），则使用 ln/exp 方法作为备用。
                 // 公式: √x = x^0.5 = e^(0.5 * ln(x))
                 if (useAlternative) {
                     result = MathPlus.exp(
@@ -1901,7 +2229,24 @@
             }
 
             // --- 路径 2: 输入为复数 ---
-            return MathPlus.pow(input, [-1, 5n, acc]);
+            // 使用半角公式直接求主值，只需实数开方，避免 pow 中的辐角（反正切）与三角函数计算。
+            // 令 z = a + bi，t = √((|z| + |a|) / 2)：
+            // - a ≥ 0 时，√z = t + i * b / (2t)
+            // - a < 0 时，√z = |b| / (2t) + i * sgn(b) * t
+            // 两个分支中 |z| 与 |a| 同号相加，不会出现相近数相减造成的精度损失。
+            const re = input.re;
+            const im = input.im;
+            const const_2 = [0, 2n, acc];
+            const absRe = re.isNegative() ? MathPlus._oppositeNumber(re) : re;
+            const t = MathPlus.sqrt(MathPlus.divide(MathPlus.plus(MathPlus.abs(input), absRe), const_2)).re;
+            const other = MathPlus.divide(im, MathPlus.times(t, const_2)).re;
+            if (!re.isNegative()) {
+                return new ComplexNumber([t, other]);
+            }
+            return new ComplexNumber([
+                other.isNegative() ? MathPlus._oppositeNumber(other) : other,
+                im.isNegative() ? MathPlus._oppositeNumber(t) : t
+            ]);
         }
 
         /**
@@ -1947,47 +2292,41 @@
                 const lowAccuracyRe = new BigNumber(re, {acc: 15});
                 const numberRe = Number(lowAccuracyRe.mantissa) * (10 ** lowAccuracyRe.power);
 
-                // 防止出现无限值导致出错
-                if (!Number.isFinite(numberRe)) {
+                // 防止出现无限值（或下溢为 0）导致出错
+                if (!Number.isFinite(numberRe) || numberRe === 0) {
                     useAlternative = true;
                 }
 
                 if (!useAlternative) {
-                    result = new ComplexNumber(Math.cbrt(numberRe), {acc: acc});
+                    // 以双精度 Math.cbrt 的结果作为初值（约 15 位有效数字）。
+                    result = new ComplexNumber(Math.cbrt(numberRe), {acc: 15});
 
                     // 步骤 2: 进行迭代
                     // 采用牛顿迭代法的立方根特化公式
                     // x_(n+1) = (2x_n + x / x_n^2) / 3
-                    let i = 0;
-                    const max = CalcConfig.globalCalcAccuracy + 5; // 设置最大迭代次数
-                    const minPower = -2 * acc - 1; // 收敛阈值
-                    const const_2 = new ComplexNumber([0, 2n, acc]);
-                    const const_3 = new ComplexNumber([0, 3n, acc]);
-                    let difference, mid;
-
-                    do {
-                        mid = result;
+                    // 与平方根相同，计算精度逐轮加倍，只有最后一轮以目标精度（另加 5 位保护位）计算。
+                    const finalAcc = acc + 5;
+                    const const_2 = new ComplexNumber([0, 2n, finalAcc]);
+                    const const_3 = new ComplexNumber([0, 3n, finalAcc]);
+                    for (let stepAcc = 30; ; stepAcc *= 2) {
+                        const currentAcc = Math.min(stepAcc, finalAcc);
+                        const mid = new ComplexNumber(result, {acc: currentAcc});
                         const squareOfMid = MathPlus.times(mid, mid);
                         result = MathPlus.divide(
                             MathPlus.plus(
                                 MathPlus.times(mid, const_2),
-                                MathPlus.divide(re, squareOfMid)
+                                MathPlus.divide(new ComplexNumber(re, {acc: currentAcc}), squareOfMid)
                             ),
                             const_3
                         );
-
-                        // 计算新旧结果之差的绝对值，用于判断是否收敛
-                        difference = MathPlus.minus(mid, result).re;
-                        i++;
-                    } while (difference.power > minPower && !difference.isZero() && i < max);
-
-                    if (i === max) {
-                        console.warn(`[MathPlus] Cube root (${x.toString()}) calculation takes too long.`);
-                        useAlternative = true;
+                        if (currentAcc === finalAcc) {
+                            break;
+                        }
                     }
+                    result = new ComplexNumber(result, {acc: acc});
                 }
 
-                // 步骤 3: 如果迭代法收敛过慢，则使用 pow(x, 1/3) 作为备用方法。
+                // 步骤 3: 如果无法以双精度生成初值（超出 Number 范围），则使用 pow(x, 1/3) 作为备用方法。
                 if (useAlternative) {
                     return MathPlus.pow(re, MathPlus.divide([0, 1n, acc], [0, 3n, acc]));
                 }
@@ -2007,6 +2346,8 @@
          * @description 计算 a 的 b 次方根 (ᵇ√a)。
          * - 该方法通过计算 a 的 1/b 次方来实现，即 `a^(1/b)`。
          * - 它能够自动处理实数和复数作为底数和根指数。
+         * - 根指数为整数时，1/b 的分母就是 b：b 为 2、3 时直接调用 `sqrt`、`cbrt`；负实数开奇数次方时直接取实根，
+         *   无需由 `pow` 从近似的 1/b 反推其是否为奇数分之一。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} a - 被开方数（radicand）。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} b - 根指数（index）。
          * @returns {ComplexNumber} 代表 a 的 b 次方根主值的结果。
@@ -2023,6 +2364,22 @@
             const inputB = new ComplexNumber(b);
             // 确定运算精度，取两个输入中较低的精度
             const acc = Math.min(inputA.acc, inputB.acc);
+            // 根指数为整数时直接判断，无需经过 1/b 的近似值
+            const reB = inputB.re;
+            if (inputB.onlyReal && reB.power >= 0 && !reB.isZero()) {
+                const radicand = new ComplexNumber(inputA, {acc: acc});
+                if (reB.power === 0 && reB.mantissa === 2n) {
+                    return MathPlus.sqrt(radicand);
+                }
+                if (reB.power === 0 && reB.mantissa === 3n) {
+                    return MathPlus.cbrt(radicand);
+                }
+                // 负实数的奇数次方根: ᵇ√a = -ᵇ√(-a)
+                if (reB.power === 0 && (reB.mantissa & 1n) === 1n && radicand.onlyReal && radicand.re.isNegative()) {
+                    const oneOverB = MathPlus.divide([0, 1n, acc], inputB);
+                    return MathPlus._oppositeNumber(MathPlus.pow(MathPlus._oppositeNumber(radicand), oneOverB));
+                }
+            }
             // 计算指数 1/b
             const oneOverB = MathPlus.divide([0, 1n, acc], inputB);
             // 计算 a 的 (1/b) 次方
@@ -2079,33 +2436,13 @@
                 // 注意: 这里将数字缩小 10 倍以更快收敛。
                 const iteration = new ComplexNumber([re.power - 1, iterationMantissa, acc]);
 
-                // --- 使用泰勒级数计算 e^f ---
-                // e^f = 1 + f + f^2/2! + f^3/3! + ...
-
-                // 设置最大迭代次数以防止无限循环。
+                // --- 使用泰勒级数计算 e^f (Horner 形式) ---
+                // e^f = 1 + f * (1 + f/2 * (1 + f/3 * (1 + ...)))，在 BigInt 定点数上由内向外嵌套求值。
                 const max = CalcConfig.globalCalcAccuracy + 5;
-                // 设置一个极小的量级，当项小于此值时，视为收敛。
-                const minPower = -2 * acc - 1;
-
-                // 初始化泰勒级数的第一项 (1)。
-                let mid = new ComplexNumber([0, 1n, acc]);
-                // 初始化级数和为 0。
-                let result = new ComplexNumber([0, 0n, acc]);
-                let i = 1; // 迭代计数器，也用作阶乘的分母。
-
-                // 循环计算泰勒级数，直到项足够小或达到最大迭代次数。
-                for (; mid.re.power > minPower && !mid.isZero() && i < max; i++) {
-                    // 将当前项加到总和中。
-                    result = MathPlus.plus(result, mid);
-                    // 计算下一项: mid = (mid * iteration) / i
-                    mid = MathPlus.divide(
-                        MathPlus.times(iteration, mid),
-                        i
-                    );
-                }
+                const result = MathPlus._expSeriesHorner(iteration.re, max);
 
                 // 如果达到最大迭代次数仍未收敛，则抛出错误。
-                if (i === max) {
+                if (result === null) {
                     throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: exp. Input: ${input.toString()}`);
                 }
 
@@ -2123,19 +2460,9 @@
             // MathPlus.exp(input.re) 会递归调用 exp 函数，并进入处理纯实数的路径。
             const module = MathPlus.exp(input.re);
 
-            // 步骤 2: 计算虚部 b 对应的余弦值 cos(b)。
-            // input.im 是复数 a+bi 的虚部 b。
-            const cosAngle = MathPlus.cos(input.im);
-            const sinAngle = MathPlus.sin(input.im);
-
-            // 步骤 3: 组合最终结果。
-            // 最终结果的实部是 e^a * cos(b)，虚部是 e^a * sin(b)。
-            return new ComplexNumber([
-                // 计算实部: module * cosAngle
-                MathPlus.times(module, cosAngle).re,
-                // 计算虚部: module * sin(b)
-                MathPlus.times(module, sinAngle).re
-            ]);
+            // 步骤 2: 组合最终结果。
+            // 最终结果的实部是 e^a * cos(b)，虚部是 e^a * sin(b)，由 toPolar 对 b 只做一次范围缩减。
+            return MathPlus.toPolar(module, input.im);
         }
 
         /**
@@ -2176,10 +2503,15 @@
                 const const_1_2 = new ComplexNumber([-1, 12n, acc]);
                 const const_1_1 = new ComplexNumber([-1, 11n, acc]);
                 const const_0_9 = new ComplexNumber([-1, 9n, acc]);
-                let mantissaChangedBy1_2 = 0; // 1.2 的指数
-                let j = 0;
+                // 先用双精度 Math.log 估算所需的 k，并以 x' * 12^k * 10^(-k) 一次性精确完成缩放（只舍入一次）。
+                // 由于 [0.9, 1.1) 的跨度大于 1.2 倍，估算偏大一位时结果仍落在区间内；下方循环只负责在估算偏小时补足。
+                const estimate = Number(`0.${re.mantissa.toString().slice(0, 17)}`);
+                const k = Math.max(0, Math.ceil(Math.log(0.9 / estimate) / Math.log(1.2)));
+                mid = new ComplexNumber([mid.re.power - k, mid.re.mantissa * 12n ** BigInt(k), acc]);
+                let mantissaChangedBy1_2 = -k; // 1.2 的指数
+                let j = k;
                 // 循环直到 normalized_x 落入 [0.9, 1.1) 区间
-                for (; !(MathPlus.minus(mid, const_1_1).re.isNegative() && MathPlus.minus(mid, const_0_9).re.isPositive()) && j < 14; j++) {
+                for (; j < 14 && !(MathPlus._compare(mid.re, const_1_1.re) < 0 && MathPlus._compare(mid.re, const_0_9.re) > 0); j++) {
                     mid = MathPlus.times(mid, const_1_2);
                     mantissaChangedBy1_2 -= 1;
                 }
@@ -2200,24 +2532,11 @@
                     )
                 );
 
-                // artanh(z) = z + z^3/3 + z^5/5 + ...
-                const squareOfMid = MathPlus.times(mid, mid);
+                // artanh(z) = z + z^3/3 + z^5/5 + ... = z * (1 + z²/3 + z⁴/5 + ...)，在 BigInt 定点数上由内向外嵌套求值。
                 const max = CalcConfig.globalCalcAccuracy + 5;
-                const minPower = -2 * acc - 1; // 收敛阈值
+                let result = MathPlus._artanhSeriesHorner(mid.re, max);
 
-                let result = new ComplexNumber([0, 0n, acc]); // 级数和，从第一项 z 开始
-                let i = 1;
-
-                for (; mid.re.power > minPower && !mid.isZero() && i < max; i += 2) {
-                    // 计算下一项: term_new = term_old * z^2 * i/(i+2)
-                    result = MathPlus.plus(result, mid);
-                    mid = MathPlus.times(
-                        MathPlus.times(squareOfMid, mid),
-                        MathPlus.divide(i, i + 2)
-                    );
-                }
-
-                if (i === max) {
+                if (result === null) {
                     throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: ln. Input: ${input.toString()}`);
                 }
 
@@ -2232,13 +2551,15 @@
 
             // --- 路径 2: 输入负实数或复数 ---
             // 使用复数自然对数的标准定义: ln(z) = ln(|z|) + i*arg(z)
-            // 步骤 1: 计算复数的模 |z| (绝对值)。
-            // MathPlus.abs(x) 返回一个纯实数的 ComplexNumber。
-            const absValue = MathPlus.abs(input);
-
-            // 步骤 2: 计算模的自然对数 ln(|z|)。
+            // 步骤 1 & 2: 计算模的自然对数 ln(|z|)。
             // 这是一个实数对数，会递归调用本函数并进入上面的 `if` 分支。
-            const lnAbsValue = MathPlus.ln(absValue);
+            // 实部与虚部均不为 0 时，使用 ln(|z|) = ln(a² + b²) / 2，省去 abs 中的开方运算。
+            const lnAbsValue = input.onlyReal || input.re.isZero()
+                ? MathPlus.ln(MathPlus.abs(input))
+                : MathPlus.divide(
+                    MathPlus.ln(MathPlus.plus(MathPlus.times(input.re, input.re), MathPlus.times(input.im, input.im))),
+                    [0, 2n, acc]
+                );
 
             // 步骤 3: 计算复数的辐角 arg(z)。
             // MathPlus.arg(x) 返回一个纯实数的 ComplexNumber。
@@ -2276,6 +2597,7 @@
          * @description 计算以 a 为底，b 的对数 (logₐ(b))。
          * - 该方法基于对数换底公式：logₐ(b) = ln(b) / ln(a)。
          * - 它能够自动处理实数和复数作为底数和真数。
+         * - 底数为 10 时直接调用 `lg`；底数为其他正整数时，ln(a) 从 LRU 缓存中读取。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} a - 对数的底数。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} b - 对数的真数。
          * @returns {ComplexNumber} 代表 logₐ(b) 结果的 ComplexNumber 实例。
@@ -2288,8 +2610,32 @@
          * MathPlus.log(4, 2);
          */
         static log(a, b) {
+            const base = new ComplexNumber(a);
+            const re = base.re;
+
+            // 正整数底数：底数 10 使用预先计算好的 ln(10) 常量，其余底数的 ln 值按精度缓存。
+            if (base.onlyReal && re.mantissa > 0n && re.power >= 0) {
+                if (re.power === 1 && re.mantissa === 1n) {
+                    const result = MathPlus.lg(b);
+                    return result.acc > base.acc ? new ComplexNumber(result, {acc: base.acc}) : result;
+                }
+                const key = `${re.mantissa * 10n ** BigInt(re.power)}:${base.acc}`;
+                const cache = MathPlus._logBaseCache;
+                let lnA = cache.get(key);
+                if (lnA === undefined) {
+                    lnA = Public.zeroCorrect(MathPlus.ln(base));
+                } else {
+                    cache.delete(key);
+                }
+                cache.set(key, lnA);
+                if (cache.size > CalcConfig.LOG_BASE_CACHE_SIZE) {
+                    cache.delete(cache.keys().next().value);
+                }
+                return MathPlus.divide(MathPlus.ln(b), lnA);
+            }
+
             // 确保 ln(a) 不为 0
-            const lnA = Public.zeroCorrect(MathPlus.ln(a));
+            const lnA = Public.zeroCorrect(MathPlus.ln(base));
 
             // 应用换底公式，计算 ln(b) / ln(a)
             return MathPlus.divide(MathPlus.ln(b), lnA);
@@ -2328,7 +2674,7 @@
                 // 利用三倍角公式进一步将 re 缩减到更小的范围，
                 // 以极大地加速泰勒级数收敛。这里我们将 re 反复除以 3，直到其足够小。
                 let divideBy3 = 0;
-                for (; !MathPlus.plus(re, [-1, -1n, acc]).re.isNegative() && divideBy3 < 4; divideBy3++) {
+                for (; divideBy3 < 4 && MathPlus._compare(re, [-1, 1n, acc]) >= 0; divideBy3++) {
                     re = MathPlus.divide(re, [0, 3n, acc]).re;
                 }
                 if (divideBy3 === 4) {
@@ -2336,28 +2682,15 @@
                     throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: sin. Input: ${input.toString()}`);
                 }
 
-                // --- 步骤 2: 泰勒级数计算 ---
-                // sin(x) = x - x^3/3! + x^5/5! - x^7/7! + ...
-                const squareOfRe = MathPlus.times(re, re);
+                // --- 步骤 2: 泰勒级数计算 (Horner 形式) ---
+                // sin(x) = x - x^3/3! + x^5/5! - ... = x * (1 - x²/(2*3) * (1 - x²/(4*5) * (1 - ...)))
+                // 在 BigInt 定点数上由内向外嵌套求值，符号由嵌套结构自然产生。
                 const max = CalcConfig.globalCalcAccuracy + 5;
-                const minPower = -2 * acc - 1; // 收敛阈值
-                let mid = new ComplexNumber(re); // 第一项: x
-                let result = mid;
-                let i = 1;
-
-                for (; mid.re.power > minPower && !mid.isZero() && i < max; i++) {
-                    // 计算下一项: term_new = term_old * (-x²) / (2i*(2i+1))
-                    mid = MathPlus.divide(
-                        MathPlus.times(mid, squareOfRe),
-                        2 * i * (2 * i + 1)
-                    );
-                    // 根据项的索引，交替进行加减。
-                    result = MathPlus[i % 2 === 0 ? 'plus' : 'minus'](result, mid);
-                }
-
-                if (i === max) {
-                    throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: cos. Input: ${input.toString()}`);
+                let result = MathPlus._trigSeriesHorner(re, 1, max);
+                if (result === null) {
+                    throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: sin. Input: ${input.toString()}`);
                 }
+                result = MathPlus.times(result, re);
 
                 // --- 步骤 3: 重建结果 ---
                 // 通过反复应用三倍角公式 sin(3θ) = 3sin(θ) - 4sin³(θ) 来还原结果
@@ -2434,7 +2767,7 @@
                 // Case 1.2: |x| > 1 (结果是复数)
                 // 使用基于对数的恒等式。
                 const term = MathPlus.sqrt(MathPlus.minus(MathPlus.times(re, re), one));
-                const piOver2 = MathPlus.divide(CalcConfig.constants.pi, [0, 2n, acc]);
+                const piOver2 = new ComplexNumber(CalcConfig.constants.halfPi, {acc: acc});
 
                 if (re.isPositive()) { // 如果 x > 1
                     // 使用公式: arcsin(x) = π/2 - i * ln(x + sqrt(x² - 1))
@@ -2497,7 +2830,7 @@
                 // 利用四倍角公式进一步将 re 缩减到更小的范围，
                 // 以极大地加速泰勒级数收敛。这里我们将 re 反复除以 4，直到其足够小。
                 let divideBy4 = 0;
-                for (; !MathPlus.plus(re, [-1, -1n, acc]).re.isNegative() && divideBy4 < 3; divideBy4++) {
+                for (; divideBy4 < 3 && MathPlus._compare(re, [-1, 1n, acc]) >= 0; divideBy4++) {
                     re = MathPlus.divide(re, [0, 4n, acc]).re;
                 }
                 if (divideBy4 === 3) {
@@ -2505,26 +2838,12 @@
                     throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: cos. Input: ${input.toString()}`);
                 }
 
-                // --- 步骤 2: 泰勒级数计算 ---
-                // cos(x) = 1 - x²/2! + x⁴/4! - x⁶/6! + ...
-                const squareOfRe = MathPlus.times(re, re);
+                // --- 步骤 2: 泰勒级数计算 (Horner 形式) ---
+                // cos(x) = 1 - x²/2! + x⁴/4! - ... = 1 - x²/(1*2) * (1 - x²/(3*4) * (1 - ...))
+                // 在 BigInt 定点数上由内向外嵌套求值，符号由嵌套结构自然产生。
                 const max = CalcConfig.globalCalcAccuracy + 5;
-                const minPower = -2 * acc - 1; // 收敛阈值
-                let mid = new ComplexNumber([0, 1n, acc]); // 第一项: 1
-                let result = new ComplexNumber([0, 0n, acc]);
-                let i = 0;
-
-                for (; mid.re.power > minPower && !mid.isZero() && i < max; i++) {
-                    // 根据项的索引，交替进行加减。
-                    result = MathPlus[i % 2 === 0 ? 'plus' : 'minus'](result, mid);
-                    // 计算下一项: term_new = term_old * (-x²) / ((2i+1)*(2i+2))
-                    mid = MathPlus.divide(
-                        MathPlus.times(mid, squareOfRe),
-                        (2 * i + 1) * (2 * i + 2)
-                    );
-                }
-
-                if (i === max) {
+                let result = MathPlus._trigSeriesHorner(re, 0, max);
+                if (result === null) {
                     throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: cos. Input: ${input.toString()}`);
                 }
 
@@ -2587,8 +2906,8 @@
 
             // 直接应用公式 arccos(x) = π/2 - arcsin(x)
             return MathPlus.minus(
-                // 计算 π/2
-                MathPlus.divide(CalcConfig.constants.pi, [0, 2n, acc]),
+                // π/2
+                new ComplexNumber(CalcConfig.constants.halfPi, {acc: acc}),
                 // 计算 arcsin(x)
                 MathPlus.arcsin(input)
             );
@@ -2599,6 +2918,7 @@
          * @method tan
          * @description 计算 x 的正切 (tan(x))。
          * - 该方法通过基本三角恒等式 tan(x) = sin(x) / cos(x) 进行计算，并返回主值。
+         * - 对于实数，sin 与 cos 共用一次范围缩减，并在角度接近 π/2 时改用余角计算。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} x - 输入的角度（弧度）。
          * @returns {ComplexNumber} 代表 tan(x) 结果的 ComplexNumber 实例。
          * @throws {Error} 如果 cos(x) 为 0（此时 tan(x) 在数学上是未定义的），
@@ -2606,12 +2926,45 @@
          */
         static tan(x) {
             const input = new ComplexNumber(x);
-            // 首先计算 cos(x)、sin(x)，并将其结果存储起来。
-            const cosAngle = Public.zeroCorrect(MathPlus.cos(input));
-            const sinAngle = MathPlus.sin(input);
+            const acc = input.acc; // 存储精度
+
+            // --- 路径 1: 输入为纯实数 ---
+            if (input.onlyReal) {
+                // 只做一次范围缩减：|sin(x)| = sin(r)，|cos(x)| = cos(r)，符号修正因子为两者符号之积。
+                let [re, sign] = MathPlus._toLessThanHalfPi(input.re, 'tan');
+                // 大角度取模在更高精度下完成，归约后回到输入精度，避免 sin、cos 按取模精度计算。
+                re = new BigNumber(re, {acc: acc});
+
+                // r 接近 π/2 时改用余角 tan(r) = cos(π/2 - r) / sin(π/2 - r)，
+                // 使 sin、cos 的自变量都落在它们免于再次范围缩减的快速路径内。
+                const complement = MathPlus._compare(re, [-2, 78n, acc]) >= 0;
+                if (complement) {
+                    re = MathPlus.minus(CalcConfig.constants.halfPi, re).re;
+                }
+                const sinRe = MathPlus.sin(re);
+                const cosRe = MathPlus.cos(re);
 
-            // 然后将 sin(x) 的结果除以 cos(x) 的结果。
-            return MathPlus.divide(sinAngle, cosAngle);
+                // 分母按输入精度做零值修正，cos(x) 为 0 时由 divide 抛出“除以零”的错误。
+                const result = complement
+                    ? MathPlus.divide(cosRe, Public.zeroCorrect(new ComplexNumber(sinRe, {acc: acc})))
+                    : MathPlus.divide(sinRe, Public.zeroCorrect(new ComplexNumber(cosRe, {acc: acc})));
+                return new ComplexNumber(sign === 1n ? result : MathPlus._oppositeNumber(result), {acc: acc});
+            }
+
+            // --- 路径 2: 输入为复数 ---
+            // sin(z) 与 cos(z) 都由同一个 e^(iz) 构成，只计算一次，而不是让 sin、cos 各算一遍：
+            // tan(z) = (e^(iz) - e^(-iz)) / (i * (e^(iz) + e^(-iz)))。
+            const mid = MathPlus.exp([MathPlus._oppositeNumber(input.im), input.re]);
+            const midInverse = MathPlus.divide([0, 1n, acc], mid);
+
+            // 分母对应 2i*cos(z)，按 cos(z) 为 0 的情况做零值修正，由 divide 抛出“除以零”的错误。
+            return MathPlus.divide(
+                MathPlus.minus(mid, midInverse),
+                Public.zeroCorrect(MathPlus.times(
+                    new ComplexNumber([0n, 1n], {acc: acc}),
+                    MathPlus.plus(mid, midInverse)
+                ))
+            );
         }
 
         /**
@@ -2621,9 +2974,8 @@
          * - 算法核心：
          * 1. (对称性) 利用 `arctan(-x) = -arctan(x)` 处理负数。
          * 2. (范围缩减) 利用 `arctan(x) = π/2 - arctan(1/x)` 将参数 `x` 缩减到 `[0, 1]` 区间。
-         * 3. (范围缩减) 反复利用半角公式 `arctan(x) = 2 * arctan(x / (1 + sqrt(1+x²)))` 将参数进一步缩减到接近 0 的范围，以加速收敛。
-         * 4. (泰勒级数) 对缩减后的极小参数使用泰勒级数 `arctan(x) = x - x³/3 + x⁵/5 - ...` 进行计算。
-         * 5. (结果重建) 将级数计算结果根据范围缩减的步骤反向转换，得到最终值。
+         * 3. (牛顿迭代) 以 `Math.atan` 的双精度结果为初值，迭代 `y ← y - cos(y) * (sin(y) - x * cos(y))` 求解 `tan(y) = x`，计算精度逐轮加倍。
+         * 4. (结果重建) 将迭代结果根据范围缩减的步骤反向转换，得到最终值。
          * - 复数 arctan(z) 通过 `(i/2) * ln((i+z)/(i-z))` 计算。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} x - 输入值。
          * @returns {ComplexNumber} 代表 arctan(x) 结果的 ComplexNumber 实例。
@@ -2647,60 +2999,34 @@
 
                 // 步骤 2: 范围缩减。如果 x > 1, 使用 arctan(x) = π/2 - arctan(1/x)。
                 let reciprocal = false;
-                if (MathPlus.plus(re, [0, -1n, acc]).re.isPositive()) { // 检查 re 是否大于 1
+                if (MathPlus._compare(re, [0, 1n, acc]) > 0) { // 检查 re 是否大于 1
                     re = MathPlus.divide([0, 1n, acc], re).re;// 计算 1/re
                     reciprocal = true; // 标记以便最后重建结果
                 }
 
-                // 步骤 3: 进一步范围缩减。反复使用半角公式将参数减小到接近 0。
-                let j = 0;
-                // 当 re > 0.1 时，循环应用半角公式。0.1 是一个经验值，用于平衡缩减次数和泰勒级数计算量。
-                for (; MathPlus.plus(re, [-1, -1n, acc]).re.isPositive() && j < 4; j++) {
-                    re = MathPlus.divide(
-                        re,
-                        MathPlus.plus(
-                            [0, 1n, acc],
-                            MathPlus.sqrt(MathPlus.plus([0, 1n, acc], MathPlus.times(re, re)))
-                        )
-                    ).re;
-                }
-                if (j === 4) {
-                    throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: arctan. Input: ${input.toString()}`);
-                }
-
-                // 步骤 4: 对缩减后的参数 re 使用泰勒级数进行计算。
-                // arctan(x) = x - x³/3 + x⁵/5 - ...
-                let [mid, mid_pow] = [re, re]; // 级数的第一项 (x) 和 用于计算下一项的分子部分 (x, x³, x⁵, ...)
-                const squareOfRe = MathPlus.times(re, re); // 预计算 re² 以提高效率
-                const max = CalcConfig.globalCalcAccuracy + 5;
-                const minPower = -2 * acc - 1; // 收敛阈值
-                let result = new ComplexNumber([0, 0n, acc]);
-                let i = 0;
-
-                for (; mid.power > minPower && !mid.isZero() && i < max; i++) {
-                    // 根据项的索引，交替进行加减。
-                    result = MathPlus[i % 2 === 0 ? 'plus' : 'minus'](result, mid);
-
-                    // 计算下一项的分子
-                    mid_pow = MathPlus.times(mid_pow, squareOfRe);
-                    // 计算下一项: (分子) / (2*i + 3)
-                    mid = MathPlus.divide(
-                        mid_pow,
-                        2 * i + 3
-                    ).re;
-                }
-                if (i === max) {
-                    throw new Error(`[MathPlus] mathematical error: Unreliable result, error source: arctan. Input: ${input.toString()}`);
+                // 步骤 3: 使用牛顿迭代求解 tan(y) = x，此时 0 <= x <= 1。
+                // 迭代公式: y ← y - (tan(y) - x) * cos²(y) = y - cos(y) * (sin(y) - x * cos(y))
+                // 以双精度 Math.atan 的结果作为初值（约 15 位有效数字）。牛顿迭代二次收敛，
+                // 每轮有效位数翻倍，因此计算精度也逐轮加倍，只有最后一轮以目标精度（另加 5 位保护位）计算。
+                const finalAcc = acc + 5;
+                let result = new ComplexNumber(Math.atan(Number(re.toString())), {acc: finalAcc});
+                for (let stepAcc = 30; ; stepAcc *= 2) {
+                    const currentAcc = Math.min(stepAcc, finalAcc);
+                    const y = new ComplexNumber(result, {acc: currentAcc});
+                    const cosY = MathPlus.cos(y);
+                    const residual = MathPlus.minus(MathPlus.sin(y), MathPlus.times(new ComplexNumber(re, {acc: currentAcc}), cosY));
+                    result = MathPlus.minus(y, MathPlus.times(cosY, residual));
+                    if (currentAcc === finalAcc) {
+                        break;
+                    }
                 }
+                result = new ComplexNumber(result, {acc: acc});
 
-                // 步骤 5: 结果重建
-                // 5a: 将级数结果乘以 2^j 来补偿半角公式的应用。
-                result = MathPlus.times([0, 2n ** BigInt(j), acc], result);
+                // 步骤 4: 结果重建
+                // 4a: 如果初始 x > 1，应用 arctan(x) = π/2 - arctan(1/x)。
+                result = reciprocal ? MathPlus.minus(new ComplexNumber(CalcConfig.constants.halfPi, {acc: acc}), result) : result;
 
-                // 5b: 如果初始 x > 1，应用 arctan(x) = π/2 - arctan(1/x)。
-                result = reciprocal ? MathPlus.minus(MathPlus.divide(CalcConfig.constants.pi, [0, 2n, acc]), result) : result;
-
-                // 5c: 如果初始 x < 0，应用 arctan(-x) = -arctan(x)。
+                // 4b: 如果初始 x < 0，应用 arctan(-x) = -arctan(x)。
                 if (isNegative) {
                     return MathPlus._oppositeNumber(result);
                 }
@@ -3011,7 +3337,21 @@
 
                 // 将 BigNumber 转换为 BigInt 以进行计算。
                 const realNumber = re.mantissa * (10n ** BigInt(re.power));
-                return new ComplexNumber(factorialOptimized(realNumber), {
+
+                // 优先从 LRU 缓存中读取，未命中时再计算并写入缓存。
+                const cache = MathPlus._factorialCache;
+                let value = cache.get(realNumber);
+                if (value === undefined) {
+                    value = factorialOptimized(realNumber);
+                } else {
+                    cache.delete(realNumber);
+                }
+                cache.set(realNumber, value);
+                if (cache.size > CalcConfig.FACTORIAL_CACHE_SIZE) {
+                    cache.delete(cache.keys().next().value);
+                }
+
+                return new ComplexNumber(value, {
                     acc: acc
                 });
             }
@@ -3057,14 +3397,20 @@
 
             // 步骤 3: 计算兰佐斯近似中的级数部分 A(z)。
             // A(z) = p₀ + p₁/(z+1) + p₂/(z+2) + ...
-            let mid = p[0];
-            for (let i = 1; i < p.length; i++) {
-                mid = MathPlus.plus(
-                    mid,
-                    MathPlus.divide(p[i], MathPlus.plus(calcNum, new ComplexNumber(i, {
-                        acc: calcAcc
-                    })))
-                );
+            // 实数自变量在定点整数上直接求和（见 _lanczosSeriesFixed）。
+            let mid;
+            if (calcNum.onlyReal) {
+                mid = MathPlus._lanczosSeriesFixed(calcNum.re, p);
+            } else {
+                mid = p[0];
+                for (let i = 1; i < p.length; i++) {
+                    mid = MathPlus.plus(
+                        mid,
+                        MathPlus.divide(p[i], MathPlus.plus(calcNum, new ComplexNumber(i, {
+                            acc: calcAcc
+                        })))
+                    );
+                }
             }
 
             // 步骤 4: 应用完整的兰佐斯公式。
@@ -3368,6 +3714,86 @@
          * @throws {Error} 如果表达式包含语法错误、非法字符或计算错误（如除以零）。
          */
         static calc(expr, {unknown, f, g, mode = 'calc', acc = CalcConfig.globalCalcAccuracy} = {}) {
+            // 类型检查
+            const inputType = Public.typeOf(expr);
+            if (['number', 'bigint', 'complexnumber', 'bignumber'].includes(inputType)) {
+                return [new ComplexNumber(expr), expr];
+            }
+            if (inputType !== 'string') {
+                throw new Error('[MathPlus] Disallowed input type.');
+            }
+
+            // 解析阶段（前两轮循环）与编译阶段（第三轮循环，生成 RPN 程序）都与变量 x 的取值无关，求值阶段只执行编译好的程序。
+            const [program, output] = MathPlus._compileExpression(expr);
+            return [MathPlus._evaluateRPN(program, {unknown, f, g, mode, acc}), output];
+        }
+
+        /**
+         * @private
+         * @static
+         * @type {RegExp}
+         * @description 匹配不含运算符的十进制字面量（可带负号），例如 `3`、`-12.5`。
+         */
+        static _decimalLiteralRegex = /^-?[0-9]+(\.[0-9]+)?$/;
+
+        /**
+         * @private
+         * @static
+         * @method _calcInput
+         * @description 读取各工具类的输入（多项式系数、被开方数、区间端点等）：计算表达式并返回经过零值修正的结果。
+         * 输入大多是纯数字，这类输入的结果与 `calc` 相同，因此直接转换为 ComplexNumber，不经过分词与编译。
+         * @param {string|number|bigint|BigNumber|ComplexNumber} expr - 输入的表达式或数值。
+         * @returns {ComplexNumber} 零值修正后的计算结果。
+         * @throws {Error} 如果表达式包含语法错误或计算错误。
+         */
+        static _calcInput(expr) {
+            if (Public.typeOf(expr) === 'string' && MathPlus._decimalLiteralRegex.test(expr)) {
+                return Public.zeroCorrect(new ComplexNumber(expr));
+            }
+            return Public.zeroCorrect(MathPlus.calc(expr)[0]);
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _compileExpression
+         * @description 依次执行 `_parseExpression` 与 `_compileTokens`，并将结果写入 LRU 缓存。
+         * 编译失败的表达式不会被缓存，每次调用都会重新抛出相同的错误。
+         * @param {string} expr - 要编译的数学表达式字符串。
+         * @returns {[Array<object>, string]} 一个包含两个元素的数组：
+         * - [0]: 供 `_evaluateRPN` 执行的 RPN 程序。
+         * - [1]: 格式化和美化后的表达式字符串。
+         * @throws {Error} 如果表达式为空或包含语法错误、非法字符。
+         */
+        static _compileExpression(expr) {
+            const cache = MathPlus._expressionCache;
+            let compiled = cache.get(expr);
+            if (compiled === undefined) {
+                const [tokens, output] = MathPlus._parseExpression(expr);
+                compiled = [MathPlus._compileTokens(tokens), output];
+            } else {
+                cache.delete(expr);
+            }
+            cache.set(expr, compiled);
+            if (cache.size > CalcConfig.EXPRESSION_CACHE_SIZE) {
+                cache.delete(cache.keys().next().value);
+            }
+            return compiled;
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _parseExpression
+         * @description `calc` 的解析阶段：对表达式分词，插入隐式乘法与括号以消除歧义，并生成格式化后的表达式字符串。
+         * 解析结果与变量 x 的取值无关，因此对同一表达式多次求值时（例如函数值列表）只需解析一次。
+         * @param {string} expr - 要解析的数学表达式字符串。
+         * @returns {[string[], string]} 一个包含两个元素的数组：
+         * - [0]: 处理后的词法单元数组，供 `_compileTokens` 编译。
+         * - [1]: 格式化和美化后的表达式字符串。
+         * @throws {Error} 如果表达式为空或包含语法错误、非法字符。
+         */
+        static _parseExpression(expr) {
             /**
              * @private
              * @function listIncludesStr
@@ -3385,151 +3811,6 @@
                 return false;
             }
 
-            /**
-             * @private
-             * @function symbolConversion
-             * @description (内部辅助函数) 将一个词法单元（token）转换为其内部表示或可执行的等价物。
-             * 这是连接词法分析和计算执行的关键步骤。它将运算符、函数名、常量和变量等字符串
-             * 映射到实际的 MathPlus 方法名、预计算的常量值或变量的当前值。
-             * @param {string} str - 要转换的词法单元字符串，例如 "+", "sin", "pi", "x"。
-             * @returns {string|ComplexNumber|BigNumber|Array|number}
-             *   - 对于运算符和函数，返回对应的 MathPlus 方法名（例如，"+" -> "plus"）。
-             *   - 对于常量（如 'pi', 'e', 'i'），返回其预计算的高精度数值。
-             *   - 对于变量 'x'，返回其在当前计算上下文中被赋予的值。
-             *   - 对于数字字符串，原样返回，由后续步骤处理。
-             */
-            function symbolConversion(str) {
-                // 使用 switch 语句高效地处理不同 token 的映射。
-                switch (str) {
-                    // --- 映射二元运算符为其方法名 ---
-                    case '+':
-                        return 'plus'; // 将加法符号 '+' 映射为 'plus' 方法。
-                    case '-':
-                        return 'minus'; // 将减法符号 '-' 映射为 'minus' 方法。
-                    case '*':
-                    case '&': // 将显式的 '*' 和隐式的 '&' 都映射为乘法。
-                        return 'times';
-                    case '/':
-                        return 'divide'; // 将除法符号 '/' 映射为 'divide' 方法。
-                    case '^':
-                        return 'pow'; // 将幂运算 '^' 映射为 'pow' 方法。
-                    case 'E': // 代表科学记数法 (例如, 3E6)。
-                        return 'exponential';
-
-                    // --- 映射一元运算符为其方法名 ---
-                    case '!': // 将阶乘符号 '!' 映射为 'fact' 方法。
-                        return 'fact';
-                    case '|':
-                        return 'abs';
-                    case 'N': // 'N' 是内部使用的、代表一元负号（取反）的 token。
-                        return '_oppositeNumber';
-                    case 'A': // 'A' 是内部使用的、代表绝对值的 token。
-                        return 'abs';
-
-                    // --- 映射函数为其方法名 ---
-                    case 'f':
-                    case 'g':
-                        return '_customFunc';
-
-                    // --- 获取预定义的常量和对象 ---
-                    case '[pi]':
-                        // 从配置对象中返回圆周率 Pi 的数值。
-                        return new ComplexNumber(CalcConfig.constants.pi, {acc: acc});
-                    case '[e]':
-                        // 从配置对象中返回自然常数 e 的数值。
-                        return new ComplexNumber(CalcConfig.constants.e, {acc: acc});
-                    case '[i]':
-                        // 创建并返回一个代表虚数单位 i 的新复数对象。
-                        return new ComplexNumber([[0, 0n, acc], [0, 1n, acc]]);
-                    case '[x]':
-                        if (mode === 'calc') {
-                            // 返回变量 'x' 的占位符，该占位符将在求值时被实际数值替换。
-                            if (unknown === undefined) {
-                                throw new Error('[MathPlus] input error: x is undefined.');
-                            }
-                            return new ComplexNumber(unknown, {acc: acc});
-                        } else {
-                            return new ComplexNumber([0, 0n, acc]);
-                        }
-
-                    // --- 默认回退情况 ---
-                    default:
-                        // 删除标识 CSS 的中括号
-                        return str.replace(/[\[\]]/g, '');
-                }
-            }
-
-            /**
-             * @private
-             * @function evaluationRPN
-             * @description (内部辅助函数) 在调度场算法的求值阶段，处理并执行一个从操作符栈中弹出的词法单元（运算符或函数）。
-             * 该函数从 `valueStack` 中弹出所需的操作数，执行计算，然后将结果压回 `valueStack`。
-             * 它是逆波兰表示法 (RPN) 的核心执行引擎。
-             * @param {string} token - 要执行的运算符或函数词法单元，例如 "+", "sin", "N"。
-             * @returns {void} 此函数不返回值，它通过修改 `valueStack` 来产生副作用。
-             * @throws {Error} 如果 `valueStack` 中的操作数不足以满足 `token` 所需的参数数量。
-             * @throws {Error} 如果尝试调用一个未定义的自定义函数 'f' 或 'g'。
-             */
-            function evaluationRPN(token) {
-                let tokenInfo = Public.getTokenInfo(token);
-
-                // --- 规则 1: 处理一元运算符（前缀或后缀） ---
-                if (tokenInfo.parameters === 1) {
-                    // 健壮性检查：确保栈中至少有一个操作数。
-                    if (valueStack.length < 1) {
-                        throw new Error(`[MathPlus] syntax error: Insufficient parameters for function ${token}.`);
-                    }
-
-                    // 如果是计算模式
-                    if (mode === 'calc') {
-                        // 必须先从栈中弹出操作数。
-                        const operand = valueStack.pop();
-                        // 调用相应的MathPlus方法进行计算。
-                        let value;
-                        if (['f', 'g'].includes(token)) {
-                            const context = {f, g};
-                            // 健壮性检查：确认所需函数已经定义。
-                            if (context[token] === undefined) {
-                                throw new Error(`[MathPlus] input error: Function ${token} is undefined or cyclically called.`);
-                            }
-                            value = MathPlus._customFunc(token, context, operand, acc);
-                        } else {
-                            value = MathPlus[symbolConversion(tokenInfo.token)](operand);
-                        }
-                        // 将计算结果压回栈中。
-                        valueStack.push(value);
-                    }
-                }
-
-                // --- 规则 2: 处理二元运算符和双参数函数 ---
-                else if (tokenInfo.parameters === 2) {
-                    // 健壮性检查：确保栈中至少有两个操作数。
-                    if (valueStack.length < 2) {
-                        throw new Error(`[MathPlus] syntax error: Insufficient parameters for function ${token}.`);
-                    }
-                    // 必须先从栈中弹出两个操作数。
-                    // 注意弹出的顺序：第二个操作数（b）先弹出，然后是第一个操作数（a）。
-                    const b = valueStack.pop();
-                    // 如果是计算模式
-                    if (mode === 'calc') {
-                        const a = valueStack.pop();
-                        // 调用相应的MathPlus方法进行计算，保持 (a, b) 的正确顺序。
-                        const value = MathPlus[symbolConversion(tokenInfo.token)](a, b);
-                        // 将计算结果压回栈中。
-                        valueStack.push(value);
-                    }
-                }
-            }
-
-            // 类型检查
-            const inputType = Public.typeOf(expr);
-            if (['number', 'bigint', 'complexnumber', 'bignumber'].includes(inputType)) {
-                return [new ComplexNumber(expr), expr];
-            }
-            if (inputType !== 'string') {
-                throw new Error('[MathPlus] Disallowed input type.');
-            }
-
             // --- 初始验证和准备 --- //
             if (expr === '') { // 输入为空则抛出错误。
                 throw new Error('[MathPlus] syntax error: Input is empty.');
@@ -3556,6 +3837,7 @@
             const orderOfTimes = Public.getTokenInfo('*').priority; // 显式乘号的优先级。
             const orderOfInvisibleTimes = Public.getTokenInfo('&').priority; // 隐式乘号的优先级。
             const absKhStack = []; // 用于跟踪绝对值符号 '|' 嵌套层级的栈。
+            let bracketIndex = -1; // 为隐式乘法预留的临时左括号标记 '[' 在 output 中的位置，-1 表示不存在。
 
             for (let i = 0; i < input.length; i++) {
                 // --- 获取 token 信息 ---
@@ -3639,7 +3921,7 @@
 
                 // --- 处理正负号 ---
                 if (
-                    ['+', '-'].includes(currentPush) &&
+                    (currentPush === '+' || currentPush === '-') &&
                     !(
                         lastTokenInfo.class === 'number' ||
                         lastTokenInfo.funcPlace === 'back' ||
@@ -3657,8 +3939,8 @@
                     if (
                         absKhStack.length !== 0 &&
                         absKhStack[absKhStack.length - 1] === 0 &&
-                        !['front', 'middle'].includes(lastTokenInfo.funcPlace) &&
-                        !['(', ','].includes(lastTokenInfo.token)
+                        lastTokenInfo.funcPlace !== 'front' && lastTokenInfo.funcPlace !== 'middle' &&
+                        lastTokenInfo.token !== '(' && lastTokenInfo.token !== ','
                     ) {
                         // 绝对值闭合的情况。
                         output.push('|'); // 为第二轮处理循环添加一个标记。
@@ -3687,7 +3969,7 @@
                 // 为了消除歧义。例如，`1/2x` 应该是 `1/(2&x)`。
                 if (
                     (output[output.length - 1] === '&' || (output[output.length - 1] === 'A' && output[output.length - 2] === '&')) && // 如果添加了隐式乘法符号
-                    !output.includes('[') // 如果这个隐式乘法前面没有未处理的隐式乘法。
+                    bracketIndex === -1 // 如果这个隐式乘法前面没有未处理的隐式乘法。
                 ) {
                     addKh = 0; // 临时括号记录。
                     // 小循环
@@ -3711,6 +3993,7 @@
                             if (tokenInfoJ.priority <= orderOfTimes && currentTokenJ !== '*') {
                                 // 如果这个运算符优先级高于或等于显式乘法（不是显式乘法），则插入括号。
                                 output.splice(j + 1, 0, '[');
+                                bracketIndex = j + 1;
                             }
                             break;
                         }
@@ -3720,7 +4003,7 @@
                 }
 
                 if ( // 解决为隐式乘法添加的另一半括号
-                    output.includes('[') && (
+                    bracketIndex !== -1 && (
                         ( // 判断依据同理小循环
                             tokenInfo.class === 'func' &&
                             tokenInfo.priority > orderOfInvisibleTimes &&
@@ -3732,7 +4015,7 @@
                 ) {
                     if (tokenInfo.priority >= orderOfTimes) {
                         // 目前 token 优先级低于显式乘法，需要添加括号
-                        output = output.map(item => item === '[' ? '(' : item);
+                        output[bracketIndex] = '(';
                         if (i + 1 === input.length) {
                             output.push(currentPush);
                             currentPush = ')';
@@ -3741,8 +4024,9 @@
                         }
                     } else {
                         // 否则不需要添加括号
-                        output = output.filter(item => item !== '[');
+                        output.splice(bracketIndex, 1);
                     }
+                    bracketIndex = -1;
                 }
 
                 // 向 output 添加 token 和 为下一次循环记录上一个 token
@@ -3756,18 +4040,18 @@
             }
 
             // 第一轮循环之后...
-            // 添加缺失的左括号
-            while (minKh < 0) {
-                output = ['(', ...output];
-                minKh += 1;
-                kh += 1;
+            // 添加缺失的左括号（一次性插入，避免逐个前插时反复复制数组）
+            if (minKh < 0) {
+                output.unshift(...new Array(-minKh).fill('('));
+                kh -= minKh;
+                minKh = 0;
             }
             // 关闭任何未闭合的绝对值符号 以及 绝对值内部未闭合的括号。
             for (let i = absKhStack.length - 1; i >= 0; i--) {
                 for (let j = 0; j < absKhStack[i]; j++) {
                     output.push(')');
                 }
-                output = [...output, '|', ')'];
+                output.push('|', ')');
                 kh -= absKhStack[i] + 1;
             }
             // 关闭剩余未闭合的常规括号。
@@ -3807,7 +4091,7 @@
 
                 // 简化判断
                 const funcCheck = tokenInfo.class === 'func' && tokenInfo.funcPlace !== 'front';
-                const tokenCheck = [',', ')'].includes(currentToken);
+                const tokenCheck = currentToken === ',' || currentToken === ')';
 
                 if (
                     (
@@ -3941,17 +4225,53 @@
                 }
             }
 
-            // 将 input 指向处理后的 output。
-            input = output;
+            // 合成最终的格式化字符串，还原内部标记
+            const formatted = output.join('').replaceAll('A(', '|').replaceAll('|)', '|').replaceAll('&', '[cdot]').replaceAll('N', '-');
+            return [output, formatted];
+        }
 
-            // 合成最终的 'output'，还原内部标记
-            output = output.join('');
-            output = output.replaceAll('A(', '|').replaceAll('|)', '|').replaceAll('&', '[cdot]').replaceAll('N', '-');
+        /**
+         * @private
+         * @static
+         * @method _compileTokens
+         * @description `calc` 的编译阶段：在 `_parseExpression` 生成的词法单元数组上执行调度场算法，生成逆波兰表示法 (RPN) 程序。
+         * 所有语法检查（括号、逗号、操作数数量）都在此完成，运算符也预先解析为 MathPlus 的方法，
+         * 因此同一表达式多次求值时只需编译一次，之后由 `_evaluateRPN` 直接执行。
+         * @param {string[]} input - `_parseExpression` 返回的词法单元数组。
+         * @returns {Array<{token: string, parameters: number, method?: string, func?: Function, values?: Map<number, ComplexNumber>}>} RPN 程序。
+         * 数字与常量的 `parameters` 为 0，并带有按精度缓存取值的 `values`；函数与运算符记录参数数量、对应的方法名及方法本身。
+         * @throws {Error} 如果括号或逗号不匹配，或操作数数量错误。
+         */
+        static _compileTokens(input) {
+            /**
+             * @private
+             * @function emit
+             * @description (内部辅助函数) 将一个从操作符栈中弹出的运算符或函数追加到 RPN 程序中。
+             * 同时模拟求值栈的深度，以便在编译阶段就发现操作数不足的错误。
+             * @param {string} token - 要追加的运算符或函数词法单元，例如 "+", "sin", "N"。
+             * @returns {void} 此函数不返回值，它通过修改 `program` 与 `depth` 来产生副作用。
+             * @throws {Error} 如果求值栈中的操作数不足以满足 `token` 所需的参数数量。
+             */
+            function emit(token) {
+                const parameters = Public.getTokenInfo(token).parameters;
+                if (parameters !== 1 && parameters !== 2) {
+                    return;
+                }
+                // 健壮性检查：确保栈中有足够的操作数。二元运算消耗两个操作数并产生一个结果。
+                if (depth < parameters) {
+                    throw new Error(`[MathPlus] syntax error: Insufficient parameters for function ${token}.`);
+                }
+                depth -= parameters - 1;
+                // MathPlus 的静态方法不依赖 this，在编译时取出方法引用，求值时无需再按方法名查找。
+                const method = MathPlus._symbolMethodNames.get(token) ?? token.replace(/[\[\]]/g, '');
+                program.push({token: token, parameters: parameters, method: method, func: MathPlus[method]});
+            }
 
             // --- 第三轮解析循环 --- //
-            // 生成 RPN（逆波兰表示法） 和 RPN求值循环
-            const valueStack = []; // 求值栈
+            // 生成 RPN（逆波兰表示法）
+            const program = []; // RPN 程序
             const operatorStack = []; // 操作符栈
+            let depth = 0; // 求值栈的模拟深度
 
             for (let i = 0; i < input.length; i++) {
                 // --- 获取 token 信息 ---
@@ -3961,18 +4281,10 @@
                 // --- 生成 RPN（逆波兰表示法）---
                 if (tokenInfo.class === 'number') {
                     // --- 规则 1: 处理数字和常量 ---
-                    // 如果是数字或常量，通过 symbolConversion 转换（例如将 'pi' 转换为 3.14...），然后压入值栈。
-                    if (mode === 'calc') {
-                        const pushNum = symbolConversion(currentToken);
-                        if (Public.typeOf(pushNum) === 'complexnumber') {
-                            valueStack.push(pushNum);
-                        } else {
-                            valueStack.push(new ComplexNumber(pushNum, {acc: acc}));
-                        }
-                    } else {
-                        // 语法检查模式占位符
-                        valueStack.push(new ComplexNumber([0, 0n, acc]));
-                    }
+                    // 数字或常量的取值依赖精度与 x，因此原样写入程序，由求值阶段转换。
+                    // 除 x 以外的取值只与精度有关，`values` 按精度缓存转换结果。
+                    program.push({token: currentToken, parameters: 0, values: new Map()});
+                    depth += 1;
                 } else if (tokenInfo.class === 'func') {
                     // --- 规则 2: 处理一元运算符（前缀或后缀） ---
                     // 如果当前 token 是一个函数或运算符。
@@ -3992,8 +4304,8 @@
                             (topOfStackInfo.priority === tokenInfo.priority && tokenInfo.associativity === 'left') // 优先级相同且为左结合
                         ) && tokenInfo.funcPlace !== 'front' // 防止提前出栈
                         ) {
-                        // 使用 pop() 从栈顶弹出一个运算符，并用 evaluationRPN 更新求值栈的值。
-                        evaluationRPN(operatorStack.pop().replace('~', ''));
+                        // 使用 pop() 从栈顶弹出一个运算符，并将其追加到 RPN 程序中。
+                        emit(operatorStack.pop().replace('~', ''));
                         // 更新栈顶元素以供下一次循环判断。
                         topOfStack = operatorStack[operatorStack.length - 1];
                         if (topOfStack !== undefined) {
@@ -4009,7 +4321,7 @@
                 } else if (currentToken === ')') {
                     // 遇到右括号则循环地将操作符栈顶的元素弹出，直到遇到左括号。
                     while (operatorStack.length > 0 && operatorStack[operatorStack.length - 1] !== '(') {
-                        evaluationRPN(operatorStack.pop().replace('~', ''));
+                        emit(operatorStack.pop().replace('~', ''));
                     }
                     //  健壮性检查：如果循环结束时栈为空，说明没有找到匹配的左括号。
                     if (operatorStack.length === 0) {
@@ -4020,7 +4332,7 @@
                 } else if (currentToken === ',') {
                     // 循环地将操作符栈顶的元素弹出，直到遇到左括号。
                     while (operatorStack.length > 0 && operatorStack[operatorStack.length - 1] !== '(') {
-                        evaluationRPN(operatorStack.pop().replace('~', ''));
+                        emit(operatorStack.pop().replace('~', ''));
                     }
                     // 为健壮性检查做准备
                     const subTopOfStack = Public.getTokenInfo(operatorStack[operatorStack.length - 2]);
@@ -4044,19 +4356,108 @@
                     throw new Error('[MathPlus] syntax error: The parentheses do not match.');
                 }
 
-                // 用 evaluationRPN 更新求值栈的值。
-                evaluationRPN(operator);
+                // 将运算符追加到 RPN 程序中。
+                emit(operator);
             }
 
             // 遍历完所有token后，求值栈中应该且只应该剩下一个值。
-            if (valueStack.length !== 1) {
+            if (depth !== 1) {
                 // 如果栈中值的数量不是1，说明原始表达式存在语法错误（例如，操作数过多或运算符不足）。
                 throw new Error('[MathPlus] syntax error: The final stack should have exactly one value.');
             }
 
-            // 返回计算结果和优化后的字符串
-            const result = new ComplexNumber(mode === 'calc' ? valueStack[0] : [0, 0n, acc]);
-            return [result, output];
+            return program;
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _evaluateRPN
+         * @description `calc` 的求值阶段：执行 `_compileTokens` 生成的 RPN 程序。
+         * 程序在编译时已通过全部语法检查，因此这里只需按顺序压栈与调用对应的 MathPlus 方法。
+         * @param {Array<object>} program - `_compileTokens` 返回的 RPN 程序。
+         * @param {object} [options={}] - 可选参数对象，含义与 `calc` 相同。
+         * @param {string|number|BigInt|ComplexNumber|BigNumber} [options.unknown] - 变量 'x' 的值。
+         * @param {string} [options.f] - 自定义函数 'f(x)' 的表达式字符串。
+         * @param {string} [options.g] - 自定义函数 'g(x)' 的表达式字符串。
+         * @param {string} [options.mode='calc'] - 操作模式，'calc' 或 'syntaxCheck'。
+         * @param {number} [options.acc=CalcConfig.globalCalcAccuracy] - 计算精度。
+         * @returns {ComplexNumber} 计算结果；在 'syntaxCheck' 模式下为代表 0 的 ComplexNumber 实例。
+         * @throws {Error} 如果 x 或所需的自定义函数未定义，或计算过程中发生错误。
+         */
+        static _evaluateRPN(program, {unknown, f, g, mode = 'calc', acc = CalcConfig.globalCalcAccuracy} = {}) {
+            // 语法检查模式不执行计算，语法错误已在编译阶段抛出。
+            if (mode !== 'calc') {
+                return new ComplexNumber([0, 0n, acc]);
+            }
+
+            const valueStack = []; // 求值栈
+            const context = {f, g}; // 自定义函数
+            let x; // 变量 x 的值，首次使用时才转换，之后所有出现的 x 复用同一个不可变实例
+            for (let i = 0; i < program.length; i++) {
+                const {token, parameters, func, values} = program[i];
+
+                // --- 规则 1: 数字和常量直接压入求值栈 ---
+                if (parameters === 0) {
+                    if (token === '[x]') {
+                        if (x === undefined) {
+                            if (unknown === undefined) {
+                                throw new Error('[MathPlus] input error: x is undefined.');
+                            }
+                            x = new ComplexNumber(unknown, {acc: acc});
+                        }
+                        valueStack.push(x);
+                        continue;
+                    }
+                    // 字面量与常量在同一精度下的取值固定，ComplexNumber 实例不可变，因此转换一次后即可复用。
+                    let value = values.get(acc);
+                    if (value === undefined) {
+                        switch (token) {
+                            case '[pi]':
+                                // 从配置对象中返回圆周率 Pi 的数值。
+                                value = new ComplexNumber(CalcConfig.constants.pi, {acc: acc});
+                                break;
+                            case '[e]':
+                                // 从配置对象中返回自然常数 e 的数值。
+                                value = new ComplexNumber(CalcConfig.constants.e, {acc: acc});
+                                break;
+                            case '[i]':
+                                // 创建并返回一个代表虚数单位 i 的新复数对象。
+                                value = new ComplexNumber([[0, 0n, acc], [0, 1n, acc]]);
+                                break;
+                            default:
+                                value = new ComplexNumber(token, {acc: acc});
+                        }
+                        values.set(acc, value);
+                    }
+                    valueStack.push(value);
+                }
+
+                // --- 规则 2: 处理一元运算符（前缀或后缀） ---
+                else if (parameters === 1) {
+                    const operand = valueStack.pop();
+                    if (token === 'f' || token === 'g') {
+                        // 健壮性检查：确认所需函数已经定义。
+                        if (context[token] === undefined) {
+                            throw new Error(`[MathPlus] input error: Function ${token} is undefined or cyclically called.`);
+                        }
+                        valueStack.push(MathPlus._customFunc(token, context, operand, acc));
+                    } else {
+                        valueStack.push(func(operand));
+                    }
+                }
+
+                // --- 规则 3: 处理二元运算符和双参数函数 ---
+                else {
+                    // 注意弹出的顺序：第二个操作数（b）先弹出，然后是第一个操作数（a）。
+                    const b = valueStack.pop();
+                    const a = valueStack.pop();
+                    valueStack.push(func(a, b));
+                }
+            }
+
+            // 返回计算结果
+            return new ComplexNumber(valueStack[0]);
         }
     }
 
@@ -4202,7 +4603,10 @@
                     covariance[0],
                     MathPlus.sqrt(MathPlus.times(varianceA[0], varianceB[0]))
                 );
-            } catch {
+            } catch (error) {
+                if (!Public.isCalculationError(error)) {
+                    throw error;
+                }
                 result = 'error';
             }
             return result;
@@ -4486,14 +4890,16 @@
             // 'coefficients' 矩阵将构成正规方程组中的矩阵 A。
             // A_ij = Σ(x^(i+j))
             const coefficients = [];
-            // 计算 b_i = Σ(x^i * y) for i = 1 to power
-            for (let i = 1; i < power + 1; i++) {
-                const changedListA = StatisticsTools._changeInner(listA, x => MathPlus.pow(x, i));
-                constants.push(StatisticsTools._dotProduct(changedListA, listB));
-            }
-            // 计算 Σ(x^k) for k = 1 to 2*power
+            // 逐次乘以 x 得到 x^k，不再对每个 k 重新调用通用幂运算。
+            // 同时求出 b_i = Σ(x^i * y) (i = 1 to power) 与 Σ(x^k) (k = 1 to 2*power)。
+            let changedListA = StatisticsTools._changeInner(listA, x => new ComplexNumber(x));
             for (let i = 1; i < 2 * power + 1; i++) {
-                const changedListA = StatisticsTools._changeInner(listA, x => MathPlus.pow(x, i));
+                if (i > 1) {
+                    changedListA = changedListA.map((x, index) => MathPlus.times(x, listA[index]));
+                }
+                if (i < power + 1) {
+                    constants.push(StatisticsTools._dotProduct(changedListA, listB));
+                }
                 coefficientsList.push(StatisticsTools._averageAndSum(changedListA).sum);
             }
             // 构建系数矩阵 A
@@ -4625,9 +5031,12 @@
             try {
                 // 调用 _regressionAnalysis 来求解正规方程组，得到多项式系数。
                 result.parameter = StatisticsTools._regressionAnalysis(listA, listB, power);
-            } catch {
+            } catch (error) {
                 // 如果在计算过程中发生错误（例如，数据点不足或矩阵奇异），
                 // 则捕获异常，并将参数设置为一个表示错误的数组，其长度与预期系数数量相同。
+                if (!Public.isCalculationError(error)) {
+                    throw error;
+                }
                 result.parameter = Array.from({length: power + 1}, () => 'error');
             }
 
@@ -4640,9 +5049,12 @@
                     // 传入一个匿名函数，该函数使用已计算出的系数来预测 y 值。
                     x => func(x, result.parameter)
                 );
-            } catch {
+            } catch (error) {
                 // 如果在计算 R² 时发生错误（例如，除以零），
                 // 则捕获异常并将 R² 设置为 'error'。
+                if (!Public.isCalculationError(error)) {
+                    throw error;
+                }
                 result.R2 = 'error';
             }
 
@@ -4754,12 +5166,20 @@
             if (listA.length !== listB.length) {
                 throw new Error('[StatisticsTools] Data mismatch.');
             }
+            // 统计数据中经常出现重复的输入（如多组相同的 x），相同的文本只解析一次。
+            const parsed = new Map();
+            const parse = text => {
+                if (!parsed.has(text)) {
+                    parsed.set(text, MathPlus.calc(text)[0]);
+                }
+                return parsed.get(text);
+            };
             for (let i = 0; i < listA.length; i++) {
                 if (typeof listA[i] === 'string') {
-                    listA[i] = MathPlus.calc(listA[i])[0];
+                    listA[i] = parse(listA[i]);
                 }
                 if (typeof listB[i] === 'string') {
-                    listB[i] = MathPlus.calc(listB[i])[0];
+                    listB[i] = parse(listB[i]);
                 }
             }
             // 验证：确保 x 和 y 数据集都是实数集
@@ -4789,11 +5209,11 @@
             // 以避免重复计算，并返回一个包含这些统计数据和平方列表的对象。
             const statisticsInfoA = this._getStatisticsInfo(listA, {
                 averageAndSum: averageAndSumA,
-                variance: varianceA
+                varianceList: varianceA
             });
             const statisticsInfoB = this._getStatisticsInfo(listB, {
                 averageAndSum: averageAndSumB,
-                variance: varianceB
+                varianceList: varianceB
             });
             // 将计算出的统计信息填充到最终的 result 对象中，并用 'A' 和 'B' 后缀来区分。
             for (let key in statisticsInfoA.statisticsResult) {
@@ -5061,21 +5481,39 @@
          * @returns {ComplexNumber} 多项式在点 `x` 的计算结果，以 ComplexNumber 实例形式返回。
          */
         static _getPowerFunctionValue(list, x) {
-            // 使用霍纳方法（Horner's method）计算多项式。
-            // 该方法通过嵌套乘法来减少运算次数： a_n*x^n + ... + a_0 = ((...((a_n * x + a_{n-1}) * x) ... ) * x) + a_0
-            // list[0] 是最高次项的系数 a_n。
-            let result = new ComplexNumber(list[0]);
-            const input = new ComplexNumber(x);
+            // 单点求值与批量求值共用同一套霍纳循环，避免两处实现各自维护。
+            return PowerFunctionTools._getPowerFunctionValues(list, [x])[0];
+        }
 
-            // 从第二项系数开始迭代。
-            for (let i = 1; i < list.length; i++) {
-                // result = result * x + a_i
-                result = MathPlus.plus(
-                    MathPlus.times(result, input),
-                    list[i]
-                );
-            }
-            return result;
+        /**
+         * @private
+         * @static
+         * @method _getPowerFunctionValues
+         * @description 批量计算一个多项式在多个点上的值。
+         * 系数只转换一次，随后对每个点分别执行霍纳方法，适用于一次性求出全部极值点或拐点处的函数值。
+         * @param {Array<string|number|bigint|BigNumber|ComplexNumber|Array>} list - 多项式的系数数组，
+         * 从最高次项到常数项排列。
+         * @param {Array<string|number|bigint|BigNumber|ComplexNumber>} xs - 需要代入多项式进行计算的值组成的数组。
+         * @returns {Array<ComplexNumber>} 与 `xs` 一一对应的计算结果。
+         */
+        static _getPowerFunctionValues(list, xs) {
+            const coefficients = list.map((item) => new ComplexNumber(item));
+            return xs.map((x) => {
+                // 使用霍纳方法（Horner's method）计算多项式。
+                // 该方法通过嵌套乘法来减少运算次数： a_n*x^n + ... + a_0 = ((...((a_n * x + a_{n-1}) * x) ... ) * x) + a_0
+                // coefficients[0] 是最高次项的系数 a_n。
+                const input = new ComplexNumber(x);
+                let result = coefficients[0];
+                // 从第二项系数开始迭代。
+                for (let i = 1; i < coefficients.length; i++) {
+                    // result = result * x + a_i，系数为 0 的项（如 x⁴ - 1 中缺失的各项）只做乘法。
+                    result = MathPlus.times(result, input);
+                    if (!coefficients[i].isZero()) {
+                        result = MathPlus.plus(result, coefficients[i]);
+                    }
+                }
+                return result;
+            });
         }
 
         /**
@@ -5265,7 +5703,7 @@
                     MathPlus.times(a, 3)
                 ).re;
                 const im = MathPlus.divide(
-                    MathPlus.times(MathPlus.minus(w1, w2), MathPlus.sqrt(3)),
+                    MathPlus.times(MathPlus.minus(w1, w2), CalcConfig.constants.sqrt_3),
                     MathPlus.times(a, 6)
                 ).re;
 
@@ -5312,13 +5750,15 @@
             // 方程有三个不相等的实数根。这是不可约情况。
             // 此时必须使用三角函数解法。
             const absA = MathPlus.abs(A);
+            // √A 在下方多处使用，只计算一次；A^1.5 = A * √A，无需经过通用幂运算 exp(1.5 * ln(A))。
+            const sqrtA = MathPlus.sqrt(absA);
             // 计算 T = (2Ab - 3aB) / (2*sqrt(A³))
             const T = MathPlus.divide(
                 MathPlus.minus(
                     MathPlus.times(MathPlus.times(absA, b), 2),
                     MathPlus.times(MathPlus.times(a, B), 3)
                 ),
-                MathPlus.times(MathPlus.pow(absA, '1.5'), 2)
+                MathPlus.times(MathPlus.times(absA, sqrtA), 2)
             );
             // 计算 θ = arccos(T)
             let ct;
@@ -5334,7 +5774,7 @@
             const sinCT = MathPlus.sin(ct);
             const mid1 = MathPlus.divide(
                 MathPlus.minus(
-                    MathPlus.times(MathPlus.sqrt(absA), cosCT),
+                    MathPlus.times(sqrtA, cosCT),
                     b
                 ),
                 MathPlus.times(a, 3)
@@ -5351,7 +5791,7 @@
             const root3 = MathPlus.divide(
                 MathPlus.plus(
                     b,
-                    MathPlus.times(cosCT, MathPlus.times(2, MathPlus.sqrt(absA)))
+                    MathPlus.times(cosCT, MathPlus.times(2, sqrtA))
                 ),
                 MathPlus.times(a, -3)
             );
@@ -5371,80 +5811,96 @@
         static _solveQuartic(list) {
             // 从列表中提取系数 a, b, c, d, e。
             const a = list[0], b = list[1], c = list[2], d = list[3], e = list[4];
+            // 下方各判别式反复用到 a²、b² 与 ac，只计算一次；平方一律写成自乘，不经过通用幂运算。
+            const aa = MathPlus.times(a, a);
+            const bb = MathPlus.times(b, b);
+            const ac = MathPlus.times(a, c);
+            // 各分支求根公式的分母都是 ±4a 或 8a：只求一次 1/(4a)，各处以乘法代替除法；
+            // -b/(4a) 是多数分支中根的公共部分，同样只计算一次。
+            const inverseA4 = MathPlus.divide(1, MathPlus.times(a, 4));
+            const inverseMinusA4 = MathPlus.minus(0, inverseA4);
+            const minusBOverA4 = MathPlus.times(b, inverseMinusA4);
 
             // D = 3b² - 8ac
             const D = Public.zeroCorrect(MathPlus.minus(
-                MathPlus.times(MathPlus.times(b, b), 3),
-                MathPlus.times(MathPlus.times(a, c), 8)
+                MathPlus.times(bb, 3),
+                MathPlus.times(ac, 8)
             )).re;
 
             // E = 4abc - 8a²d - b³
             const E = Public.zeroCorrect(MathPlus.minus(
                 MathPlus.minus(
-                    MathPlus.times(MathPlus.times(MathPlus.times(a, b), c), 4),
-                    MathPlus.times(MathPlus.times(MathPlus.times(a, a), d), 8)
+                    MathPlus.times(MathPlus.times(ac, b), 4),
+                    MathPlus.times(MathPlus.times(aa, d), 8)
                 ),
-                MathPlus.times(MathPlus.times(b, b), b)
+                MathPlus.times(bb, b)
             )).re;
 
             // F = 3b⁴ + 16(ac)² - 16(a²bd - b²ac) - 64a³e
             const f1 = MathPlus.plus(
                 MathPlus.times(
-                    MathPlus.pow(MathPlus.times(b, b), 2),
+                    MathPlus.times(bb, bb),
                     3
                 ),
                 MathPlus.times(
-                    MathPlus.pow(MathPlus.times(a, c), 2),
+                    MathPlus.times(ac, ac),
                     16
                 )
             );
             const f2 = MathPlus.times(MathPlus.minus(
                 MathPlus.times(
-                    MathPlus.times(a, a),
+                    aa,
                     MathPlus.times(b, d)
                 ),
                 MathPlus.times(
-                    MathPlus.times(b, b),
-                    MathPlus.times(a, c)
+                    bb,
+                    ac
                 )
             ), 16);
             const F = Public.zeroCorrect(MathPlus.minus(
                 MathPlus.plus(f1, f2),
                 MathPlus.times(
-                    MathPlus.times(MathPlus.times(a, a), MathPlus.times(a, e)),
+                    MathPlus.times(aa, MathPlus.times(a, e)),
                     64
                 )
             )).re;
 
+            // 以下两种退化情形只依赖 D、E、F，先行判断，命中时无需再计算 A、B、C 与 Δ。
+            // 当D=E=F=0时，方程有一个四重实根
+            if (D.isZero() && E.isZero() && F.isZero()) {
+                return [minusBOverA4];
+            }
+
+            // 当E=F=0，D≠0时，方程有两对二重根；若D＞0，根为实数；若D＜0，根为虚数
+            if (!D.isZero() && E.isZero() && F.isZero()) {
+                const mid2 = MathPlus.times(MathPlus.sqrt(D), inverseMinusA4);
+                return [
+                    MathPlus.plus(minusBOverA4, mid2),
+                    MathPlus.minus(minusBOverA4, mid2)
+                ];
+            }
+
             // A = D² - 3F
             const A = Public.zeroCorrect(MathPlus.minus(
                 MathPlus.times(D, D),
                 MathPlus.times(3, F)
             )).re;
 
+            // E² 在 B 与 C 中各出现一次，只计算一次。
+            const EE = MathPlus.times(E, E);
+
             // B = DF - 9E²
             const B = Public.zeroCorrect(MathPlus.minus(
                 MathPlus.times(D, F),
-                MathPlus.times(MathPlus.times(E, E), 9)
+                MathPlus.times(EE, 9)
             )).re;
 
             // C = F² - 3DE²
             const C = Public.zeroCorrect(MathPlus.minus(
                 MathPlus.times(F, F),
-                MathPlus.times(MathPlus.times(D, MathPlus.times(E, E)), 3)
-            )).re;
-
-            // 计算总判别式 Δ = B² - 4AC。
-            const delta = Public.zeroCorrect(MathPlus.minus(
-                MathPlus.times(B, B),
-                MathPlus.times(MathPlus.times(A, C), 4)
+                MathPlus.times(MathPlus.times(D, EE), 3)
             )).re;
 
-            // 当D=E=F=0时，方程有一个四重实根
-            if (D.isZero() && E.isZero() && F.isZero()) {
-                return [MathPlus.divide(b, MathPlus.times(a, -4))];
-            }
-
             // 当DEF≠0，A=B=C=0时，方程有四个实根，其中有一个三重根
             if (
                 !D.isZero() && !E.isZero() && !F.isZero() &&
@@ -5467,38 +5923,29 @@
                 ];
             }
 
-            // 当E=F=0，D≠0时，方程有两对二重根；若D＞0，根为实数；若D＜0，根为虚数
-            if (!D.isZero() && E.isZero() && F.isZero()) {
-                const mid0 = MathPlus.times(a, -4);
-                const mid1 = MathPlus.divide(b, mid0);
-                const mid2 = MathPlus.divide(MathPlus.sqrt(D), mid0);
-                return [
-                    MathPlus.plus(mid1, mid2),
-                    MathPlus.minus(mid1, mid2)
-                ];
-            }
+            // 计算总判别式 Δ = B² - 4AC。
+            const delta = Public.zeroCorrect(MathPlus.minus(
+                MathPlus.times(B, B),
+                MathPlus.times(MathPlus.times(A, C), 4)
+            )).re;
 
             // 当ABC≠0，Δ=0时，方程有一对二重实根；若AB＞0，则其余两根为不等实根；若AB＜0，则其余两根为共轭虚根
             if (
                 !A.isZero() && !B.isZero() && !C.isZero() &&
                 delta.isZero()
             ) {
-                const mid0 = MathPlus.divide(
-                    b,
-                    MathPlus.times(a, -4)
-                );
-                const mid1 = MathPlus.divide(
+                const mid1 = MathPlus.times(
                     MathPlus.divide(MathPlus.times(MathPlus.times(A, E), 2), B),
-                    MathPlus.times(a, -4)
+                    inverseMinusA4
                 );
-                const root1 = MathPlus.plus(mid0, mid1);
-                const mid2 = MathPlus.minus(mid0, mid1);
-                const mid3 = MathPlus.divide(
+                const root1 = MathPlus.plus(minusBOverA4, mid1);
+                const mid2 = MathPlus.minus(minusBOverA4, mid1);
+                const mid3 = MathPlus.times(
                     MathPlus.sqrt(MathPlus.divide(
                         MathPlus.times(B, 2),
                         A
                     )),
-                    MathPlus.times(a, -4)
+                    inverseMinusA4
                 );
                 return [root1, MathPlus.plus(mid2, mid3), MathPlus.minus(mid2, mid3)];
             }
@@ -5517,8 +5964,7 @@
                     MathPlus.minus(MathPlus.times(D, D), MathPlus.times(A, 3)),
                     MathPlus.minus(MathPlus.times(midZ, midZ), MathPlus.times(D, midZ))
                 ));
-                const mid4 = MathPlus.divide(b, MathPlus.times(a, -4));
-                const mid5 = MathPlus.divide(
+                const mid5 = MathPlus.times(
                     MathPlus.times(
                         MathPlus.sgn(E),
                         MathPlus.sqrt(MathPlus.divide(
@@ -5526,9 +5972,9 @@
                             3
                         ))
                     ),
-                    MathPlus.times(a, 4)
+                    inverseA4
                 );
-                const mid6 = MathPlus.divide(
+                const mid6 = MathPlus.times(
                     MathPlus.sqrt(
                         MathPlus.divide(
                             MathPlus.minus(
@@ -5541,11 +5987,12 @@
                             3
                         )
                     ),
-                    MathPlus.times(a, 4)
+                    inverseA4
                 );
-                const root1 = MathPlus.plus(MathPlus.plus(mid4, mid5), mid6);
-                const root2 = MathPlus.minus(MathPlus.plus(mid4, mid5), mid6);
-                const im = MathPlus.divide(
+                const mid7 = MathPlus.plus(minusBOverA4, mid5);
+                const root1 = MathPlus.plus(mid7, mid6);
+                const root2 = MathPlus.minus(mid7, mid6);
+                const im = MathPlus.times(
                     MathPlus.sqrt(
                         MathPlus.divide(
                             MathPlus.plus(
@@ -5558,9 +6005,9 @@
                             3
                         )
                     ),
-                    MathPlus.times(a, 4)
+                    inverseA4
                 ).re;
-                const re = MathPlus.minus(mid4, mid5).re;
+                const re = MathPlus.minus(minusBOverA4, mid5).re;
                 const root3 = new ComplexNumber([re, im]);
                 const root4 = new ComplexNumber([re, MathPlus.minus(0, im).re]);
                 return [root1, root2, root3, root4];
@@ -5572,53 +6019,27 @@
                 const mid0 = MathPlus.times(MathPlus.sqrt(F), 2);
                 const mid1 = MathPlus.sqrt(MathPlus.plus(D, mid0));
                 const mid2 = MathPlus.sqrt(MathPlus.minus(D, mid0));
-                const mid3 = MathPlus.times(a, -4);
-                const root1 = MathPlus.divide(
-                    MathPlus.minus(b, mid1),
-                    mid3
-                );
-                const root2 = MathPlus.divide(
-                    MathPlus.plus(b, mid1),
-                    mid3
-                );
-                const root3 = MathPlus.divide(
-                    MathPlus.minus(b, mid2),
-                    mid3
-                );
-                const root4 = MathPlus.divide(
-                    MathPlus.plus(b, mid2),
-                    mid3
-                );
+                const root1 = MathPlus.times(MathPlus.minus(b, mid1), inverseMinusA4);
+                const root2 = MathPlus.times(MathPlus.plus(b, mid1), inverseMinusA4);
+                const root3 = MathPlus.times(MathPlus.minus(b, mid2), inverseMinusA4);
+                const root4 = MathPlus.times(MathPlus.plus(b, mid2), inverseMinusA4);
                 return [root1, root2, root3, root4];
             }
 
             // 若E=0,F＜0
             if (E.isZero() && F.isNegative()) {
-                const mid0 = MathPlus.divide(
-                    b,
-                    MathPlus.times(a, -4)
+                // 1/(8a) = 1/(4a) / 2；√(A - F) 在实部与虚部中各用一次，只开方一次。
+                const inverseA8 = MathPlus.times(inverseA4, '0.5');
+                const sqrtAF = MathPlus.sqrt(MathPlus.minus(A, F));
+                const mid1 = MathPlus.times(
+                    MathPlus.sqrt(MathPlus.times(MathPlus.plus(sqrtAF, D), 2)),
+                    inverseA8
                 );
-                const mid1 = MathPlus.divide(
-                    MathPlus.sqrt(MathPlus.times(
-                        MathPlus.plus(
-                            MathPlus.sqrt(MathPlus.minus(A, F)),
-                            D
-                        ),
-                        2
-                    )),
-                    MathPlus.times(a, 8)
-                );
-                const re1 = MathPlus.plus(mid0, mid1).re;
-                const re2 = MathPlus.minus(mid0, mid1).re;
-                const im = MathPlus.divide(
-                    MathPlus.sqrt(MathPlus.times(
-                        MathPlus.minus(
-                            MathPlus.sqrt(MathPlus.minus(A, F)),
-                            D
-                        ),
-                        2
-                    )),
-                    MathPlus.times(a, 8)
+                const re1 = MathPlus.plus(minusBOverA4, mid1).re;
+                const re2 = MathPlus.minus(minusBOverA4, mid1).re;
+                const im = MathPlus.times(
+                    MathPlus.sqrt(MathPlus.times(MathPlus.minus(sqrtAF, D), 2)),
+                    inverseA8
                 ).re;
                 const root1 = new ComplexNumber([re1, im]);
                 const root2 = new ComplexNumber([re1, MathPlus.minus(0, im).re]);
@@ -5643,7 +6064,7 @@
                 ct = MathPlus.divide(MathPlus.arccos(T.re.isPositive() ? 1 : -1), 3);
             }
             const cosCT = MathPlus.cos(ct);
-            const sinCT = MathPlus.times(MathPlus.sin(ct), MathPlus.sqrt(3));
+            const sinCT = MathPlus.times(MathPlus.sin(ct), CalcConfig.constants.sqrt_3);
             const y1 = MathPlus.sqrt(MathPlus.divide(
                 MathPlus.minus(
                     D,
@@ -5665,53 +6086,41 @@
                 ),
                 3
             ));
+            // 三个平方根 y1、y2、y3 均只开方一次；sgn(E)·y1 在下面两个分支中各用到两次，同样只计算一次。
+            const signedY1 = MathPlus.times(y1, MathPlus.sgn(E));
 
             // 当D与F均为正时，有四个实数根
             if (!E.isZero() && F.isPositive() && D.isPositive()) {
                 const mid1 = MathPlus.plus(y2, y3);
                 const mid2 = MathPlus.minus(y2, y3);
-                const mid3 = MathPlus.minus(
-                    MathPlus.times(y1, MathPlus.sgn(E)),
-                    b
-                );
-                const mid4 = MathPlus.minus(0, MathPlus.plus(
-                    MathPlus.times(y1, MathPlus.sgn(E)),
-                    b
-                ));
+                const mid3 = MathPlus.minus(signedY1, b);
+                const mid4 = MathPlus.minus(0, MathPlus.plus(signedY1, b));
                 const numerator1 = MathPlus.plus(mid3, mid1);
                 const numerator2 = MathPlus.minus(mid3, mid1);
                 const numerator3 = MathPlus.plus(mid4, mid2);
                 const numerator4 = MathPlus.minus(mid4, mid2);
-                const denominator = MathPlus.times(a, 4);
                 return [
-                    MathPlus.divide(numerator1, denominator),
-                    MathPlus.divide(numerator2, denominator),
-                    MathPlus.divide(numerator3, denominator),
-                    MathPlus.divide(numerator4, denominator)
+                    MathPlus.times(numerator1, inverseA4),
+                    MathPlus.times(numerator2, inverseA4),
+                    MathPlus.times(numerator3, inverseA4),
+                    MathPlus.times(numerator4, inverseA4)
                 ];
             }
 
             // 当D或F中有非正值时，有四个虚根
-            const mid1 = MathPlus.plus(
-                MathPlus.times(MathPlus.sgn(E), y1),
-                y3
-            );
-            const mid2 = MathPlus.minus(
-                MathPlus.times(MathPlus.sgn(E), y1),
-                y3
-            );
+            const mid1 = MathPlus.plus(signedY1, y3);
+            const mid2 = MathPlus.minus(signedY1, y3);
             const mid3 = MathPlus.minus(0, MathPlus.plus(y2, b));
             const mid4 = MathPlus.minus(y2, b);
             const numerator1 = MathPlus.plus(mid3, mid1);
             const numerator2 = MathPlus.minus(mid3, mid1);
             const numerator3 = MathPlus.plus(mid4, mid2);
             const numerator4 = MathPlus.minus(mid4, mid2);
-            const denominator = MathPlus.times(a, 4);
             return [
-                MathPlus.divide(numerator1, denominator),
-                MathPlus.divide(numerator2, denominator),
-                MathPlus.divide(numerator3, denominator),
-                MathPlus.divide(numerator4, denominator)
+                MathPlus.times(numerator1, inverseA4),
+                MathPlus.times(numerator2, inverseA4),
+                MathPlus.times(numerator3, inverseA4),
+                MathPlus.times(numerator4, inverseA4)
             ];
         }
 
@@ -5740,11 +6149,11 @@
             const result = {};
             // 从列表中提取多项式系数 a, b, c, d, e，并确保它们是 BigNumber 实例的实部。
             const
-                inputA = Public.zeroCorrect(MathPlus.calc(list[0])[0]),
-                inputB = Public.zeroCorrect(MathPlus.calc(list[1])[0]),
-                inputC = Public.zeroCorrect(MathPlus.calc(list[2])[0]),
-                inputD = Public.zeroCorrect(MathPlus.calc(list[3])[0]),
-                inputE = Public.zeroCorrect(MathPlus.calc(list[4])[0]);
+                inputA = MathPlus._calcInput(list[0]),
+                inputB = MathPlus._calcInput(list[1]),
+                inputC = MathPlus._calcInput(list[2]),
+                inputD = MathPlus._calcInput(list[3]),
+                inputE = MathPlus._calcInput(list[4]);
             if (!inputA.onlyReal || !inputB.onlyReal || !inputC.onlyReal || !inputD.onlyReal || !inputE.onlyReal) {
                 throw new Error('[PowerFunctionTools] Complex number appear in the input.');
             }
@@ -5776,21 +6185,25 @@
                     result[a.isPositive() ? 'maximumPoint' : 'minimumPoint'] = [['null', 'null']];
                     result[a.isPositive() ? 'minimumPoint' : 'maximumPoint'] = [[point, minMax]];
                 } else if (diff1Roots.length === 3) {
-                    const minMax1 = PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[0]);
-                    const minMax2 = PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[1]);
-                    const minMax3 = PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[2]);
-                    const minMaxList = PowerFunctionTools._sort([minMax1, minMax2, minMax3]);
-                    const realMinMax = Public.idealizationToString(a.isPositive() ? minMaxList[0] : minMaxList[2]);
+                    const [minMax1, minMax2, minMax3] = PowerFunctionTools._getPowerFunctionValues(list, diff1Roots);
+                    // 只需三个极值中的最小值（a > 0）或最大值（a < 0），逐个比较即可，不必整体排序。
+                    const order = a.isPositive() ? -1 : 1;
+                    let extremum = MathPlus._compare(minMax2.re, minMax1.re) === order ? minMax2 : minMax1;
+                    if (MathPlus._compare(minMax3.re, extremum.re) === order) {
+                        extremum = minMax3;
+                    }
+                    const realMinMax = Public.idealizationToString(extremum);
                     result.range = a.isPositive() ? [realMinMax, '+inf'] : ['-inf', realMinMax];
                     const point1 = Public.idealizationToString(diff1Roots[0]),
                         point2 = Public.idealizationToString(diff1Roots[1]),
                         point3 = Public.idealizationToString(diff1Roots[2]);
                     result[a.isPositive() ? 'increasingInterval' : 'decreasingInterval'] = [[point1, point2], [point3, '+inf']];
                     result[a.isPositive() ? 'decreasingInterval' : 'increasingInterval'] = [['-inf', point1], [point2, point3]];
-                    result[a.isPositive() ? 'maximumPoint' : 'minimumPoint'] = [[point2, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[1]))]];
+                    // 三个极值已在上方求出，直接复用，无需再对多项式求值。
+                    result[a.isPositive() ? 'maximumPoint' : 'minimumPoint'] = [[point2, Public.idealizationToString(minMax2)]];
                     result[a.isPositive() ? 'minimumPoint' : 'maximumPoint'] = [
-                        [point1, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[0]))],
-                        [point3, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[2]))]
+                        [point1, Public.idealizationToString(minMax1)],
+                        [point3, Public.idealizationToString(minMax3)]
                     ];
                 }
 
@@ -5804,9 +6217,10 @@
                         point2 = Public.idealizationToString(diff2Roots[1]);
                     result[a.isPositive() ? 'convexInterval' : 'concaveInterval'] = [[point1, point2]];
                     result[a.isPositive() ? 'concaveInterval' : 'convexInterval'] = [['-inf', point1], [point2, '+inf']];
+                    const [inflection1, inflection2] = PowerFunctionTools._getPowerFunctionValues(list, diff2Roots);
                     result.inflectionPoint = [
-                        [point1, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff2Roots[0]))],
-                        [point2, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff2Roots[1]))]
+                        [point1, Public.idealizationToString(inflection1)],
+                        [point2, Public.idealizationToString(inflection2)]
                     ];
                 }
 
@@ -5841,8 +6255,9 @@
                         point2 = Public.idealizationToString(diff1Roots[1]);
                     result[b.isPositive() ? 'increasingInterval' : 'decreasingInterval'] = [['-inf', point1], [point2, '+inf']];
                     result[b.isPositive() ? 'decreasingInterval' : 'increasingInterval'] = [[point1, point2]];
-                    result[b.isPositive() ? 'maximumPoint' : 'minimumPoint'] = [[point1, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[0]))]];
-                    result[b.isPositive() ? 'minimumPoint' : 'maximumPoint'] = [[point2, Public.idealizationToString(PowerFunctionTools._getPowerFunctionValue(list, diff1Roots[1]))]];
+                    const [minMax1, minMax2] = PowerFunctionTools._getPowerFunctionValues(list, diff1Roots);
+                    result[b.isPositive() ? 'maximumPoint' : 'minimumPoint'] = [[point1, Public.idealizationToString(minMax1)]];
+                    result[b.isPositive() ? 'minimumPoint' : 'maximumPoint'] = [[point2, Public.idealizationToString(minMax2)]];
                 }
 
                 // --- 分析凹凸性和拐点 ---
@@ -5946,9 +6361,10 @@
          * 此方法返回一个表示该公式的字符串，以及一个用于计算特定 k 值根的函数。
          * @param {ComplexNumber|string|number} z - 需要开方的复数（被开方数）。
          * @param {ComplexNumber|string|number} n - 根指数。
-         * @returns {[string, function(ComplexNumber|string|number): ComplexNumber]} 一个包含两个元素的数组：
+         * @returns {[string, function(ComplexNumber|string|number): ComplexNumber, function(number): Array<ComplexNumber>]} 一个包含三个元素的数组：
          * - [0]: 格式化后的通项公式字符串，例如 "2toPolar(π/6 + k*π/3)"。
          * - [1]: 一个函数，接收整数 k 作为参数，并返回第 k 个根的 ComplexNumber 实例。
+         * - [2]: 一个函数，接收个数 count，一次性返回 k = 0, 1, ..., count-1 的根（见 `_numericalRoots`）。
          */
         static _generalFormula(z, n) {
             // 将输入统一转换为 ComplexNumber 实例。
@@ -5966,10 +6382,7 @@
             // 计算新辐角的常数部分：θ/n。
             const argumentConstant = MathPlus.times(realPow, arg);
             // 计算新辐角中随 k 变化的部分：2kπ/n。
-            const argumentConstantK = MathPlus.times(
-                MathPlus.times(2, CalcConfig.constants.pi),
-                realPow
-            );
+            const argumentConstantK = MathPlus.times(CalcConfig.constants.twoPi, realPow);
             // 将模和辐角部分格式化为字符串，以便显示。
             const lengthPart = Public.idealizationToString(length);
             const argumentPart = Public.funcToString([argumentConstant, argumentConstantK], 'powerFunc', '[k]');
@@ -5990,10 +6403,47 @@
                 x => MathPlus.toPolar(
                     length,
                     MathPlus.plus(argumentConstant, MathPlus.times(x, argumentConstantK))
-                )
+                ),
+                // 一个函数，用于一次性计算前 count 个根。
+                count => RadicalFunctionTools._numericalRoots(length, argumentConstant, argumentConstantK, n, count)
             ];
         }
 
+        /**
+         * @private
+         * @static
+         * @method _numericalRoots (内部辅助方法)
+         * @description 一次性计算 k = 0, 1, ..., count-1 的前 count 个根。
+         * 相邻两根的辐角相差 2π/n，因此 w_(k+1) = w_k * ω，其中 ω = cos(2π/n) + i*sin(2π/n)。
+         * 整个列表只需要为 w_0 和 ω 各做一次三角函数求值，其余的根都只是一次复数乘法。
+         * n 为偶数时 w_(k+n/2) = -w_k，后半部分的根直接取前半部分的相反数。
+         * 每次乘法的舍入误差会沿递推累积，但 count 不超过 `RADICAL_FUNCTION_MAX_SHOW_RESULTS`，
+         * 最后一个根与直接调用 toPolar 的差别只在末一两位，因此不需要中途用三角函数重新校准。
+         * @param {ComplexNumber} length - 根的模长 r^(1/n)。
+         * @param {ComplexNumber} argumentConstant - 第 0 个根的辐角 θ/n。
+         * @param {ComplexNumber} argumentConstantK - 相邻两根的辐角差 2π/n。
+         * @param {ComplexNumber} n - 根指数（正整数）。
+         * @param {number} count - 需要计算的根的个数，不超过 n。
+         * @returns {Array<ComplexNumber>} 按 k 从小到大排列的根。
+         */
+        static _numericalRoots(length, argumentConstant, argumentConstantK, n, count) {
+            const roots = [MathPlus.toPolar(length, argumentConstant)];
+            if (count === 1) {
+                return roots;
+            }
+            // 只有在需要列出后半部分时才利用对称性；否则 half 不小于 count，循环会计算全部的根。
+            const index = n.re.mantissa * 10n ** BigInt(n.re.power);
+            const half = (index & 1n) === 0n ? Number(index >> 1n) : count;
+            const rotation = MathPlus.toPolar([0, 1n, length.acc], argumentConstantK);
+            while (roots.length < Math.min(count, half)) {
+                roots.push(MathPlus.times(roots[roots.length - 1], rotation));
+            }
+            while (roots.length < count) {
+                roots.push(MathPlus._oppositeNumber(roots[roots.length - half]));
+            }
+            return roots;
+        }
+
         /**
          * @static
          * @method radicalFunctionAnalysis
@@ -6013,8 +6463,8 @@
          */
         static radicalFunctionAnalysis(z, n) {
             // 将 z,n 转换为 ComplexNumber 实例。
-            z = Public.zeroCorrect(MathPlus.calc(z)[0]);
-            n = Public.integerCorrect(Public.zeroCorrect(MathPlus.calc(n)[0]));
+            z = MathPlus._calcInput(z);
+            n = Public.integerCorrect(MathPlus._calcInput(n));
             // 验证 n 是否为正整数。
             if (!n.onlyReal || n.re.power < 0 || !n.re.isPositive()) {
                 throw new Error('[radicalFunctionTools] n can only be a positive integer.');
@@ -6037,13 +6487,11 @@
                 result.overflow = true;
             } else {
                 // 否则，显示所有 n 个解。
-                count = n;
+                count = Number(n.re.mantissa * 10n ** BigInt(n.re.power));
                 result.overflow = false;
             }
-            // 使用 functionValueList 计算从 k=0 到 count-1 的所有根的数值。
-            result.numericalResults = Public.idealizationToString(
-                Public.functionValueList(innerResult[1], 0, 1, MathPlus.minus(count, 1))
-            );
+            // 一次性计算从 k=0 到 count-1 的所有根的数值。
+            result.numericalResults = Public.idealizationToString(innerResult[2](count));
             // 返回最终的结构化结果。
             return result;
         }
@@ -6068,6 +6516,33 @@
             throw new Error('[FuncValueListTools] FuncValueListTools is a static class and should not be instantiated.');
         }
 
+        /**
+         * @private
+         * @static
+         * @method _compile
+         * @description 将函数表达式预先解析并编译为 RPN 程序，返回一个只执行求值阶段的单变量函数。
+         * 表达式的编译结果与 x 无关，因此在整个取值区间上只编译一次。
+         * 如果解析失败，返回的函数在每次调用时都抛出同一个错误，与逐点调用 `MathPlus.calc` 的行为一致。
+         * @param {string} expr - 函数的表达式字符串。
+         * @param {object} context - 求值时传入的另一个自定义函数，例如 `{g: g}`。
+         * @returns {function(ComplexNumber): ComplexNumber} 以 x 为参数的求值函数。
+         */
+        static _compile(expr, context) {
+            // 非字符串输入（数字等）不需要解析，直接交给 calc 处理。
+            if (Public.typeOf(expr) !== 'string') {
+                return x => MathPlus.calc(expr, {...context, unknown: x})[0];
+            }
+            let program;
+            try {
+                [program] = MathPlus._compileExpression(expr);
+            } catch (error) {
+                return () => {
+                    throw error;
+                };
+            }
+            return x => MathPlus._evaluateRPN(program, {...context, unknown: x});
+        }
+
         /**
          * @static
          * @method valueList
@@ -6094,9 +6569,9 @@
         static valueList(f, g, start, step, end) {
             let overflow = false;
             // 步骤 1: 将区间的起始、步长和结束值转换为高精度的 ComplexNumber 实例，并修正潜在的浮点误差。
-            start = Public.zeroCorrect(MathPlus.calc(start)[0]);
-            step = Public.zeroCorrect(MathPlus.calc(step)[0]);
-            end = Public.zeroCorrect(MathPlus.calc(end)[0]);
+            start = MathPlus._calcInput(start);
+            step = MathPlus._calcInput(step);
+            end = MathPlus._calcInput(end);
 
             // 步骤 2: 验证输入参数的有效性。
             // 确保区间的定义（起始、步长、结束）都是实数。
@@ -6116,7 +6591,7 @@
             // 这个列表将用于函数求值，并作为结果的一部分返回。
             const varList = [];
             let i = start;
-            for (; !MathPlus.minus(i, end).re.isPositive() && varList.length < CalcConfig.VALUE_LIST_MAX_SHOW_RESULTS; i = MathPlus.plus(i, step)) {
+            for (; varList.length < CalcConfig.VALUE_LIST_MAX_SHOW_RESULTS && !MathPlus.minus(i, end).re.isPositive(); i = MathPlus.plus(i, step)) {
                 varList.push(Public.idealizationToString(i));
             }
 
@@ -6129,11 +6604,11 @@
             // 为函数 f(x) 生成值列表。
             // Public.functionValueList 会遍历从 start 到 end 的范围。
             // 对于范围内的每个值 x，它会调用传入的匿名函数。
-            // 该匿名函数使用 MathPlus.calc 来计算 f 的表达式。
-            // 关键点：在调用 calc 时，将函数 g 的表达式作为依赖传入，
+            // 该匿名函数对 f 的表达式求值（解析只在循环开始前执行一次）。
+            // 关键点：在求值时，将函数 g 的表达式作为依赖传入，
             // 这样在 f 的表达式中就可以通过 'g(x)' 来调用它。
             const resultF = Public.idealizationToString(Public.functionValueList(
-                x => MathPlus.calc(f, {g: g, unknown: x})[0],
+                FuncValueListTools._compile(f, {g: g}),
                 start, step, end
             ));
 
@@ -6141,7 +6616,7 @@
             // 逻辑与 f(x) 相同，但这次将 f 的表达式作为依赖传入，
             // 这样在 g 的表达式中就可以通过 'f(x)' 来调用它。
             const resultG = Public.idealizationToString(Public.functionValueList(
-                x => MathPlus.calc(g, {f: f, unknown: x})[0],
+                FuncValueListTools._compile(g, {f: f}),
                 start, step, end
             ));
 
@@ -442,4 +442,9 @@ window.addEventListener('load', () => {
     );
 
     HtmlTools.scrollToView();
+
+    // 设置恢复完毕后预热计算 Worker，减少第一次计算的等待时间；
+    // 预热只是尽力而为，排队或执行期间被取消、重启或超时都不应变成未处理的 Promise 拒绝
+    WorkerTools.warmUp().catch(() => {
+    });
 });
\ No newline at end of file
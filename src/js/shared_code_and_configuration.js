@@ -119,6 +119,38 @@
          */
         static MAX_TOKEN_LENGTH = 9;
 
+        /**
+         * @private
+         * @static
+         * @type {RegExp}
+         * @description 分词器使用的粘性正则，从指定位置取出至多 MAX_TOKEN_LENGTH 个字母字符。
+         */
+        static _tokenWordRegex = new RegExp(`[a-zA-Z\\[\\]]{1,${this.MAX_TOKEN_LENGTH}}`, 'y');
+
+        /**
+         * @private
+         * @static
+         * @type {RegExp}
+         * @description 分词器使用的粘性正则，从指定位置取出连续的数字与小数点。
+         */
+        static _tokenNumberRegex = /[0-9.]+/y;
+
+        /**
+         * @private
+         * @static
+         * @type {Map<string, object>}
+         * @description 所有合法符号的词法单元信息表，在类加载时由 `getTokenInfo` 预先生成并冻结。
+         * 调度场算法与括号处理对每个 token 都会查询信息，查表避免了每次重新构建对象。
+         */
+        static _tokenInfoTable = new Map();
+
+        // 静态初始化块：为 TokenConfig.allSigns 中的每个符号预先生成信息对象。
+        static {
+            for (const token of TokenConfig.allSigns) {
+                this._tokenInfoTable.set(token, Object.freeze(this.getTokenInfo(token)));
+            }
+        }
+
         /**
          * @constructor
          * @description Public 的构造函数。
@@ -162,11 +194,21 @@
          */
         static typeOf = value => Object.prototype.toString.call(value).slice(8, -1).toLowerCase();
 
+        /**
+         * @static
+         * @method isCalculationError
+         * @description 判断捕获到的异常是否属于计算本身的失败，例如除以零、定义域错误、方程组无唯一解或输入格式错误。
+         * 这类异常都以普通 `Error` 抛出，调用方应将其显示为 'error'；`TypeError` 与 `ReferenceError` 只会由代码缺陷引起，应继续向上抛出。
+         * @param {*} error - 捕获到的异常。
+         * @returns {boolean} 属于计算失败时返回 true。
+         */
+        static isCalculationError = error => !(error instanceof TypeError || error instanceof ReferenceError);
+
         /**
          * @static
          * @method zeroCorrect
          * @description 修正潜在的浮点计算误差，将绝对值极小的数“修正”为零。
-         * 它创建一个基于输入精度的极小阈值，如果输入数字的绝对值小于此阈值，则将其视为零。
+         * 它根据输入精度确定一个极小阈值，如果输入数字的绝对值（按数量级比较）小于此阈值，则将其视为零。
          * 这有助于清理那些本应为零但因计算误差而产生的微小非零结果（例如 1e-250）。
          * @param {string|number|bigint|BigNumber|ComplexNumber|Array} x - 需要修正的输入数字。
          * @returns {ComplexNumber} 修正后的 ComplexNumber 实例。
@@ -182,12 +224,17 @@
              */
             function _bigNumberZeroCorrect(input) {
                 const acc = input.acc;
-                // 创建一个极小的阈值 (smallNum)。
+                if (input.mantissa === 0n) {
+                    return input;
+                }
+                // 极小的阈值为 10^(-threshold)。
                 // 如果一个数的绝对值小于这个阈值，我们就可以安全地认为它在计算上等同于零。
                 // 阈值的选择是基于精度的，通常是精度的一个比例或略低于精度，以捕捉浮点误差。
-                const smallNum = new ComplexNumber([-Math.max(Math.floor(0.9 * acc), acc - 8), 1n, acc]);
-                // 比较 |input| 和 smallNum。如果 |input| < smallNum，则返回 0。
-                if (MathPlus.minus(smallNum, MathPlus.abs(input)).re.isPositive()) {
+                const threshold = Math.max(Math.floor(0.9 * acc), acc - 8);
+                // |input| 的最高位数量级为 power + len - 1，直接比较数量级即可判断 |input| < 10^(-threshold)，
+                // 无需构造阈值对象并执行减法。
+                const mantissaLen = (input.mantissa < 0n ? -input.mantissa : input.mantissa).toString().length;
+                if (input.power + mantissaLen - 1 < -threshold) {
                     return new BigNumber([0, 0n, acc]);
                 }
                 // 如果大于阈值，则返回原始输入。
@@ -309,6 +356,64 @@
             }
         }
 
+        /**
+         * @private
+         * @static
+         * @method _termToString
+         * @description (内部辅助方法) 将一个非零系数与变量部分拼接成单个项的字符串。
+         * 系数为 1 或 -1 时省略数字 (例如 'x' 而不是 '1x')，科学记数法的系数用括号括起来。
+         * @param {string} coefficient - 已格式化的非零系数字符串。
+         * @param {string} variable - 变量部分，例如 '[x]' 或 '[x]^2'。
+         * @param {boolean} [isFirst=true] - 是否为表达式的第一项。非首项在系数不是负数（或为科学记数法）时前置 '+'。
+         * @returns {string} 格式化后的项。
+         */
+        static _termToString(coefficient, variable, isFirst = true) {
+            const sign = !isFirst && (coefficient[0] !== '-' || coefficient.includes('E')) ? '+' : '';
+            if (coefficient === '1') {
+                return `${sign}${variable}`;
+            }
+            if (coefficient === '-1') {
+                return `-${variable}`;
+            }
+            return coefficient.includes('E') ? `${sign}(${coefficient})${variable}` : `${sign}${coefficient}${variable}`;
+        }
+
+        /**
+         * @private
+         * @static
+         * @method _polynomialToString
+         * @description (内部辅助方法) 将已格式化的系数列表 `[a₀, a₁, ..., aₙ]` 拼接成 `aₙxⁿ + ... + a₁x + a₀` 形式的字符串。
+         * @param {Array<string>} list - 已经过 `idealizationToString` 处理的系数字符串列表。
+         * @param {string} asX - 代表变量的字符串。
+         * @returns {string} 格式化后的多项式字符串，所有系数都为零时返回 '0'。
+         */
+        static _polynomialToString(list, asX) {
+            let result = '';
+            // 用于控制在非首个非零项前添加 '+' 号。
+            let firstNoneZero = false;
+            // 从最高次项开始倒序遍历系数，忽略系数为零的项。
+            for (let i = list.length - 1; i >= 0; i--) {
+                const currentCoefficient = list[i];
+                if (currentCoefficient === '0') {
+                    continue;
+                }
+                if (i !== 0) {
+                    // --- 处理变量项 (x, x², x³, ...)，指数不为 1 时添加 '^' 和指数值 ---
+                    result += Public._termToString(currentCoefficient, i === 1 ? asX : `${asX}^${i}`, !firstNoneZero);
+                } else {
+                    // --- 处理常数项 (i=0) ---
+                    if (firstNoneZero && (currentCoefficient[0] !== '-' || currentCoefficient.includes('E'))) {
+                        result += '+';
+                    }
+                    // 如果常数项是科学记数法，并且是多项式中的唯一项，则不加括号。
+                    result += !currentCoefficient.includes('E') || list.length === 1 ? currentCoefficient : `(${currentCoefficient})`;
+                }
+                firstNoneZero = true;
+            }
+            // 如果遍历完所有系数都没有找到非零项，则函数为 0。
+            return firstNoneZero ? result : '0';
+        }
+
         /**
          * @static
          * @method funcToString
@@ -342,60 +447,13 @@
 
             switch (mode) {
                 // --- 多项式函数模型: aₙxⁿ + ... + a₁x + a₀ ---
-                case 'powerFunc': {
-                    // 用于控制在非首个非零项前添加 '+' 号。
-                    let firstNoneZero = false;
-                    // 从最高次项开始倒序遍历系数。
-                    for (let i = list.length - 1; i >= 0; i--) {
-                        const currentCoefficient = list[i];
-                        // 忽略系数为零的项。
-                        if (currentCoefficient !== '0') {
-                            // 如果不是第一个非零项，并且系数不是负数（或包含'E'的科学记数法），则添加 '+'。
-                            if (firstNoneZero && (currentCoefficient[0] !== '-' || currentCoefficient.includes('E'))) {
-                                result += '+';
-                            }
-                            firstNoneZero = true;
-
-                            // --- 处理变量项 (x, x², x³, ...) ---
-                            if (i !== 0) {
-                                // 特殊处理系数为 1 或 -1 的情况，以简化表达式 (例如 'x' 而不是 '1x')。
-                                if (currentCoefficient === '1') {
-                                    result += asX;
-                                } else if (currentCoefficient === '-1') {
-                                    result += `-${asX}`;
-                                } else if (currentCoefficient.includes('E')) {
-                                    // 如果系数是科学记数法，则用括号括起来。
-                                    result += `(${currentCoefficient})${asX}`;
-                                } else {
-                                    result += `${currentCoefficient}${asX}`;
-                                }
-                            }
-                            // --- 处理常数项 (i=0) ---
-                            else if (!currentCoefficient.includes('E')) {
-                                result += currentCoefficient;
-                            } else {
-                                // 如果常数项是科学记数法，并且是多项式中的唯一项，则不加括号。
-                                result += list.length === 1 ? currentCoefficient : `(${currentCoefficient})`;
-                            }
-
-                            // --- 添加指数部分 ---
-                            // 如果指数不为 0 或 1，则添加 '^' 和指数值。
-                            if (![0, 1].includes(i)) {
-                                result += `^${i}`;
-                            }
-                        }
-                    }
-                    // 如果遍历完所有系数都没有找到非零项，则函数为 0。
-                    if (!firstNoneZero) {
-                        return '0';
-                    }
-                    return result;
-                }
+                case 'powerFunc':
+                    return Public._polynomialToString(list, asX);
 
                 // --- 对数多项式模型: aₙ(lnx)ⁿ + ... + a₀ ---
                 // 这是 powerFunc 的一个特例，只需将变量替换为 'ln(x)'。
                 case 'lnFunc':
-                    return Public.funcToString(list, 'powerFunc', `ln(${asX})`);
+                    return Public._polynomialToString(list, `ln(${asX})`);
 
                 // --- 指数函数模型: a * exp(b*x) ---
                 case 'expFunc':
@@ -407,9 +465,8 @@
                     if (b === '0') {
                         return a;
                     }
-                    // 递归调用 funcToString 来格式化表达式。
                     // 外层是 a * [variable]，内层是 exp(b*x)。
-                    return Public.funcToString([0, a], 'powerFunc', `exp(${Public.funcToString([0, b], 'powerFunc')})`);
+                    return Public._termToString(a, `exp(${Public._termToString(b, asX)})`);
 
                 // --- 指数函数模型: a * b^x ---
                 case 'abxFunc':
@@ -448,8 +505,12 @@
                     } else {
                         result += `${asX}^(${b})`;
                     }
-                    // 递归调用 funcToString 来处理系数 a。
-                    return Public.funcToString([0, a], 'powerFunc', result);
+                    // 如果 a=0，整个函数为 0。
+                    if (a === '0') {
+                        return '0';
+                    }
+                    // 与系数 a 拼接。
+                    return Public._termToString(a, result);
 
                 // --- 反比例函数模型: a + b/x ---
                 case 'reciprocalFunc':
@@ -500,9 +561,12 @@
                 try {
                     // 调用函数，并传入当前的循环变量 'i'。
                     result.push(func(i));
-                } catch {
-                    // 如果在函数求值过程中发生任何错误（例如，除以零、无效的数学运算），
-                    // 则捕获异常，并在结果数组中对应位置添加 'error' 字符串。
+                } catch (error) {
+                    // 如果在函数求值过程中发生计算错误（例如，除以零、无效的数学运算），
+                    // 则在结果数组中对应位置添加 'error' 字符串；代码缺陷则照常抛出。
+                    if (!Public.isCalculationError(error)) {
+                        throw error;
+                    }
                     result.push('error');
                 }
             }
@@ -516,6 +580,7 @@
          * @description 分析一个词法单元（token），返回其包含完整元数据的对象。
          * 此函数是词法分析器的核心，它为后续的语法分析（如调度场算法）提供了正确解析运算符优先级、
          * 结合性、函数参数数量等所需的所有信息。
+         * 合法符号的信息对象来自预先生成的只读表，调用方不应修改返回值。
          *
          * @param {string} token - 要分析的词法单元字符串，例如 `"+"`, `"sin"`, `"pi"`, `"5"`。
          *
@@ -557,6 +622,12 @@
                 return;
             }
 
+            // 合法符号直接查表返回。
+            const cached = Public._tokenInfoTable.get(token);
+            if (cached !== undefined) {
+                return cached;
+            }
+
             const result = {token: token};
 
             // 标记是否为在 HTML 中只占用一个类名的函数
@@ -641,17 +712,19 @@
         static tokenizer(str, {baseNumberMode = 'separate', strictMode = true} = {}) {
             // 初始化一个空数组，用于存储最终的词法单元列表。
             const result = [];
+            const wordRegex = Public._tokenWordRegex;
+            const numberRegex = Public._tokenNumberRegex;
             // 遍历输入字符串的每个字符。
             for (let i = 0; i < str.length; i++) {
-                const currentI = str[i];
+                // 粘性正则从当前位置起一次取出至多 MAX_TOKEN_LENGTH 个字母字符。
+                wordRegex.lastIndex = i;
+                const temp = wordRegex.exec(str)?.[0];
 
                 // --- 分支 1: 处理非字母字符 (如运算符, 数字, 括号等) ---
-                // 使用正则表达式快速判断当前字符是否为非字母，这通常比检查一个巨大的字符列表更高效。
-                if (currentI.match(/[^a-zA-Z\[\]]/)) {
-                    // 获取该字符的详细信息（类型、类别等）。
-                    const tokenInfo = Public.getTokenInfo(currentI);
-                    // 如果是无法识别的单个字符，则立即返回错误。
-                    if (tokenInfo.class === 'illegal') {
+                if (temp === undefined) {
+                    const currentI = str[i];
+                    // 单个非字母字符只有出现在全量符号表中才合法（数字与小数点也在其中）。
+                    if (!TokenConfig.allSigns.has(currentI)) {
                         if (strictMode) {
                             return ['error', i];
                         }
@@ -659,26 +732,23 @@
                         continue;
                     }
                     // 如果当前字符是数字或小数点，并且模式设置为 'together'...
-                    if (baseNumberMode === 'together' && tokenInfo.numClass === 'baseNumber') {
-                        let token = '';
-                        let decimalPoint = false; // 用于跟踪是否已遇到小数点。
-                        // ...则进入一个内部循环，以贪婪模式向前查找，构建完整的数字字符串。
-                        while (i < str.length && Public.getTokenInfo(str[i]).numClass === 'baseNumber') {
-                            token += str[i];
-                            // 在严格模式下，检查并处理小数点，确保一个数字中最多只有一个小数点。
-                            if (str[i] === '.' && strictMode) {
-                                if (decimalPoint) {
-                                    return ['error', i]; // 发现第二个小数点，格式错误。
-                                }
-                                decimalPoint = true;
+                    if (baseNumberMode === 'together' && TokenConfig.baseNumbers.has(currentI)) {
+                        // ...则以贪婪模式一次取出完整的数字字符串。
+                        numberRegex.lastIndex = i;
+                        const token = numberRegex.exec(str)[0];
+                        // 在严格模式下，确保一个数字中最多只有一个小数点。
+                        if (strictMode) {
+                            const firstPoint = token.indexOf('.');
+                            const secondPoint = firstPoint === -1 ? -1 : token.indexOf('.', firstPoint + 1);
+                            if (secondPoint !== -1) {
+                                return ['error', i + secondPoint]; // 发现第二个小数点，格式错误。
+                            }
+                            if (token === '.') {
+                                return ['error', i];
                             }
-                            i += 1; // 向前移动索引。
-                        }
-                        if (token === '.' && strictMode) {
-                            return ['error', i - 1];
                         }
                         result.push(token); // 将构建好的完整数字词法单元推入结果数组。
-                        i -= 1; // 回退一个字符，因为外层 for 循环的 i++ 会跳过下一个字符。
+                        i += token.length - 1; // 外层 for 循环的 i++ 会移动到下一个字符。
                     } else {
                         // 如果是其他合法的非字母字符（如 '+', '(', ')'），或在 'separate' 模式下，直接将其作为单个词法单元。
                         result.push(currentI);
@@ -687,19 +757,15 @@
                 }
 
                 // --- 分支 2: 处理字母开头的词法单元 (函数名, 常量) --- //
-                // 从当前位置开始，提取一个可能的最大长度的子字符串。
-                // 这是一种优化，避免在每次迭代中都检查从当前位置到字符串末尾的所有可能性。
-                const temp = str.slice(i, i + Public.MAX_TOKEN_LENGTH).match(/^[a-zA-Z\[\]]*/)[0];
                 // 贪心算法：循环地从后向前缩短这个子字符串，以找到最长的有效匹配。
                 // 例如，对于 "sin(x)"，它会先尝试 "sin"，如果有效则匹配，而不会只匹配 "s"。
                 let matched = false;
                 // len 代表当前尝试匹配的子字符串长度
                 for (let len = temp.length; len > 0; len--) {
-                    const subTemp = temp.slice(0, len);
+                    const subTemp = len === temp.length ? temp : temp.slice(0, len);
 
-                    // 检查标准词法单元
-                    const tokenInfo = Public.getTokenInfo(subTemp);
-                    if (tokenInfo.class !== 'illegal' || (tokenInfo.isHtmlClassLenOne && !strictMode)) {
+                    // 字母开头的子串不可能以数字开头，因此只需查询全量符号表。
+                    if (TokenConfig.allSigns.has(subTemp) || (!strictMode && TokenConfig.htmlClassLenOneFunc.has(subTemp))) {
                         result.push(subTemp);
                         i += len - 1; // 跳过已匹配的字符（保留当前i供主循环++使用，所以减1）
                         matched = true;
@@ -811,6 +877,33 @@
          */
         static VALUE_LIST_MAX_SHOW_RESULTS = 999;
 
+        /**
+         * @static
+         * @readonly
+         * @type {number}
+         * @description `MathPlus.fact()` 整数阶乘 LRU 缓存的最大条目数。
+         * 超出容量时淘汰最久未使用的条目，防止缓存大数阶乘占用过多内存。
+         */
+        static FACTORIAL_CACHE_SIZE = 64;
+
+        /**
+         * @static
+         * @readonly
+         * @type {number}
+         * @description `MathPlus.calc()` 表达式编译结果 LRU 缓存的最大条目数。
+         * 自定义函数 f、g 在每次调用时都会重新进入 `calc`，缓存使它们只需解析一次。
+         */
+        static EXPRESSION_CACHE_SIZE = 256;
+
+        /**
+         * @static
+         * @readonly
+         * @type {number}
+         * @description `MathPlus.log()` 正整数底数 ln 值 LRU 缓存的最大条目数。
+         * 同一底数在不同精度下分别缓存，超出容量时淘汰最久未使用的条目。
+         */
+        static LOG_BASE_CACHE_SIZE = 32;
+
         /**
          * @private
          * @type {Object|null}
@@ -828,6 +921,10 @@
             e: [-219, '1ecd49d9e3c29326029305c8f68bacfa3c6316f631eac146b2134a1e6c0b75cef869bf281f79ee8c71f281e2c884aeb87fb37c64089a0ec56be456431569d592c56ae708d6630c6ccf7af1f75d487096c3a75ad203963a6ddc1914a', 220],
             pi: [-219, '23993e59d8f1beed1a7593d4faa8f71e7e7bfabd3bce9147f36fe49488ef48e00256540fb0bed3a804f57ca4ae2a25415b67d6bfc0a4b0052eebd7de00d229188a05edd25b4921fa0718579873598ff6e2f639b2ca5cb0a930b4c86', 220],
 
+            // pi/2 和 2*pi，由 pi 的尾数精确导出，避免在三角函数范围缩减和反三角函数中反复计算。
+            halfPi: [-219, '11cc9f2cec78df768d3ac9ea7d547b8f3f3dfd5e9de748a3f9b7f24a4477a470012b2a07d85f69d4027abe52571512a0adb3eb5fe05258029775ebef0069148c4502f6e92da490fd038c2bcc39acc7fb717b1cd9652e5854985a643', 220],
+            twoPi: [-219, '47327cb3b1e37dda34eb27a9f551ee3cfcf7f57a779d228fe6dfc92911de91c004aca81f617da75009eaf9495c544a82b6cfad7f8149600a5dd7afbc01a45231140bdba4b69243f40e30af30e6b31fedc5ec736594b96152616990c', 220],
+
             // 1/(2*pi) 和 2*pi，用于三角函数的周期性计算，具有更高的精度以减少累积误差。
             invTwoPi: [-440, '7fb8e2cfa572366dac69f800d8ea4a71dec50a009caf878c5a967130e4d2dc7099d5db874d0390b8b540fafae08078229c44539acf4e25efb46ba78b8941b6725e93e7d9700720e4cbafef059ccf263028f519e3ec8defa7424ffb0bf026259cc4f88003d435b98bcf2e0406f9effdb81a5a46340909994465cf71fdc630153a6f51f44ab249beaf7daf8ec4ab820e393fdf4a18a2e16f47f1009414efe0eb850747b99448819486378e7e2ff4e8f829eb599570c017e', 440],
 
@@ -835,6 +932,8 @@
             ln_10: [-219, '1a176bae18c7780dbb8d48b8882691c90a86e72d72de2f768182d52f07d96dbb38aa172b3c124babac9116cabbf5455a8886de7468c185b63a2b557dd589b14e85802b87b72bd8d0eb7d86d273bd8ca8fdd8384034f38977b89d16e', 220],
             // ln(1.2)，用于 ln 函数的范围缩减算法，以加速泰勒级数收敛。
             ln_1_2: [-220, '14a8d935f98be97b04624e3a7e3ae0617137ebf4346878d6338c45f0a167b2dd07c6c4b8c01f39378cc7816de8f6825aca7f00bef7c13790b9238ba6b373b5c18ae1f1364de093c6c002937af1bf247e88d0ca62944fa60c5f5afab', 220],
+            // √3，一元三次、四次方程的求根公式中每次求解都会用到，预先给出以免重复开方。
+            sqrt_3: [-219, '13a064fe4432390c2969dd374ed3c29c6d6ede1a59c4750ac5d3c145d77af6ca73a82ae979a19a55ad034d2a9290f9a02fe2e6ee00c32702071cecf1109b2c1795edc91eec3b4c6dd93aa681c53cfbcfcbf639724a2c0136d3df107', 220],
 
             /**
              * 伽玛函数（阶乘函数的推广）的兰佐斯近似（Lanczos Approximation）系数。
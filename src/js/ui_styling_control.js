@@ -647,6 +647,17 @@
             Object.entries(PageConfig.classNameConverterConfig).map(([k, v]) => [v, k])
         );
 
+        /**
+         * @private
+         * @static
+         * @type {Object<string, string>}
+         * @description 特殊符号到完整 CSS 类名（带前后缀 `_`）的映射，例如 "+" 对应 "_plus_"。
+         * 在加载时由 `PageConfig.classNameConverterConfig` 一次性生成，`textToHtmlClass` 直接查表，不必每次重新拼接类名。
+         */
+        static _symbolClassNames = Object.fromEntries(
+            Object.entries(PageConfig.classNameConverterConfig).map(([k, v]) => [k, `_${v}_`])
+        );
+
         /**
          * @private
          * @const {RegExp} _tokenizerRegex
@@ -811,15 +822,15 @@
          */
         static textToHtmlClass(text) {
             const output = [];
-            const config = PageConfig.classNameConverterConfig;
+            const symbolClassNames = HtmlTools._symbolClassNames;
 
             const matches = text.matchAll(HtmlTools._tokenizerRegex);
             for (const match of matches) {
                 const [, symbolGroup, bracketGroup, charGroup] = match;
 
                 if (symbolGroup) {
-                    // 查表
-                    output.push(`_${config[symbolGroup]}_`);
+                    // 查表，类名已预先拼好
+                    output.push(symbolClassNames[symbolGroup]);
                 } else if (bracketGroup) {
                     // 去除首尾括号 [name] -> name
                     output.push(`_${bracketGroup.slice(1, -1)}_`);
@@ -5337,7 +5348,7 @@
 
             // --- 错误处理 ---
             // 如果输入是 'error'，则在系数显示区和 R² 显示区都显示错误图标
-            if ([RaList, RaList.regressionEquation].includes('error')) {
+            if (RaList === 'error' || RaList.regressionEquation === 'error') {
                 const element = document.createElement('div');
                 HtmlTools.appendDOMs(element, ['_error_']);
                 content0.replaceChildren(element);
@@ -5728,40 +5739,14 @@
                     ], {mode: 'replace'});
                     return;
                 }
-                // 处理左边界
-                switch (textList[0]) {
-                    case '-inf':
-                        HtmlTools.appendDOMs(target, [
-                            '_parentheses_left_',
-                            '_minus_',
-                            '_infty_',
-                            '_comma_'
-                        ], {mode: 'replace'});
-                        break;
-                    default:
-                        HtmlTools.appendDOMs(target, [
-                            `_${useBracket ? 'bracket' : 'parentheses'}_left_`,
-                            ...HtmlTools.textToHtmlClass(textList[0]),
-                            '_comma_'
-                        ], {mode: 'replace'});
-                        break;
-                }
-                // 处理右边界
-                switch (textList[1]) {
-                    case '+inf':
-                        HtmlTools.appendDOMs(target, [
-                            '_plus_',
-                            '_infty_',
-                            '_parentheses_right_'
-                        ]);
-                        break;
-                    default:
-                        HtmlTools.appendDOMs(target, [
-                            ...HtmlTools.textToHtmlClass(textList[1]),
-                            `_${useBracket ? 'bracket' : 'parentheses'}_right_`
-                        ]);
-                        break;
-                }
+                // 左右边界先拼成一个类名列表，再一次性写入，避免每个区间触发两次 DOM 插入
+                const left = textList[0] === '-inf'
+                    ? ['_parentheses_left_', '_minus_', '_infty_']
+                    : [`_${useBracket ? 'bracket' : 'parentheses'}_left_`, ...HtmlTools.textToHtmlClass(textList[0])];
+                const right = textList[1] === '+inf'
+                    ? ['_plus_', '_infty_', '_parentheses_right_']
+                    : [...HtmlTools.textToHtmlClass(textList[1]), `_${useBracket ? 'bracket' : 'parentheses'}_right_`];
+                HtmlTools.appendDOMs(target, [...left, '_comma_', ...right], {mode: 'replace'});
             };
 
             /**
@@ -5806,47 +5791,11 @@
                 list[i] = screenData === '' ? '0' : screenData;
             }
 
+            // try 只包住 Worker 调用，渲染逻辑放在外面，避免渲染代码中的缺陷被当作计算失败吞掉
+            let result;
             try {
                 // 调用 Worker 进行分析
-                const result = await WorkerTools.powerFunctionAnalysis(list);
-
-                // 遍历并渲染所有结果区域 (0 到 9)
-                for (let i = 0; i < 10; i++) {
-                    switch (i) {
-                        case 0:
-                            // 渲染函数方程: y = f(x) = ...
-                            HtmlTools.appendDOMs(
-                                HtmlTools.getHtml('#print_content_3_content_0'),
-                                result.equation === 'error' ?
-                                    ['_error_'] :
-                                    ['_y_mathit_', '_equal_', '_f_', '_parentheses_left_', '_x_mathit_', '_parentheses_right_', '_equal_', ...HtmlTools.textToHtmlClass(result.equation)],
-                                {mode: 'replace'}
-                            );
-                            break;
-                        case 1:
-                            // 渲染值域 (Range)
-                            // useBracket=true 表示值域通常是闭区间（除了无穷大）
-                            powerFunctionTextToHtml(HtmlTools.getHtml('#print_content_3_content_1'), result.range, true);
-                            break;
-                        case 9:
-                            // 渲染根 (Roots)
-                            // 根是单个数列表，不是区间，使用特殊渲染方法
-                            this._multipleLinesPrint(
-                                HtmlTools.getHtml(`#print_content_3_content_${i}`),
-                                result[outputList[i]],
-                                powerFunctionRootToHtml
-                            );
-                            break;
-                        default:
-                            // 渲染区间或点 (单调性、极值、凹凸性、拐点)
-                            this._multipleLinesPrint(
-                                HtmlTools.getHtml(`#print_content_3_content_${i}`),
-                                result[outputList[i]],
-                                powerFunctionTextToHtml
-                            );
-                            break;
-                    }
-                }
+                result = await WorkerTools.powerFunctionAnalysis(list);
             } catch {
                 // 错误处理：如果分析失败，将所有相关区域显示为错误状态
                 for (let i = 0; i < 10; i++) {
@@ -5866,6 +5815,45 @@
                             break;
                     }
                 }
+                return;
+            }
+
+            // 遍历并渲染所有结果区域 (0 到 9)
+            for (let i = 0; i < 10; i++) {
+                switch (i) {
+                    case 0:
+                        // 渲染函数方程: y = f(x) = ...
+                        HtmlTools.appendDOMs(
+                            HtmlTools.getHtml('#print_content_3_content_0'),
+                            result.equation === 'error' ?
+                                ['_error_'] :
+                                ['_y_mathit_', '_equal_', '_f_', '_parentheses_left_', '_x_mathit_', '_parentheses_right_', '_equal_', ...HtmlTools.textToHtmlClass(result.equation)],
+                            {mode: 'replace'}
+                        );
+                        break;
+                    case 1:
+                        // 渲染值域 (Range)
+                        // useBracket=true 表示值域通常是闭区间（除了无穷大）
+                        powerFunctionTextToHtml(HtmlTools.getHtml('#print_content_3_content_1'), result.range, true);
+                        break;
+                    case 9:
+                        // 渲染根 (Roots)
+                        // 根是单个数列表，不是区间，使用特殊渲染方法
+                        this._multipleLinesPrint(
+                            HtmlTools.getHtml(`#print_content_3_content_${i}`),
+                            result[outputList[i]],
+                            powerFunctionRootToHtml
+                        );
+                        break;
+                    default:
+                        // 渲染区间或点 (单调性、极值、凹凸性、拐点)
+                        this._multipleLinesPrint(
+                            HtmlTools.getHtml(`#print_content_3_content_${i}`),
+                            result[outputList[i]],
+                            powerFunctionTextToHtml
+                        );
+                        break;
+                }
             }
         }
 
@@ -5892,15 +5880,16 @@
              * @param {number} i - 当前解的索引 k。
              */
             const indexingNumericalResults = (target, text, i) => {
-                // 渲染索引部分: z_i =
+                // 索引部分 z_i = 与数值部分拼接后一次性插入，只有下标和数值随行变化
                 HtmlTools.appendDOMs(
                     target,
-                    ['_z_mathit_', '_underline_', ...HtmlTools.textToHtmlClass(i.toString()), '_space_', '_equal_', '_space_'],
+                    [...indexPrefix, ...HtmlTools.textToHtmlClass(String(i)), ...indexSuffix, ...HtmlTools.textToHtmlClass(text)],
                     {mode: 'replace'}
                 );
-                // 渲染数值部分
-                HtmlTools.appendDOMs(target, HtmlTools.textToHtmlClass(text));
             };
+            // 每一行共用的 "z_" 与 " = " 部分
+            const indexPrefix = ['_z_mathit_', '_underline_'];
+            const indexSuffix = ['_space_', '_equal_', '_space_'];
 
             // 获取输入数据：复数 z 和指数 n
             const z = PageConfig.screenData['40'];
@@ -5909,73 +5898,11 @@
             const content40 = HtmlTools.getHtml('#print_content_4_content_0');
             const content41 = HtmlTools.getHtml('#print_content_4_content_1');
             const content42 = HtmlTools.getHtml('#print_content_4_content_2');
+            // try 只包住 Worker 调用，渲染异常不再被误报为计算错误
+            let result;
             try {
                 // 调用 Worker 进行分析
-                const result = await WorkerTools.radicalFunctionAnalysis(z, n);
-
-                if ([result.z, result.n].includes('error')) {
-                    HtmlTools.appendDOMs(content40, ['_error_'], {mode: 'replace'});
-                } else {
-                    // --- 渲染原表达式 ---
-                    // 格式: z 的 [n次] 方根
-                    HtmlTools.appendDOMs(
-                        content40,
-                        [...HtmlTools.textToHtmlClass(result.z), '_space_', '_de_'],
-                        {mode: 'replace'}
-                    );
-                    // 根据 n 的值选择不同的根号显示方式
-                    switch (result.n) {
-                        case '2':
-                            HtmlTools.appendDOMs(content40, ['_print_4_sqrt_']); // 平方根图标
-                            break;
-                        case '3':
-                            HtmlTools.appendDOMs(content40, ['_cbrt_ch_']); // 立方根图标
-                            break;
-                        default:
-                            // n 次方根图标
-                            HtmlTools.appendDOMs(
-                                content40,
-                                ['_space_', ...HtmlTools.textToHtmlClass(result.n), '_space_', '_print_4_root_']
-                            );
-                            break;
-                    }
-                }
-
-                if (result.kRange.includes('error') || result.formula === 'error') {
-                    HtmlTools.appendDOMs(content41, ['_error_'], {mode: 'replace'});
-                } else {
-                    // --- 渲染通项公式 ---
-                    // 格式: z_k = formula, k in [0, n-1] ∩ Z
-                    HtmlTools.appendDOMs(
-                        content41,
-                        ['_z_mathit_', '_underline_', '_k_mathit_', '_space_', '_equal_', '_space_'],
-                        {mode: 'replace'}
-                    );
-                    HtmlTools.appendDOMs(content41, HtmlTools.textToHtmlClass(result.formula));
-                    // 添加 k 的取值范围说明
-                    if (result.kRange[0] === result.kRange[1]) {
-                        HtmlTools.appendDOMs(content41, ['_comma_', '_k_mathit_', '_in_', '_curlyBraces_left_', '_0_', '_curlyBraces_right_']);
-                    } else {
-                        HtmlTools.appendDOMs(content41, ['_comma_', '_k_mathit_', '_in_', '_bracket_left_',
-                            ...HtmlTools.textToHtmlClass(result.kRange[0]),
-                            '_comma_',
-                            ...HtmlTools.textToHtmlClass(result.kRange[1]),
-                            '_bracket_right_',
-                            '_cap_',
-                            '_Z_mathbb_'
-                        ]);
-                    }
-                }
-
-                // --- 渲染数值解列表 ---
-                this._multipleLinesPrint(
-                    content42,
-                    result.numericalResults,
-                    indexingNumericalResults,
-                    true // 需要传递索引 i
-                );
-                // 处理结果溢出提示（如果解的数量过多，显示省略号）
-                HtmlTools.getHtml('#print_omit').classList[result.overflow ? 'remove' : 'add']('NoDisplay');
+                result = await WorkerTools.radicalFunctionAnalysis(z, n);
             } catch {
                 // 错误处理：如果计算失败，将所有相关区域显示为错误状态
                 HtmlTools.appendDOMs(content40, ['_error_'], {mode: 'replace'});
@@ -5986,9 +5913,92 @@
                     HtmlTools.appendDOMs
                 );
                 HtmlTools.getHtml('#print_omit').classList.add('NoDisplay');
+                return;
+            }
+
+            if (result.z === 'error' || result.n === 'error') {
+                HtmlTools.appendDOMs(content40, ['_error_'], {mode: 'replace'});
+            } else {
+                // --- 渲染原表达式 ---
+                // 格式: z 的 [n次] 方根
+                HtmlTools.appendDOMs(
+                    content40,
+                    [...HtmlTools.textToHtmlClass(result.z), '_space_', '_de_'],
+                    {mode: 'replace'}
+                );
+                // 根据 n 的值选择不同的根号显示方式
+                switch (result.n) {
+                    case '2':
+                        HtmlTools.appendDOMs(content40, ['_print_4_sqrt_']); // 平方根图标
+                        break;
+                    case '3':
+                        HtmlTools.appendDOMs(content40, ['_cbrt_ch_']); // 立方根图标
+                        break;
+                    default:
+                        // n 次方根图标
+                        HtmlTools.appendDOMs(
+                            content40,
+                            ['_space_', ...HtmlTools.textToHtmlClass(result.n), '_space_', '_print_4_root_']
+                        );
+                        break;
+                }
             }
+
+            if (result.kRange.includes('error') || result.formula === 'error') {
+                HtmlTools.appendDOMs(content41, ['_error_'], {mode: 'replace'});
+            } else {
+                // --- 渲染通项公式 ---
+                // 格式: z_k = formula, k in [0, n-1] ∩ Z
+                // 先拼出完整的类名列表，再一次性插入，只触发一次 DOM 更新。
+                // k 的取值范围说明
+                const kRangeClasses = result.kRange[0] === result.kRange[1]
+                    ? ['_comma_', '_k_mathit_', '_in_', '_curlyBraces_left_', '_0_', '_curlyBraces_right_']
+                    : ['_comma_', '_k_mathit_', '_in_', '_bracket_left_',
+                        ...HtmlTools.textToHtmlClass(result.kRange[0]),
+                        '_comma_',
+                        ...HtmlTools.textToHtmlClass(result.kRange[1]),
+                        '_bracket_right_',
+                        '_cap_',
+                        '_Z_mathbb_'
+                    ];
+                HtmlTools.appendDOMs(
+                    content41,
+                    [
+                        '_z_mathit_', '_underline_', '_k_mathit_', '_space_', '_equal_', '_space_',
+                        ...HtmlTools.textToHtmlClass(result.formula),
+                        ...kRangeClasses
+                    ],
+                    {mode: 'replace'}
+                );
+            }
+
+            // --- 渲染数值解列表 ---
+            this._multipleLinesPrint(
+                content42,
+                result.numericalResults,
+                indexingNumericalResults,
+                true // 需要传递索引 i
+            );
+            // 处理结果溢出提示（如果解的数量过多，显示省略号）
+            HtmlTools.getHtml('#print_omit').classList[result.overflow ? 'remove' : 'add']('NoDisplay');
         }
 
+        /**
+         * @private
+         * @static
+         * @readonly
+         * @type {Object.<string, string>}
+         * @description 计算器模式到对应执行方法名的映射表（冻结对象，不可修改）。
+         * `exe()` 每次只需按模式查表，无需重新构建分发表；未列出的模式不执行任何计算。
+         */
+        static _EXE_HANDLERS = Object.freeze({
+            '0': '_exeMode0',
+            '1': '_exeMode1',
+            '2_1': '_exeMode2',
+            '3': '_exeMode3',
+            '4': '_exeMode4'
+        });
+
         /**
          * @static
          * @method exe
@@ -6016,26 +6026,14 @@
             // 对于所有其他模式，移除主容器的 'Input' 类。
             // 这会触发 CSS 过渡，将界面从输入视图滑动到结果视图。
             HtmlTools.getHtml('#main').classList.remove('Input');
-            switch (currentMode) {
-                case '0':
-                    await this._exeMode0();
-                    break;
-                case '1':
-                    await this._exeMode1();
-                    // 暂停渲染屏幕，提升性能
-                    if (!HtmlTools.getHtml('#main').classList.contains('Input') && InputManager.statisticsRenderer.isRunning()) {
-                        InputManager.statisticsRenderer.pause();
-                    }
-                    break;
-                case '2_1':
-                    await this._exeMode2();
-                    break;
-                case '3':
-                    await this._exeMode3();
-                    break;
-                case '4':
-                    await this._exeMode4();
-                    break;
+            // 各模式的执行逻辑，按模式名直接查表分发
+            const handlerName = this._EXE_HANDLERS[currentMode];
+            if (handlerName) {
+                await this[handlerName]();
+            }
+            // 统计模式计算完成后暂停渲染屏幕，提升性能
+            if (currentMode === '1' && !HtmlTools.getHtml('#main').classList.contains('Input') && InputManager.statisticsRenderer.isRunning()) {
+                InputManager.statisticsRenderer.pause();
             }
 
             // 隐藏加载条
@@ -1,5 +1,5 @@
 import assert from "node:assert/strict";
-import {readdir, readFile, writeFile} from "node:fs/promises";
+import {mkdir, readdir, readFile, readlink, rm, symlink, writeFile} from "node:fs/promises";
 import path from "node:path";
 import test from "node:test";
 import {reverseBuild} from "../../tools/cli/reverse_build.js";
@@ -55,3 +55,71 @@ test("逆向构建拒绝可能清理输入数据的输出路径", async (t) => {
         {code: "UNSAFE_OUTPUT"}
     );
 });
+
+test("增量逆向构建只重写变化的文件并清理本次未生成的文件", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputFile = path.join(directory, "single.html");
+    const outputDir = path.join(directory, "output");
+    await writeFile(inputFile, `<style id="theme">p { margin: 0; }</style><script id="app">console.log("ok");</script>`, "utf8");
+    const options = {
+        inputFile, outputDir, incremental: true, logger: () => {
+        }
+    };
+
+    await reverseBuild(options);
+    await writeFile(path.join(outputDir, "css", "stale.css"), "a {}", "utf8");
+    await writeFile(path.join(outputDir, "js", "app.js"), "changed", "utf8");
+
+    const result = await reverseBuild(options);
+    assert.equal(result.unchangedCount, 3);
+    assert.equal(result.removedCount, 1);
+    assert.deepEqual(await readdir(path.join(outputDir, "css")), ["theme.css"]);
+    assert.equal(await readFile(path.join(outputDir, "js", "app.js"), "utf8"), `console.log("ok");`);
+});
+
+test("增量逆向构建写入失败时保留已有条目而不是当作过期条目删除", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputFile = path.join(directory, "single.html");
+    const outputDir = path.join(directory, "output");
+    await writeFile(inputFile, `<style id="theme">p { margin: 0; }</style>`, "utf8");
+    const logs = [];
+    const options = {inputFile, outputDir, incremental: true, logger: (message) => logs.push(message)};
+
+    await reverseBuild(options);
+    const blockedPath = path.join(outputDir, "css", "theme.css");
+    await rm(blockedPath);
+    await mkdir(blockedPath);
+    await writeFile(path.join(blockedPath, "keep.txt"), "keep", "utf8");
+
+    const result = await reverseBuild(options);
+    assert.equal(result.cssCount, 0);
+    assert.equal(result.removedCount, 0);
+    assert.ok(logs.some((message) => message.includes("[Error] Writing theme.css")));
+    assert.equal(await readFile(path.join(blockedPath, "keep.txt"), "utf8"), "keep");
+});
+
+test("增量逆向构建遇到无法读取的已有输出时报告失败且不覆盖、不删除", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputFile = path.join(directory, "single.html");
+    const outputDir = path.join(directory, "output");
+    await writeFile(inputFile, `<script id="app">console.log("ok");</script>`, "utf8");
+    const logs = [];
+    const options = {inputFile, outputDir, incremental: true, logger: (message) => logs.push(message)};
+
+    await reverseBuild(options);
+    // 指向自身的符号链接读取时报 ELOOP；以 root 运行时权限位拦不住读取，因此不用 chmod 构造。
+    const unreadablePath = path.join(outputDir, "js", "app.js");
+    await rm(unreadablePath);
+    try {
+        await symlink("app.js", unreadablePath);
+    } catch (error) {
+        t.skip(`无法创建符号链接：${error.code}`);
+        return;
+    }
+
+    const result = await reverseBuild(options);
+    assert.equal(result.jsCount, 0);
+    assert.equal(result.removedCount, 0);
+    assert.ok(logs.some((message) => message.includes("[Error] Writing app.js")));
+    assert.equal(await readlink(unreadablePath), "app.js");
+});
@@ -1,5 +1,7 @@
 import assert from "node:assert/strict";
 import {mkdir, mkdtemp, readFile, rm, writeFile} from "node:fs/promises";
+import http from "node:http";
+import net from "node:net";
 import path from "node:path";
 import test from "node:test";
 import {createServer} from "../../tools/server/run_server.js";
@@ -50,6 +52,58 @@ test("静态服务器默认仅本机监听并提供安全响应头", async (t) =
     assert.doesNotMatch(await directoryListing.text(), /Directory listing/u);
 });
 
+function closeServer(server) {
+    return new Promise((resolve) => server.close(resolve));
+}
+
+// 占用一段连续端口：以系统分配的空闲端口为起点，遇到中途已被占用的端口就换个起点重来。
+async function occupyConsecutivePorts(count) {
+    for (let attempt = 0; attempt < 20; attempt += 1) {
+        const servers = [];
+        try {
+            for (let index = 0; index < count; index += 1) {
+                const server = net.createServer();
+                await new Promise((resolve, reject) => {
+                    server.once("error", reject);
+                    server.listen(index === 0 ? 0 : servers[0].address().port + index, "127.0.0.1", resolve);
+                });
+                servers.push(server);
+            }
+            return servers;
+        } catch {
+            await Promise.all(servers.map(closeServer));
+        }
+    }
+    throw new Error(`无法占用 ${count} 个连续端口。`);
+}
+
+test("起始端口被占用时顺延到下一个可用端口", async (t) => {
+    const directory = await temporaryDirectory(t);
+    await writeFile(path.join(directory, "index.html"), "retry-ok", "utf8");
+    // 占用超过 10 个端口，确保多次重试后不会在同一实例上累积监听器（EventEmitter 默认上限为 10）。
+    const occupied = await occupyConsecutivePorts(12);
+    t.after(() => Promise.all(occupied.map(closeServer)));
+    const startPort = occupied[0].address().port;
+    const warnings = [];
+    const onWarning = (warning) => warnings.push(warning.name);
+    process.on("warning", onWarning);
+    t.after(() => process.off("warning", onWarning));
+    const {server, port} = await createServer(directory, startPort, false, () => {
+    });
+    t.after(() => closeServer(server));
+    // 进程警告在下一轮事件循环中才会派发。
+    await new Promise((resolve) => setImmediate(resolve));
+    assert.ok(!warnings.includes("MaxListenersExceededWarning"));
+
+    assert.ok(port >= startPort + occupied.length);
+    // http.Server 自身会注册一个 listening 监听器，因此与新建实例的数量比较，而不是与 0 比较。
+    const fresh = http.createServer();
+    assert.equal(server.listenerCount("listening"), fresh.listenerCount("listening"));
+    assert.equal(server.listenerCount("error"), fresh.listenerCount("error"));
+    const response = await fetch(`http://127.0.0.1:${port}/`);
+    assert.equal(await response.text(), "retry-ok");
+});
+
 test("工具状态接口不暴露项目绝对路径", async (t) => {
     const directory = await temporaryDirectory(t);
     const {server, port} = await createServer(directory, 0, false, () => {
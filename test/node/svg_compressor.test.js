@@ -1,5 +1,5 @@
 import assert from "node:assert/strict";
-import {mkdir, readFile, writeFile} from "node:fs/promises";
+import {mkdir, readdir, readFile, writeFile} from "node:fs/promises";
 import path from "node:path";
 import test from "node:test";
 import {compressSvg} from "../../tools/cli/svg_compressor.js";
@@ -43,3 +43,68 @@ test("SVG 工具会输出优化文件和 Base64 CSS", async (t) => {
     assert.match(css, /height: 5dvmin/u);
     assert.match(css, /content: url\(data:image\/svg\+xml;base64,/u);
 });
+
+test("SVG 工具多线程处理的输出与串行处理一致", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputDir = path.join(directory, "input");
+    await mkdir(inputDir, {recursive: true});
+    for (let index = 0; index < 8; index += 1) {
+        await writeFile(path.join(inputDir, `icon-${index}.svg`), `<svg width="24" height="24" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+    <rect x="${index}" y="${index}" width="4" height="4" fill="#00ff00"/>
+</svg>`, "utf8");
+    }
+    await writeFile(path.join(inputDir, "broken.svg"), "<svg><<", "utf8");
+
+    const run = async (maxWorkers) => {
+        const outputDir = path.join(directory, `css-${maxWorkers}`);
+        const logs = [];
+        const result = await compressSvg({
+            inputDir, outputDir, tempDir: path.join(directory, `svg-${maxWorkers}`), logger: (line) => logs.push(line), colors: false, maxWorkers
+        });
+        return {result, logs, css: await readFile(path.join(outputDir, "icons.css"), "utf8")};
+    };
+    const serial = await run(1);
+    const parallel = await run(2);
+    assert.equal(serial.result.successCount, 8);
+    assert.equal(parallel.result.successCount, 8);
+    assert.equal(parallel.css, serial.css);
+    assert.deepEqual(parallel.logs.filter((line) => /DONE|FAIL/u.test(line)), serial.logs.filter((line) => /DONE|FAIL/u.test(line)));
+});
+
+test("SVG 工具可以用 URL 编码内嵌 SVG", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputDir = path.join(directory, "input");
+    const outputDir = path.join(directory, "output-css");
+    await mkdir(inputDir, {recursive: true});
+    await writeFile(path.join(inputDir, "icon.svg"), `<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path fill="#ff0000" d="M0 0h24v24H0z"/></svg>`, "utf8");
+
+    await compressSvg({
+        inputDir, outputDir, tempDir: path.join(directory, "output-svg"), urlEncoded: true, colors: false, logger: () => {
+        }
+    });
+    const css = await readFile(path.join(outputDir, "icons.css"), "utf8");
+    const [, payload] = css.match(/content: url\("data:image\/svg\+xml;charset=utf-8,([^"]*)"\);/u);
+    assert.doesNotMatch(payload, /[<>#"]/u);
+    assert.equal(decodeURIComponent(payload), await readFile(path.join(directory, "output-svg", "icon.svg"), "utf8"));
+});
+
+test("SVG 工具关闭临时 SVG 输出时不清理也不写入临时目录", async (t) => {
+    const directory = await temporaryDirectory(t);
+    const inputDir = path.join(directory, "input");
+    const outputDir = path.join(directory, "output-css");
+    const tempDir = path.join(directory, "output-svg");
+    await mkdir(inputDir, {recursive: true});
+    await mkdir(tempDir, {recursive: true});
+    await writeFile(path.join(inputDir, "icon.svg"), `<svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path fill="#ff0000" d="M0 0h24v24H0z"/></svg>`, "utf8");
+    await writeFile(path.join(tempDir, "existing.txt"), "keep", "utf8");
+    const logs = [];
+
+    const result = await compressSvg({
+        inputDir, outputDir, tempDir, writeTempSvgs: false, colors: false, logger: (message) => logs.push(message)
+    });
+    assert.equal(result.successCount, 1);
+    assert.match(await readFile(path.join(outputDir, "icons.css"), "utf8"), /^\._icon_ \{$/mu);
+    assert.deepEqual(await readdir(tempDir), ["existing.txt"]);
+    assert.equal(await readFile(path.join(tempDir, "existing.txt"), "utf8"), "keep");
+    assert.ok(logs.some((message) => /^Temp Dir\s+: skipped$/u.test(message)));
+});
@@ -1,6 +1,6 @@
-import {createHash} from "node:crypto";
+import crypto from "node:crypto";
 import {existsSync} from "node:fs";
-import {mkdir, readFile, rm, writeFile} from "node:fs/promises";
+import {mkdir, readdir, readFile, rm, writeFile} from "node:fs/promises";
 import path from "node:path";
 import process from "node:process";
 import readline from "node:readline/promises";
@@ -17,8 +17,13 @@ export const GLOBAL_CONFIG = Object.freeze({
     JS_DIR_NAME: "js"
 });
 
+// 哈希只用于给无 id 的标签生成不重名的文件名，不涉及安全性；SHA-1 有 CPU 指令加速，比 MD5 更快。
+// Node.js 20.12+ 提供一次性的 crypto.hash，省去创建 Hash 对象的开销；旧版本回退到 createHash。
 export function calculateHash(content) {
-    return createHash("md5").update(content, GLOBAL_CONFIG.ENCODING).digest("hex").slice(0, 8);
+    const digest = crypto.hash
+        ? crypto.hash("sha1", content, "hex")
+        : crypto.createHash("sha1").update(content, GLOBAL_CONFIG.ENCODING).digest("hex");
+    return digest.slice(0, 8);
 }
 
 function commonWhitespacePrefix(values) {
@@ -46,11 +51,21 @@ export function dedent(content) {
         .filter((line) => /\S/.test(line))
         .map((line) => line.match(/^[\t ]*/u)[0]);
     const prefix = commonWhitespacePrefix(indents);
+    if (!prefix) {
+        return lines.join("\n");
+    }
     return lines.map((line) => line.startsWith(prefix) ? line.slice(prefix.length) : line).join("\n");
 }
 
+// 每个标签都要读取 src/type/id/media 等属性，按属性名缓存编译好的正则，避免逐次重新构造。
+const attributePatterns = new Map();
+
 function getAttribute(attributes, name) {
-    const pattern = new RegExp(`(?:^|\\s)${name}\\s*=\\s*(?:"([^"]*)"|'([^']*)'|([^\\s"'=<>\\x60]+))`, "iu");
+    let pattern = attributePatterns.get(name);
+    if (!pattern) {
+        pattern = new RegExp(`(?:^|\\s)${name}\\s*=\\s*(?:"([^"]*)"|'([^']*)'|([^\\s"'=<>\\x60]+))`, "iu");
+        attributePatterns.set(name, pattern);
+    }
     const match = attributes.match(pattern);
     return match ? (match[1] ?? match[2] ?? match[3] ?? "") : null;
 }
@@ -64,92 +79,138 @@ function escapeAttribute(value) {
     return value.replaceAll("&", "&amp;").replaceAll('"', "&quot;");
 }
 
-async function uniqueFilepath(directory, filename) {
+// 输出目录要么在提取前刚被清空，要么（增量模式）其中的旧文件会被覆盖或清理，
+// 因此只需按本次已分配的路径在内存中判重，无需逐个访问磁盘。
+// Windows 与 macOS 默认文件系统不区分大小写，判重时按小写比较。
+const pathKey = process.platform === "win32" || process.platform === "darwin"
+    ? (filePath) => filePath.toLowerCase()
+    : (filePath) => filePath;
+
+function uniqueFilepath(usedPaths, directory, filename) {
     const extension = path.extname(filename);
     const name = path.basename(filename, extension);
     let candidate = path.join(directory, filename);
     let counter = 1;
 
-    while (existsSync(candidate)) {
+    while (usedPaths.has(pathKey(candidate))) {
         candidate = path.join(directory, `${name}_${counter}${extension}`);
         counter += 1;
     }
+    usedPaths.add(pathKey(candidate));
     return candidate;
 }
 
-async function extractTagType(html, tagName, outputDirectory, extension, doDedent, logger) {
-    const pattern = new RegExp(`<${tagName}\\b([^>]*)>([\\s\\S]*?)<\\/${tagName}\\s*>`, "giu");
-    const matches = [...html.matchAll(pattern)];
-    const protectedPatterns = [/<!--[\s\S]*?-->/gu];
-    if (tagName === "style") {
-        protectedPatterns.push(/<script\b[^>]*>[\s\S]*?<\/script\s*>/giu);
+const SCRIPT_TYPES = new Set(["", "text/javascript", "application/javascript", "module"]);
+
+// 注释、<style> 与 <script> 放在同一个正则里按文档顺序扫描：命中的注释或另一种标签会整段吞掉，
+// 其中看起来像标签的文本自然不会被提取，不必再为每种标签单独扫描全文并预先计算受保护区间。
+const INLINE_ASSET_PATTERN = /<!--[\s\S]*?-->|<(style|script)\b([^>]*)>([\s\S]*?)<\/\1\s*>/giu;
+
+async function writeOutputFile(filePath, content) {
+    await writeFile(filePath, content, GLOBAL_CONFIG.ENCODING);
+    return true;
+}
+
+// 增量模式下只有内容变化的文件才会被重写，未变化的文件保持原样（修改时间也不变）。
+// 直接比较已有内容即可，比分别计算两份内容的哈希更省事。
+async function writeOutputFileIfChanged(filePath, content) {
+    // 只有“文件尚不存在”属于正常情况，权限不足等其他读取错误应直接暴露给调用方。
+    const existing = await readFile(filePath, GLOBAL_CONFIG.ENCODING).catch((error) => {
+        if (error.code !== "ENOENT") {
+            throw error;
+        }
+        return null;
+    });
+    if (existing === content) {
+        return false;
     }
-    const protectedRanges = protectedPatterns.flatMap((protectedPattern) => [...html.matchAll(protectedPattern)]
-        .map((match) => [match.index, match.index + match[0].length]));
-    let result = "";
-    let cursor = 0;
-    let count = 0;
+    return writeOutputFile(filePath, content);
+}
 
-    for (const match of matches) {
-        const [fullTag, attributes, rawContent] = match;
-        const start = match.index;
-        result += html.slice(cursor, start);
-        cursor = start + fullTag.length;
+// 删除目录中本次没有用到的条目，使增量更新后的目录内容与完整重建一致。
+// keptPaths 包含本次认领的全部输出路径（含写入失败的），写入失败的已有条目保持原样，不会被当作过期条目删除。
+async function removeStaleEntries(directory, keptPaths) {
+    const keptKeys = new Set(keptPaths.map(pathKey));
+    const staleEntries = (await readdir(directory))
+        .map((name) => path.join(directory, name))
+        .filter((entryPath) => !keptKeys.has(pathKey(entryPath)));
+    await Promise.all(staleEntries.map((entryPath) => rm(entryPath, {recursive: true, force: true})));
+    return staleEntries.length;
+}
 
-        if (protectedRanges.some(([rangeStart, rangeEnd]) => start >= rangeStart && start < rangeEnd)) {
-            result += fullTag;
+async function extractInlineAssets(html, directories, doDedent, writeOutput, logger) {
+    const counts = {style: 0, script: 0};
+    let unchangedCount = 0;
+    const usedPaths = new Set();
+    const parts = [];
+    const assets = [];
+    let cursor = 0;
+
+    for (const match of html.matchAll(INLINE_ASSET_PATTERN)) {
+        const [fullTag, rawTagName, attributes, rawContent] = match;
+        if (!rawTagName) {
             continue;
         }
+        const tagName = rawTagName.toLowerCase();
+        const start = match.index;
+        parts.push(html.slice(cursor, start));
+        cursor = start + fullTag.length;
 
-        if (tagName === "script" && getAttribute(attributes, "src")) {
-            result += fullTag;
+        // 外链脚本和非 JavaScript 类型的脚本（如 JSON 数据块）在去缩进之前就排除，不为它们处理正文。
+        if (tagName === "script" && (getAttribute(attributes, "src")
+            || !SCRIPT_TYPES.has((getAttribute(attributes, "type") ?? "").toLowerCase()))) {
+            parts.push(fullTag);
             continue;
         }
 
-        let content = doDedent ? dedent(rawContent).trim() : rawContent.trim();
+        // 单行内容去缩进后紧接着也会被 trim 掉前导空白，与直接 trim 等价，跳过 dedent。
+        const content = doDedent && /[\r\n]/u.test(rawContent) ? dedent(rawContent).trim() : rawContent.trim();
         if (!content) {
-            result += fullTag;
+            parts.push(fullTag);
             continue;
         }
 
-        if (tagName === "script") {
-            const scriptType = (getAttribute(attributes, "type") ?? "").toLowerCase();
-            const validTypes = new Set(["", "text/javascript", "application/javascript", "module"]);
-            if (!validTypes.has(scriptType)) {
-                result += fullTag;
-                continue;
-            }
-        }
-
+        const outputDirectory = directories[tagName];
+        const extension = tagName === "style" ? ".css" : ".js";
         const tagId = getAttribute(attributes, "id");
         const filename = tagId ? `${tagId}${extension}` : `extracted_${calculateHash(content)}${extension}`;
-        const filePath = await uniqueFilepath(outputDirectory, filename);
-
-        try {
-            await writeFile(filePath, nativeNewlines(content), GLOBAL_CONFIG.ENCODING);
-        } catch (error) {
-            logger(`  [Error] Writing ${path.basename(filePath)}: ${error.message}`);
-            result += fullTag;
+        // 原标签先占位，写入成功后直接用 link/script 引用覆盖该位置；写入失败则原样保留，无需额外清空标签内容。
+        assets.push({
+            tagName, attributes, content, outputDirectory,
+            filePath: uniqueFilepath(usedPaths, outputDirectory, filename),
+            partIndex: parts.push(fullTag) - 1
+        });
+    }
+    parts.push(html.slice(cursor));
+
+    // 各文件路径已事先确定、互不冲突，可以同时写入；写入结果再按文档顺序回填替换内容和日志。
+    const writes = await Promise.allSettled(assets.map((asset) => writeOutput(asset.filePath, nativeNewlines(asset.content))));
+    for (const [index, asset] of assets.entries()) {
+        const {tagName, attributes, outputDirectory, filePath, partIndex} = asset;
+        if (writes[index].status === "rejected") {
+            logger(`  [Error] Writing ${path.basename(filePath)}: ${writes[index].reason.message}`);
             continue;
         }
+        if (!writes[index].value) {
+            unchangedCount += 1;
+        }
 
         const relativePath = `./${path.basename(outputDirectory)}/${path.basename(filePath)}`;
         if (tagName === "style") {
             const media = getAttribute(attributes, "media");
             const mediaAttribute = media === null ? "" : ` media="${escapeAttribute(media)}"`;
-            result += `<link rel="stylesheet" href="${relativePath}"${mediaAttribute}>`;
+            parts[partIndex] = `<link rel="stylesheet" href="${relativePath}"${mediaAttribute}>`;
             logger(`  [CSS] Extracted -> ${path.basename(outputDirectory)}/${path.basename(filePath)}`);
         } else {
             const cleanAttributes = removeAttribute(attributes, "src").trimEnd();
             const separator = cleanAttributes ? " " : "";
-            result += `<script${cleanAttributes}${separator} src="${relativePath}"></script>`;
+            parts[partIndex] = `<script${cleanAttributes}${separator} src="${relativePath}"></script>`;
             logger(`  [JS]  Extracted -> ${path.basename(outputDirectory)}/${path.basename(filePath)}`);
         }
-        count += 1;
+        counts[tagName] += 1;
     }
 
-    result += html.slice(cursor);
-    return {html: result, count};
+    return {html: parts.join(""), cssCount: counts.style, jsCount: counts.script, claimedPaths: assets.map((asset) => asset.filePath), unchangedCount};
 }
 
 export async function reverseBuild({
@@ -157,12 +218,21 @@ export async function reverseBuild({
                                        outputDir = GLOBAL_CONFIG.DEFAULT_OUTPUT_DIR,
                                        noDedent = false,
                                        force = false,
+                                       incremental = false,
                                        logger = console.log
                                    } = {}) {
     const inputPath = path.resolve(inputFile);
     const outputPathValue = outputDir || path.join(process.cwd(), `split_files_of_${path.parse(inputPath).name}`);
 
-    if (!existsSync(inputPath)) {
+    // 输入只读取这一次，后续提取与改写都基于同一份文本；读取结果同时充当存在性检查，
+    // 并且发生在清理输出目录之前，输入缺失时不会误删已有输出。
+    let source;
+    try {
+        source = await readFile(inputPath, GLOBAL_CONFIG.ENCODING);
+    } catch (readError) {
+        if (readError.code !== "ENOENT") {
+            throw readError;
+        }
         const error = new Error(`Input file '${inputPath}' not found.`);
         error.code = "INPUT_NOT_FOUND";
         throw error;
@@ -171,46 +241,65 @@ export async function reverseBuild({
         inputPath,
         message: "输出目录不能是磁盘/项目根目录，也不能包含输入文件。"
     });
-    if (existsSync(outputPath) && !force) {
+    const outputExists = existsSync(outputPath);
+    if (outputExists && !force && !incremental) {
         const error = new Error(`目标文件夹已存在: ${outputPath}`);
         error.code = "OUTPUT_EXISTS";
         throw error;
     }
 
-    if (existsSync(outputPath)) {
+    if (outputExists && incremental) {
+        logger(`Updating existing directory: ${outputPath}`);
+    } else if (outputExists) {
         logger(`Cleaning existing directory: ${outputPath}`);
         await rm(outputPath, {recursive: true, force: true});
     }
 
     const cssDirectory = path.join(outputPath, GLOBAL_CONFIG.CSS_DIR_NAME);
     const jsDirectory = path.join(outputPath, GLOBAL_CONFIG.JS_DIR_NAME);
-    await mkdir(cssDirectory, {recursive: true});
-    await mkdir(jsDirectory, {recursive: true});
-
     logger(`Processing: ${path.basename(inputPath)}`);
     logger(`Output to: ${outputPath}`);
     logger("-".repeat(40));
 
-    const source = await readFile(inputPath, GLOBAL_CONFIG.ENCODING);
-    const cssResult = await extractTagType(source, "style", cssDirectory, ".css", !noDedent, logger);
-    const jsResult = await extractTagType(cssResult.html, "script", jsDirectory, ".js", !noDedent, logger);
+    await Promise.all([
+        mkdir(cssDirectory, {recursive: true}),
+        mkdir(jsDirectory, {recursive: true})
+    ]);
+    const writeOutput = incremental ? writeOutputFileIfChanged : writeOutputFile;
+    const extracted = await extractInlineAssets(source, {style: cssDirectory, script: jsDirectory}, !noDedent, writeOutput, logger);
     const outputHtmlPath = path.join(outputPath, "index.html");
-
-    await writeFile(path.join(outputPath, ".nojekyll"), "", GLOBAL_CONFIG.ENCODING);
-    await writeFile(outputHtmlPath, jsResult.html, GLOBAL_CONFIG.ENCODING);
+    const noJekyllPath = path.join(outputPath, ".nojekyll");
+
+    // index.html 直接写回替换后的原始文本，不做任何重排版；两个输出文件互不依赖，可同时写入。
+    const rootWrites = await Promise.all([writeOutput(noJekyllPath, ""), writeOutput(outputHtmlPath, extracted.html)]);
+    const unchangedCount = extracted.unchangedCount + rootWrites.filter((written) => !written).length;
+    let removedCount = 0;
+    if (incremental) {
+        const staleCounts = await Promise.all([
+            removeStaleEntries(outputPath, [cssDirectory, jsDirectory, noJekyllPath, outputHtmlPath]),
+            removeStaleEntries(cssDirectory, extracted.claimedPaths),
+            removeStaleEntries(jsDirectory, extracted.claimedPaths)
+        ]);
+        removedCount = staleCounts.reduce((total, count) => total + count, 0);
+    }
 
     logger("-".repeat(40));
     logger("Success! Process completed.");
     logger(`  - Input:  ${inputPath}`);
     logger(`  - Output: ${outputHtmlPath}`);
-    logger(`  - Stats:  ${cssResult.count} CSS files, ${jsResult.count} JS files extracted.`);
+    logger(`  - Stats:  ${extracted.cssCount} CSS files, ${extracted.jsCount} JS files extracted.`);
+    if (incremental) {
+        logger(`  - Incremental: ${unchangedCount} files unchanged, ${removedCount} stale entries removed.`);
+    }
 
     return {
         inputPath,
         outputPath,
         outputHtmlPath,
-        cssCount: cssResult.count,
-        jsCount: jsResult.count
+        cssCount: extracted.cssCount,
+        jsCount: extracted.jsCount,
+        unchangedCount,
+        removedCount
     };
 }
 
@@ -225,6 +314,7 @@ function printHelp() {
   -o, --out <PATH>  指定输出文件夹
   --no-dedent       禁用智能去缩进
   -f, --force       强制清空目标文件夹，跳过确认提示
+  --incremental     原地增量更新：只重写内容变化的文件，并删除本次未生成的文件
   -h, --help        显示帮助
 
 默认配置:
@@ -233,7 +323,7 @@ function printHelp() {
 }
 
 function parseArguments(argv) {
-    const result = {inputFile: GLOBAL_CONFIG.DEFAULT_INPUT_FILE, outputDir: GLOBAL_CONFIG.DEFAULT_OUTPUT_DIR, noDedent: false, force: false};
+    const result = {inputFile: GLOBAL_CONFIG.DEFAULT_INPUT_FILE, outputDir: GLOBAL_CONFIG.DEFAULT_OUTPUT_DIR, noDedent: false, force: false, incremental: false};
     let hasInput = false;
 
     for (let index = 0; index < argv.length; index += 1) {
@@ -242,6 +332,8 @@ function parseArguments(argv) {
             result.help = true;
         } else if (argument === "-f" || argument === "--force") {
             result.force = true;
+        } else if (argument === "--incremental") {
+            result.incremental = true;
         } else if (argument === "--no-dedent") {
             result.noDedent = true;
         } else if (argument === "-o" || argument === "--out") {
@@ -269,7 +361,7 @@ async function runCli() {
         return;
     }
 
-    if (existsSync(options.outputDir) && !options.force) {
+    if (existsSync(options.outputDir) && !options.force && !options.incremental) {
         const prompt = readline.createInterface({input: process.stdin, output: process.stdout});
         const answer = (await prompt.question(`\n[Warning] 目标文件夹已存在: ${options.outputDir}\n是否清空该目录并继续? [y/N]: `)).trim().toLowerCase();
         prompt.close();
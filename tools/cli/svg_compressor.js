@@ -1,8 +1,10 @@
 import {existsSync} from "node:fs";
-import {mkdir, readdir, readFile, rm, stat, writeFile} from "node:fs/promises";
+import {mkdir, open, readdir, readFile, rm, writeFile} from "node:fs/promises";
+import {availableParallelism, EOL} from "node:os";
 import path from "node:path";
 import process from "node:process";
 import {fileURLToPath} from "node:url";
+import {isMainThread, parentPort, Worker, workerData} from "node:worker_threads";
 import {optimize} from "../../assets/lib/svgo.browser.js";
 import {assertSafeOutputPaths, nativeNewlines, PROJECT_ROOT} from "../shared/filesystem.js";
 
@@ -13,7 +15,9 @@ export const CONFIG = Object.freeze({
     outputDir: path.join(PROJECT_ROOT, "tmp", "output-css"),
     tempDir: path.join(PROJECT_ROOT, "tmp", "output-svg"),
     outputCssName: "icons.css",
-    defaultHeight: "5dvmin"
+    defaultHeight: "5dvmin",
+    urlEncoded: false,
+    writeTempSvgs: true
 });
 
 const ANSI = Object.freeze({
@@ -30,44 +34,123 @@ function colorize(text, color, enabled) {
     return enabled ? `${color}${text}${ANSI.reset}` : text;
 }
 
+const BYTE_LABELS = ["B", "KB", "MB", "GB", "TB"];
+
+// 单位序号即满足 size > 1024^index 的最大 index，可由 log2 直接算出；除以 2 的幂是精确运算，结果与逐级除 1024 相同。
 function formatBytes(size) {
-    const labels = ["B", "KB", "MB", "GB", "TB"];
-    let value = size;
-    let index = 0;
-    while (value > 1024 && index < labels.length - 1) {
-        value /= 1024;
-        index += 1;
-    }
-    return `${value.toFixed(1)}${labels[index]}`;
+    const index = size > 1 ? Math.min(Math.max(Math.ceil(Math.log2(size) / 10) - 1, 0), BYTE_LABELS.length - 1) : 0;
+    return `${(size / 1024 ** index).toFixed(1)}${BYTE_LABELS[index]}`;
 }
 
+// 只需要去掉扩展名，path.basename 比构造完整的 path.parse 结果更轻。
 function sanitizeCssClassname(filename) {
-    let cleanName = path.parse(filename).name.replace(/[^a-zA-Z0-9_-]/gu, "_");
+    let cleanName = path.basename(filename, path.extname(filename)).replace(/[^a-zA-Z0-9_-]/gu, "_");
     if (/^\d/u.test(cleanName)) {
         cleanName = `_${cleanName}`;
     }
     return `._${cleanName}_`;
 }
 
+// URL 编码只转义在 data URI 或 CSS 字符串中有特殊含义的字符以及非 ASCII 字符，
+// 其余 SVG 文本原样保留，结果通常比 Base64 小约四分之一，浏览器也无需再做 Base64 解码。
+function encodeSvgDataUri(svg) {
+    return `"data:image/svg+xml;charset=utf-8,${svg.replace(/[%#<>"{}\\\r\n\t]|[^\x20-\x7e]/gu, encodeURIComponent)}"`;
+}
+
 function formatPath(targetPath) {
     return path.relative(process.cwd(), targetPath).replaceAll(path.sep, "/") || ".";
 }
 
+// svgo 只读取配置而不会修改它，所有文件（包括同一工作线程内的后续文件）共用同一份配置对象；
+// 逐层冻结以保证共享安全：若将来 svgo 试图改写配置会直接报错，而不是悄悄影响后续文件。
+const SVGO_OPTIONS = Object.freeze({
+    multipass: true,
+    js2svg: Object.freeze({pretty: false}),
+    plugins: Object.freeze([
+        Object.freeze({
+            name: "preset-default"
+        }),
+        "removeDimensions"
+    ])
+});
+
+// data-name 与 Illustrator 图层 id 合并为一个模式，源码只扫描一遍。
+// 引号内容用排除型字符类代替「.*? + 反向引用」，语义相同（不跨行、停在第一个同类引号），但无需回溯。
+const EDITOR_ATTRIBUTE_PATTERN = /\s+data-name=(?:"[^"\n\r\u2028\u2029]*"|'[^'\n\r\u2028\u2029]*')|\s+id=["']_图层_\d+["']/gu;
+const TEXT_ELEMENT_PATTERN = /<(text|tspan|textPath|flowRoot)\b/iu;
+
 export function optimizeSvg(source) {
-    const normalizedSource = source
-        .replace(/\s+data-name=(["']).*?\1/gu, "")
-        .replace(/\s+id=["']_图层_\d+["']/gu, "");
-
-    return optimize(normalizedSource, {
-        multipass: true,
-        js2svg: {pretty: false},
-        plugins: [
-            {
-                name: "preset-default"
-            },
-            "removeDimensions"
-        ]
-    }).data;
+    const normalizedSource = source.replace(EDITOR_ATTRIBUTE_PATTERN, "");
+
+    return optimize(normalizedSource, SVGO_OPTIONS).data;
+}
+
+// 文件只读取一次：原始体积直接取自读到的字节数，无需另行 stat；是否含文字也在同一份源码上判断。
+async function optimizeSvgFile(filePath) {
+    const bytes = await readFile(filePath);
+    const source = bytes.toString("utf8");
+    const optimizedSvg = optimizeSvg(source);
+    if (!optimizedSvg) {
+        throw new Error("优化结果为空");
+    }
+    return {originalSize: bytes.length, optimizedSvg, hasText: TEXT_ELEMENT_PATTERN.test(source)};
+}
+
+const SVG_WORKER_ROLE = "svg-optimizer";
+// 每个工作线程都要重新加载 svgo，文件太少时开线程得不偿失，至少分到这么多个文件才值得。
+const FILES_PER_WORKER = 4;
+
+// svgo 优化是纯 CPU 计算且各文件互不相关，分给多个工作线程并行处理；每个文件对应一个 Promise，
+// 调用方按原顺序逐个等待，日志顺序与串行处理一致。
+function startSvgWorkers(filePaths, workerCount) {
+    const settlers = [];
+    const results = filePaths.map(() => new Promise((resolve, reject) => settlers.push({resolve, reject})));
+    // 结果可能在调用方开始等待之前就已失败，预先挂上空处理避免被当作未处理的拒绝。
+    results.forEach((result) => result.catch(() => {
+    }));
+    const workers = [];
+    let nextIndex = 0;
+    let aliveCount = workerCount;
+
+    const rejectRemaining = (error) => {
+        for (; nextIndex < filePaths.length; nextIndex += 1) {
+            settlers[nextIndex].reject(error);
+        }
+    };
+
+    for (let count = 0; count < workerCount; count += 1) {
+        // 不继承父进程的命令行参数（如 --input-type、--test），它们对工作线程无意义甚至会导致启动失败。
+        const worker = new Worker(new URL(import.meta.url), {workerData: {role: SVG_WORKER_ROLE}, execArgv: []});
+        let taskIndex = -1;
+        const next = () => {
+            taskIndex = nextIndex;
+            nextIndex += 1;
+            if (taskIndex < filePaths.length) {
+                worker.postMessage(filePaths[taskIndex]);
+            } else {
+                worker.terminate();
+            }
+        };
+        worker.on("message", ({value, error}) => {
+            if (error === undefined) {
+                settlers[taskIndex].resolve(value);
+            } else {
+                settlers[taskIndex].reject(new Error(error));
+            }
+            next();
+        });
+        worker.on("error", (error) => {
+            settlers[taskIndex]?.reject(error);
+            aliveCount -= 1;
+            if (aliveCount === 0) {
+                rejectRemaining(error);
+            }
+        });
+        workers.push(worker);
+        next();
+    }
+
+    return {results, close: () => Promise.all(workers.map((worker) => worker.terminate()))};
 }
 
 export async function compressSvg({
@@ -76,8 +159,11 @@ export async function compressSvg({
                                       tempDir = CONFIG.tempDir,
                                       outputCssName = CONFIG.outputCssName,
                                       defaultHeight = CONFIG.defaultHeight,
+                                      urlEncoded = CONFIG.urlEncoded,
+                                      writeTempSvgs = CONFIG.writeTempSvgs,
                                       logger = console.log,
-                                      colors = process.stdout.isTTY
+                                      colors = process.stdout.isTTY,
+                                      maxWorkers = availableParallelism()
                                   } = {}) {
     const inputPath = path.resolve(inputDir);
     const [outputPath, tempPath] = assertSafeOutputPaths([outputDir, tempDir], {
@@ -94,10 +180,14 @@ export async function compressSvg({
     }
 
     await rm(outputPath, {recursive: true, force: true});
-    await rm(tempPath, {recursive: true, force: true});
     await mkdir(outputPath, {recursive: true});
-    await mkdir(tempPath, {recursive: true});
+    // 只需要 icons.css 时不输出优化后的单个 SVG，临时目录也保持原样不清理。
+    if (writeTempSvgs) {
+        await rm(tempPath, {recursive: true, force: true});
+        await mkdir(tempPath, {recursive: true});
+    }
 
+    // withFileTypes 直接返回目录项类型，筛选 SVG 文件时不需要逐个 stat。
     const inputFiles = (await readdir(inputPath, {withFileTypes: true}))
         .filter((entry) => entry.isFile() && path.extname(entry.name).toLowerCase() === ".svg")
         .map((entry) => entry.name);
@@ -114,52 +204,71 @@ export async function compressSvg({
     logger("-".repeat(60));
 
     const startTime = performance.now();
-    const cssRules = [];
+    // 逐文件输出的固定提示只在循环外着色一次；colors 为 false（非 TTY）时 colorize 原样返回文本。
+    const fontWarning = colorize("     [WARN] Font detected (<text>). Please convert to outlines.", ANSI.yellow, colors);
+    const outputFile = path.join(outputPath, outputCssName);
+    // 规则模板直接使用本机换行符拼接，无需再对含大段 data URI 的整条规则做换行替换。
+    const header = ["/* Generated by svg_compressor */", urlEncoded ? "/* Icons URL-encoded Data */" : "/* Icons Base64 Data */", "", ""].join(EOL);
+    // 每条规则生成后立即追加到 CSS 文件，不在内存中保留全部规则再拼成一个大字符串；
+    // 文件在第一条规则生成时才创建，没有任何有效 SVG 时与之前一样不会留下输出文件。
+    // 规则中除类名与 data URI 外的固定片段只依赖 defaultHeight，在循环外拼好，逐条规则只做一次连接。
+    const ruleMiddle = [" {", `    height: ${defaultHeight};`, "    content: url("].join(EOL);
+    const ruleEnd = [");", "}"].join(EOL);
+    const ruleSeparator = EOL + EOL;
+    let cssFile = null;
     let successCount = 0;
     let totalOriginalSize = 0;
     let totalOptimizedSize = 0;
 
-    for (const [index, filename] of inputFiles.entries()) {
-        const filePath = path.join(inputPath, filename);
-        const originalSize = (await stat(filePath)).size;
-        totalOriginalSize += originalSize;
+    const filePaths = inputFiles.map((filename) => path.join(inputPath, filename));
+    const workerCount = Math.min(maxWorkers, Math.floor(inputFiles.length / FILES_PER_WORKER));
+    const pool = workerCount > 1 ? startSvgWorkers(filePaths, workerCount) : null;
 
-        try {
-            const source = await readFile(filePath, "utf8");
-            const optimizedSvg = optimizeSvg(source);
-            if (!optimizedSvg) {
-                throw new Error("优化结果为空");
-            }
+    try {
+        for (const [index, filename] of inputFiles.entries()) {
+            let cssRule = null;
+            try {
+                const {originalSize, optimizedSvg, hasText} = await (pool ? pool.results[index] : optimizeSvgFile(filePaths[index]));
+                totalOriginalSize += originalSize;
+                // 同一份 UTF-8 编码既用于统计体积也用于 Base64，只编码一次。
+                const optimizedBytes = Buffer.from(optimizedSvg, "utf8");
+                const optimizedSize = optimizedBytes.length;
+                totalOptimizedSize += optimizedSize;
+                const savingsPercent = originalSize > 0 ? ((originalSize - optimizedSize) / originalSize) * 100 : 0;
+                logger(`${String(index + 1).padEnd(4)} DONE     ${filename.slice(0, 24).padEnd(25)} ${formatBytes(originalSize)} -> ${formatBytes(optimizedSize)} (v${savingsPercent.toFixed(0)}%)`);
 
-            const optimizedSize = Buffer.byteLength(optimizedSvg, "utf8");
-            totalOptimizedSize += optimizedSize;
-            const savingsPercent = originalSize > 0 ? ((originalSize - optimizedSize) / originalSize) * 100 : 0;
-            logger(`${String(index + 1).padEnd(4)} DONE     ${filename.slice(0, 24).padEnd(25)} ${formatBytes(originalSize)} -> ${formatBytes(optimizedSize)} (v${savingsPercent.toFixed(0)}%)`);
+                if (hasText) {
+                    logger(fontWarning);
+                }
 
-            if (/<(text|tspan|textPath|flowRoot)\b/iu.test(source)) {
-                logger(colorize("     [WARN] Font detected (<text>). Please convert to outlines.", ANSI.yellow, colors));
+                if (writeTempSvgs) {
+                    // 换行无需转换时直接写出已编码好的字节，不再重复 UTF-8 编码。
+                    const svgText = nativeNewlines(optimizedSvg);
+                    await writeFile(path.join(tempPath, filename), svgText === optimizedSvg ? optimizedBytes : svgText, "utf8");
+                }
+                const dataUri = urlEncoded ? encodeSvgDataUri(optimizedSvg) : `data:image/svg+xml;base64,${optimizedBytes.toString("base64")}`;
+                cssRule = sanitizeCssClassname(filename) + ruleMiddle + dataUri + ruleEnd;
+            } catch (error) {
+                logger(colorize(`${String(index + 1).padEnd(4)} FAIL     ${filename.slice(0, 24).padEnd(25)} ${error.message}`, ANSI.red, colors));
             }
 
-            await writeFile(path.join(tempPath, filename), nativeNewlines(optimizedSvg), "utf8");
-            const base64 = Buffer.from(optimizedSvg, "utf8").toString("base64");
-            cssRules.push(`${sanitizeCssClassname(filename)} {\n    height: ${defaultHeight};\n    content: url(data:image/svg+xml;base64,${base64});\n}`);
-            successCount += 1;
-        } catch (error) {
-            logger(colorize(`${String(index + 1).padEnd(4)} FAIL     ${filename.slice(0, 24).padEnd(25)} ${error.message}`, ANSI.red, colors));
+            if (cssRule !== null) {
+                cssFile ??= await open(outputFile, "w");
+                await cssFile.write(successCount === 0 ? header + cssRule : ruleSeparator + cssRule, null, "utf8");
+                successCount += 1;
+            }
         }
+    } finally {
+        await Promise.all([pool?.close(), cssFile?.close()]);
     }
 
     logger("-".repeat(60));
-    if (cssRules.length === 0) {
+    if (successCount === 0) {
         const error = new Error("No valid SVG content processed.");
         error.code = "NO_VALID_SVG";
         throw error;
     }
 
-    const outputFile = path.join(outputPath, outputCssName);
-    const header = "/* Generated by svg_compressor */\n/* Icons Base64 Data */\n\n";
-    await writeFile(outputFile, nativeNewlines(header + cssRules.join("\n\n")), "utf8");
-
     const duration = (performance.now() - startTime) / 1000;
     const totalSaved = totalOriginalSize - totalOptimizedSize;
     const totalSavedPercent = totalOriginalSize > 0 ? (totalSaved / totalOriginalSize) * 100 : 0;
@@ -170,7 +279,7 @@ export async function compressSvg({
     logger(`Total Size      : ${formatBytes(totalOriginalSize)} -> ${formatBytes(totalOptimizedSize)}`);
     logger(`Saved           : ${formatBytes(totalSaved)} (-${totalSavedPercent.toFixed(1)}%)`);
     logger(`Output          : ${formatPath(outputFile)}`);
-    logger(`Temp Dir        : ${formatPath(tempPath)}`);
+    logger(`Temp Dir        : ${writeTempSvgs ? formatPath(tempPath) : "skipped"}`);
 
     return {
         inputPath,
@@ -194,11 +303,14 @@ function printHelp() {
   -i, --input <PATH>  指定输入文件夹路径
   --output <PATH>     指定 CSS 输出文件夹
   --temp <PATH>       指定优化后 SVG 输出文件夹
+  --workers <N>       最多使用的工作线程数（默认：CPU 核心数；为 1 时串行处理）
+  --url-encoded       以 URL 编码而非 Base64 内嵌 SVG，CSS 体积更小
+  --no-temp-svgs      只生成 icons.css，不输出优化后的单个 SVG 文件
   -h, --help          显示帮助`);
 }
 
 function parseArguments(argv) {
-    const result = {inputDir: CONFIG.inputDir, outputDir: CONFIG.outputDir, tempDir: CONFIG.tempDir};
+    const result = {inputDir: CONFIG.inputDir, outputDir: CONFIG.outputDir, tempDir: CONFIG.tempDir, urlEncoded: CONFIG.urlEncoded, writeTempSvgs: CONFIG.writeTempSvgs, maxWorkers: availableParallelism()};
     for (let index = 0; index < argv.length; index += 1) {
         const argument = argv[index];
         if (argument === "-h" || argument === "--help") {
@@ -218,6 +330,17 @@ function parseArguments(argv) {
             if (argument === "--temp") {
                 result.tempDir = path.resolve(value);
             }
+        } else if (argument === "--no-temp-svgs") {
+            result.writeTempSvgs = false;
+        } else if (argument === "--url-encoded") {
+            result.urlEncoded = true;
+        } else if (argument === "--workers") {
+            const value = Number.parseInt(argv[index + 1], 10);
+            if (!Number.isInteger(value) || value < 1) {
+                throw new Error("--workers 必须是正整数。");
+            }
+            index += 1;
+            result.maxWorkers = value;
         } else {
             throw new Error(`未知参数: ${argument}`);
         }
@@ -234,7 +357,15 @@ async function runCli() {
     await compressSvg(options);
 }
 
-if (process.argv[1] && path.resolve(process.argv[1]) === fileURLToPath(import.meta.url)) {
+if (!isMainThread && workerData?.role === SVG_WORKER_ROLE) {
+    parentPort.on("message", async (filePath) => {
+        try {
+            parentPort.postMessage({value: await optimizeSvgFile(filePath)});
+        } catch (error) {
+            parentPort.postMessage({error: error.message});
+        }
+    });
+} else if (process.argv[1] && path.resolve(process.argv[1]) === fileURLToPath(import.meta.url)) {
     runCli().catch((error) => {
         console.error(`[ERROR] ${error.message}`);
         if (error.code === "INPUT_CREATED") {
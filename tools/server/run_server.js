@@ -35,12 +35,16 @@ const MIME_TYPES = new Map([
     [".txt", "text/plain; charset=utf-8"]
 ]);
 
+const COMMON_HEADERS = new Map([
+    ["Cache-Control", "no-cache, no-store, must-revalidate"],
+    ["Pragma", "no-cache"],
+    ["Expires", "0"],
+    ["X-Content-Type-Options", "nosniff"],
+    ["Referrer-Policy", "same-origin"]
+]);
+
 function setCommonHeaders(response) {
-    response.setHeader("Cache-Control", "no-cache, no-store, must-revalidate");
-    response.setHeader("Pragma", "no-cache");
-    response.setHeader("Expires", "0");
-    response.setHeader("X-Content-Type-Options", "nosniff");
-    response.setHeader("Referrer-Policy", "same-origin");
+    response.setHeaders(COMMON_HEADERS);
 }
 
 function sendJson(response, statusCode, body) {
@@ -117,6 +121,17 @@ async function readJson(request) {
     }
 }
 
+// 工具任务会清空并重写输出目录，并发执行会互相覆盖且同时占满磁盘 I/O；
+// 统一排入一条队列串行执行，静态文件请求不受影响。这里只把并发数限制为 1，
+// 不限制排队任务的数量：工具接口只服务于本机开发，并且已经拒绝跨源请求。
+let toolQueue = Promise.resolve();
+
+function runToolTask(task) {
+    const result = toolQueue.then(task);
+    toolQueue = result.catch(() => {});
+    return result;
+}
+
 async function handleToolApi(request, response, pathname) {
     if (request.method === "GET" && pathname === "/api/tools/status") {
         sendJson(response, 200, {ok: true});
@@ -143,7 +158,7 @@ async function handleToolApi(request, response, pathname) {
     try {
         const body = await readJson(request);
         if (pathname === "/api/tools/reverse-build") {
-            const result = await reverseBuild({
+            const result = await runToolTask(() => reverseBuild({
                 inputFile: resolveProjectPath(body.inputFile, REVERSE_CONFIG.DEFAULT_INPUT_FILE),
                 outputDir: resolveWebToolPath(
                     body.outputDir,
@@ -153,20 +168,23 @@ async function handleToolApi(request, response, pathname) {
                 ),
                 noDedent: Boolean(body.noDedent),
                 force: Boolean(body.force),
+                incremental: Boolean(body.incremental),
                 logger
-            });
+            }));
             sendJson(response, 200, {ok: true, result, logs});
             return true;
         }
 
         if (pathname === "/api/tools/svg-compressor") {
-            const result = await compressSvg({
+            const result = await runToolTask(() => compressSvg({
                 inputDir: resolveWebToolPath(body.inputDir, SVG_CONFIG.inputDir, [tmpDirectory], "Web SVG 工具路径必须位于 tmp 目录内。"),
                 outputDir: resolveWebToolPath(body.outputDir, SVG_CONFIG.outputDir, [tmpDirectory], "Web SVG 工具路径必须位于 tmp 目录内。"),
                 tempDir: resolveWebToolPath(body.tempDir, SVG_CONFIG.tempDir, [tmpDirectory], "Web SVG 工具路径必须位于 tmp 目录内。"),
+                urlEncoded: Boolean(body.urlEncoded),
+                writeTempSvgs: body.writeTempSvgs !== false,
                 logger,
                 colors: false
-            });
+            }));
             sendJson(response, 200, {ok: true, result, logs});
             return true;
         }
@@ -179,14 +197,22 @@ async function handleToolApi(request, response, pathname) {
     }
 }
 
+async function statOrNull(filePath) {
+    try {
+        return await stat(filePath);
+    } catch {
+        return null;
+    }
+}
+
 async function serveStatic(request, response, rootDirectory, pathname) {
     let filePath = resolveInside(rootDirectory, decodeURIComponent(pathname));
-    if (!filePath || !existsSync(filePath)) {
+    let fileStat = filePath ? await statOrNull(filePath) : null;
+    if (!fileStat) {
         sendText(response, 404, "404 - File not found");
         return;
     }
 
-    const fileStat = await stat(filePath);
     if (fileStat.isDirectory()) {
         if (!pathname.endsWith("/")) {
             response.statusCode = 301;
@@ -194,24 +220,25 @@ async function serveStatic(request, response, rootDirectory, pathname) {
             response.end();
             return;
         }
-        const indexPath = path.join(filePath, "index.html");
-        if (existsSync(indexPath)) {
-            filePath = indexPath;
-        } else {
+        filePath = path.join(filePath, "index.html");
+        fileStat = await statOrNull(filePath);
+        if (!fileStat) {
             sendText(response, 403, "403 - Forbidden");
             return;
         }
     }
 
-    const finalStat = await stat(filePath);
     response.statusCode = 200;
     response.setHeader("Content-Type", MIME_TYPES.get(path.extname(filePath).toLowerCase()) || "application/octet-stream");
-    response.setHeader("Content-Length", finalStat.size);
+    response.setHeader("Content-Length", fileStat.size);
     if (request.method === "HEAD") {
         response.end();
         return;
     }
-    createReadStream(filePath).on("error", () => {
+    // 客户端提前断开时 pipe 只会解除连接，需同时关闭文件流，避免文件句柄一直挂到垃圾回收。
+    const fileStream = createReadStream(filePath);
+    response.once("close", () => fileStream.destroy());
+    fileStream.on("error", () => {
         if (!response.headersSent) {
             sendText(response, 500, "500 - Read error");
         } else {
@@ -254,27 +281,33 @@ export function createRequestHandler(rootDirectory, logger = console.log) {
 
 function listen(server, port, host) {
     return new Promise((resolve, reject) => {
-        const onError = (error) => reject(error);
-        server.once("error", onError);
-        server.listen(port, host, () => {
+        // 同一个实例会在多个端口上重试，失败时必须同时移除本次注册的 listening 回调，否则回调会逐次累积。
+        const onListening = () => {
             server.off("error", onError);
             resolve();
-        });
+        };
+        const onError = (error) => {
+            server.off("listening", onListening);
+            reject(error);
+        };
+        server.once("error", onError);
+        server.once("listening", onListening);
+        server.listen(port, host);
     });
 }
 
 export async function createServer(targetDirectory, startPort, bindAll, logger = console.log) {
     const host = bindAll ? "0.0.0.0" : "127.0.0.1";
+    // 端口被占用时 listen 失败不会使服务器对象失效，同一个实例换端口重试即可，无需每次重建。
+    // 端口为 0 时由系统直接分配空闲端口，第一次就会成功。
+    const server = http.createServer(createRequestHandler(targetDirectory, logger));
     for (let offset = 0; offset < SERVER_CONFIG.MAX_PORT_RETRIES; offset += 1) {
-        const port = startPort + offset;
-        const server = http.createServer(createRequestHandler(targetDirectory, logger));
         try {
-            await listen(server, port, host);
-            const actualPort = server.address().port;
-            return {server, port: actualPort, host};
+            await listen(server, startPort + offset, host);
+            return {server, port: server.address().port, host};
         } catch (error) {
-            server.close();
             if (error.code !== "EADDRINUSE" && error.code !== "EACCES") {
+                server.close();
                 throw error;
             }
         }
@@ -316,7 +349,7 @@ function printHelp() {
 
 选项:
   --dir <PATH>   指定服务目录（默认：项目根目录）
-  --port <PORT>  指定起始端口（默认：8000）
+  --port <PORT>  指定起始端口（默认：8000；为 0 时由系统分配空闲端口）
   --lan          监听 0.0.0.0，允许局域网访问静态页面
   --local        仅监听 127.0.0.1（默认）
   --no-open      启动后不自动打开浏览器
@@ -368,19 +401,17 @@ async function runCli() {
 
     const {server, port} = await createServer(options.directory, options.port, options.lan);
     const localhostUrl = `http://localhost:${port}`;
-    console.log("=".repeat(60));
-    console.log("服务器已启动");
-    console.log(`根目录: ${options.directory}`);
-    console.log("-".repeat(60));
-    console.log(`本机访问: ${localhostUrl}`);
-    if (options.lan) {
-        console.log(`局域网访问: http://${getLocalIp()}:${port}`);
-    } else {
-        console.log("局域网访问: 未开启（需要时使用 --lan）");
-    }
-    console.log("-".repeat(60));
-    console.log("提示: 修改文件后刷新即生效。按 Ctrl+C 停止。");
-    console.log("=".repeat(60));
+    console.log([
+        "=".repeat(60),
+        "服务器已启动",
+        `根目录: ${options.directory}`,
+        "-".repeat(60),
+        `本机访问: ${localhostUrl}`,
+        options.lan ? `局域网访问: http://${getLocalIp()}:${port}` : "局域网访问: 未开启（需要时使用 --lan）",
+        "-".repeat(60),
+        "提示: 修改文件后刷新即生效。按 Ctrl+C 停止。",
+        "=".repeat(60)
+    ].join("\n"));
 
     if (options.open) {
         setTimeout(() => openBrowser(localhostUrl), 500);
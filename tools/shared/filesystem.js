@@ -5,7 +5,8 @@ import {fileURLToPath} from "node:url";
 export const PROJECT_ROOT = path.resolve(fileURLToPath(new URL("../..", import.meta.url)));
 
 export function nativeNewlines(content) {
-    return content.replace(/\r\n?|\n/gu, EOL);
+    // 换行符本就是 LF 的平台只需改写 CR/CRLF，无需把多 MB 内容中的每个 LF 原样替换一遍。
+    return EOL === "\n" ? content.replace(/\r\n?/gu, "\n") : content.replace(/\r\n?|\n/gu, EOL);
 }
 
 export function isSameOrAncestor(candidate, target) {